@@ -6,6 +6,7 @@ import argparse
 import sys
 from pathlib import Path
 
+from src.api.TMDB import TMDBClient
 from src.services.movie_service import MovieService
 from src.services.movie_recommendation_engine import MovieRecommendationEngine
 from src.utils.logger import get_logger
@@ -71,6 +72,13 @@ def main():
             "hybrid (best quality, slowest)"
         ),
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_false",
+        dest="cache",
+        default=None,
+        help="Disable the on-disk cache of TMDB movie details, keywords and credits",
+    )
 
     args = parser.parse_args()
 
@@ -91,8 +99,9 @@ def main():
             else:
                 output_filename = f"{args.output}_{args.year}.csv"
         
-        # Initialize service
-        movie_service = MovieService()
+        # Initialize a shared API client and the service
+        tmdb_client = TMDBClient(use_cache=args.cache)
+        movie_service = MovieService(tmdb_client=tmdb_client)
 
         # Get and export top movies
         movies, csv_path = movie_service.get_and_export_top_movies(
@@ -115,7 +124,7 @@ def main():
             logger.info(f"Using recommendation strategy: {args.strategy}")
 
             # Initialize recommendation engine
-            recommendation_engine = MovieRecommendationEngine()
+            recommendation_engine = MovieRecommendationEngine(tmdb_client=tmdb_client)
 
             # Find similar movies using the recommendation engine
             recommendations_data = recommendation_engine.find_similar_movies_for_each(
@@ -125,18 +134,18 @@ def main():
             )
 
             if recommendations_data:
-                # Flatten for export
-                flattened: list[dict] = []
-                for entry in recommendations_data:
-                    original = entry.get("original_movie")
-                    for sim in entry.get("similar_movies", []):
-                        flattened.append({
-                            "original_movie": original,
-                            "similar_movie": sim.get("similar_movie"),
-                            "similarity_score": sim.get("similarity_score"),
-                            "similarity_reason": sim.get("similarity_reason"),
-                            "similarity_metrics": sim.get("similarity_metrics", {}),
-                        })
+                # Flatten for export (streamed into the CSV writer)
+                flattened = (
+                    {
+                        "original_movie": entry.get("original_movie"),
+                        "similar_movie": sim.get("similar_movie"),
+                        "similarity_score": sim.get("similarity_score"),
+                        "similarity_reason": sim.get("similarity_reason"),
+                        "similarity_metrics": sim.get("similarity_metrics", {}),
+                    }
+                    for entry in recommendations_data
+                    for sim in entry.get("similar_movies", [])
+                )
 
                 # Export similar movies with year in filename
                 from src.services.export_service import ExportService
@@ -147,7 +156,7 @@ def main():
                     filename=similar_filename,
                 )
 
-                total_similar = sum(len(item.get("similar_movies", [])) for item in recommendations_data)
+                total_similar = sum(len(entry.get("similar_movies", [])) for entry in recommendations_data)
                 print(f"\nSuccess! Exported {total_similar} similar movies to: {similar_csv_path}")
                 print(f"   Strategy used: {args.strategy}")
                 print(f"   API calls made: {recommendation_engine.api_calls_made}")
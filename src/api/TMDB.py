@@ -4,12 +4,22 @@ This module only handles API communication and data retrieval.
 """
 
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from src.api.rate_limiter import RateLimiter, get_rate_limiter
+from src.utils.concurrency import get_worker_count
 from src.utils.config import get_config
 from src.utils.logger import get_logger
+from src.utils.tmdb_cache import DEFAULT_CACHE_DIR, TMDBCache, get_tmdb_cache
 
 
 class TMDBClient:
@@ -18,12 +28,14 @@ class TMDBClient:
     This class only handles API calls and returns raw or minimally processed data.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_cache: Optional[bool] = None):
         """
         Initialize TMDB API client.
 
         Args:
             api_key: TMDB API key. If not provided, will be loaded from config.
+            use_cache: Cache stable responses (details, keywords, credits) on disk.
+                If not provided, uses api.cache_enabled from config.
         """
         self.config = get_config()
         self.logger = get_logger("tmdb_client")
@@ -36,15 +48,58 @@ class TMDBClient:
         self.retry_delay = self.config.get("api.retry_delay", 1)
         self.language = self.config.get("data.language", "en-US")
         self.region = self.config.get("data.region", "US")
+
+        # Shared request budget (replaces fixed sleeps between calls)
+        self.rate_limiter: RateLimiter = get_rate_limiter(
+            self.config.rate_limit_requests, self.config.rate_limit_period
+        )
+
+        # Persistent cache for stable per-movie endpoints
+        if use_cache is None:
+            use_cache = self.config.get("api.cache_enabled", True) and self.config.cache_enabled
+        self.cache: Optional[TMDBCache] = None
+        if use_cache:
+            self.cache = get_tmdb_cache(
+                self.config.get("api.cache_dir", DEFAULT_CACHE_DIR),
+                ttl=self.config.get("api.cache_ttl", 3600),
+            )
         
-        # Setup session
+        # Setup session; keep-alive connections are reused across calls, with
+        # enough pooled connections for every concurrent worker thread
         self.session = requests.Session()
+        pool_size = max(10, get_worker_count())
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "Content-Type": "application/json;charset=utf-8"
         })
         
         self.logger.info("TMDB client initialized")
 
+    def close(self) -> None:
+        """Close the HTTP session and its pooled keep-alive connections."""
+        self.session.close()
+
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Any:
+        """
+        Decode a JSON response body, using orjson when it is installed.
+
+        Args:
+            response: HTTP response with a JSON body
+
+        Returns:
+            Decoded JSON data
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # Let requests raise its own (retryable) decode error
+                pass
+        return response.json()
+
     def _make_request(
         self,
         endpoint: str,
@@ -75,6 +130,7 @@ class TMDBClient:
         
         for attempt in range(self.max_retries):
             try:
+                self.rate_limiter.acquire()
                 self.logger.debug(f"Making {method} request to {url} with params: {params}")
                 response = self.session.request(
                     method=method,
@@ -84,7 +140,7 @@ class TMDBClient:
                 )
                 response.raise_for_status()
                 
-                data = response.json()
+                data = self._decode_json(response)
                 self.logger.debug(f"Successfully received response from {endpoint}")
                 return data
                 
@@ -100,6 +156,38 @@ class TMDBClient:
         
         return None
 
+    def _make_cached_request(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make a request to a stable endpoint, serving it from the response cache if possible.
+
+        Only successful responses are cached. Callers get a fresh copy on every
+        cache hit, so mutating the returned dictionary is safe.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Query parameters (part of the cache key)
+
+        Returns:
+            JSON response data or None if request failed
+        """
+        if self.cache is None:
+            return self._make_request(endpoint, params)
+
+        key = f"{self.language}:{endpoint}"
+        if params:
+            key += f"?{urlencode(sorted(params.items()))}"
+        data = self.cache.get(key)
+        if data is not None:
+            self.logger.debug(f"Cache hit for {endpoint}")
+            return data
+
+        data = self._make_request(endpoint, params)
+        if data is not None:
+            self.cache.set(key, data)
+        return data
+
     def get_movies_by_year(
         self,
         year: int,
@@ -216,18 +304,25 @@ class TMDBClient:
         return data
 
 
-    def get_movie_details(self, movie_id: int) -> Optional[Dict[str, Any]]:
+    def get_movie_details(
+        self, movie_id: int, append: Sequence[str] = ()
+    ) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a movie.
 
         Args:
             movie_id: TMDB movie ID
+            append: Sub-resources to include in the same request via
+                append_to_response (e.g. ("keywords", "credits")). Each appears
+                in the response under its own key with the same shape as its
+                standalone endpoint.
 
         Returns:
             Movie details dictionary or None if not found
         """
         self.logger.debug(f"Retrieving details for movie ID {movie_id}")
-        data = self._make_request(f"movie/{movie_id}")
+        params = {"append_to_response": ",".join(append)} if append else None
+        data = self._make_cached_request(f"movie/{movie_id}", params)
         return data
 
     def get_movie_keywords(self, movie_id: int) -> Optional[Dict[str, Any]]:
@@ -241,7 +336,7 @@ class TMDBClient:
             Keywords response dictionary or None if not found
         """
         self.logger.debug(f"Retrieving keywords for movie ID {movie_id}")
-        data = self._make_request(f"movie/{movie_id}/keywords")
+        data = self._make_cached_request(f"movie/{movie_id}/keywords")
         return data
 
     def get_similar_movies(
@@ -293,7 +388,7 @@ class TMDBClient:
             Credits response dictionary or None if not found
         """
         self.logger.debug(f"Retrieving credits for movie ID {movie_id}")
-        data = self._make_request(f"movie/{movie_id}/credits")
+        data = self._make_cached_request(f"movie/{movie_id}/credits")
         return data
 
     def get_movie_reviews(self, movie_id: int, page: int = 1) -> Optional[Dict[str, Any]]:
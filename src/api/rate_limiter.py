@@ -0,0 +1,81 @@
+"""
+Thread-safe token bucket rate limiter for TMDB API requests.
+"""
+
+import threading
+import time
+from typing import Dict, Tuple
+
+
+class RateLimiter:
+    """
+    Token bucket allowing bursts of up to ``max_requests`` and a sustained rate
+    of ``max_requests`` per ``period`` seconds.
+
+    Unlike a fixed sleep after every request, callers only wait when the
+    request budget is actually exhausted.
+    """
+
+    def __init__(self, max_requests: int, period: float):
+        """
+        Initialize the rate limiter with a full bucket.
+
+        Args:
+            max_requests: Maximum number of requests per period (bucket capacity)
+            period: Period length in seconds
+        """
+        if max_requests <= 0 or period <= 0:
+            raise ValueError("max_requests and period must be positive")
+
+        self.capacity = float(max_requests)
+        self.fill_rate = max_requests / period
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill (must hold the lock)."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.fill_rate)
+
+    def acquire(self) -> None:
+        """Take one token, blocking until one is available."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.fill_rate
+
+            # Sleep outside the lock so other threads can refill and check too
+            time.sleep(wait)
+
+
+_limiters: Dict[Tuple[int, float], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(max_requests: int, period: float) -> RateLimiter:
+    """
+    Get the process-wide rate limiter for a request budget.
+
+    TMDB limits requests per API key, so all clients in the process share
+    one bucket.
+
+    Args:
+        max_requests: Maximum number of requests per period
+        period: Period length in seconds
+
+    Returns:
+        Shared RateLimiter instance
+    """
+    key = (max_requests, float(period))
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(max_requests, period)
+            _limiters[key] = limiter
+        return limiter
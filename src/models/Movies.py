@@ -7,11 +7,97 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Mapping, Optional, Set, TypedDict, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, TypedDict, TypeVar, Union
 
 from pydantic import BaseModel, Field, field_validator
 
 
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=4096)
+def director_hash(name: Optional[str]) -> Optional[int]:
+    """
+    Hash a director name for case-insensitive equality checks.
+
+    The name is case-folded and stripped once, so comparing two directors
+    becomes a single integer comparison instead of normalizing and comparing
+    both strings every time.
+
+    Args:
+        name: Director name
+
+    Returns:
+        Integer hash of the normalized name, or None if no name is given
+    """
+    if not name:
+        return None
+    normalized = name.casefold().strip()
+    if not normalized:
+        return None
+    return hash(normalized)
+
+
+def director_from_credits(credits_data: Any) -> Optional[str]:
+    """
+    Extract the director name from a TMDB credits response.
+
+    Args:
+        credits_data: Response from /movie/{id}/credits (or the appended "credits" section)
+
+    Returns:
+        Name of the first crew member with job "Director", or None if not found
+    """
+    if not isinstance(credits_data, Mapping) or "crew" not in credits_data:
+        return None
+    for person in credits_data.get("crew") or []:
+        if isinstance(person, Mapping) and person.get("job") == "Director":
+            return person.get("name")
+    return None
+
+
+# Comprehensive list of articles, prepositions, and conjunctions to ignore
+# Common English articles: a, an, the
+# Common prepositions: in, on, at, for, with, by, from, to, of
+# Common conjunctions: and, or, but
+# Pattern matches these words at the start of the title (case-insensitive)
+# followed by whitespace and the rest of the title
+_ARTICLES_PATTERN = re.compile(
+    r"^(the|a|an|in|on|at|for|with|by|from|to|of|and|or|but)\s+(.+)$", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def normalize_title_for_sorting(title: str, ignore_articles: bool = False) -> str:
+    """
+    Normalize a movie title for sorting purposes.
+
+    Args:
+        title: Movie title
+        ignore_articles: If True, ignore articles and common words at the beginning.
+            Removes: the, a, an, in, on, at, for, with, by, from, to, of, and, or, but
+
+    Returns:
+        Normalized title with articles removed (if ignore_articles=True)
+    """
+    title = title.strip()
+    if ignore_articles:
+        # Remove articles iteratively until no more articles are found at the start
+        # This handles cases like "The A-Team" or "A The Movie"
+        # Limit to 5 iterations to avoid infinite loops with edge cases
+        max_iterations = 5
+        iteration = 0
+        while iteration < max_iterations:
+            match = _ARTICLES_PATTERN.match(title)
+            if match:
+                title = match.group(2).strip()
+                iteration += 1
+            else:
+                break
+    return title
+
+
 # TypedDict definitions for nested structures
 class ProductionCompanyDict(TypedDict, total=False):
     """Type definition for production company data."""
@@ -242,6 +328,16 @@ class Movie(BaseModel):
         base_url = "https://image.tmdb.org/t/p/original"
         return f"{base_url}{self.backdrop_path}"
 
+    @property
+    def director_hash(self) -> Optional[int]:
+        """
+        Get hash of the normalized director name.
+
+        Returns:
+            Integer hash for director equality checks or None if no director
+        """
+        return director_hash(self.director)
+
     @property
     def genre_names(self) -> List[str]:
         """
@@ -266,6 +362,81 @@ class Movie(BaseModel):
             return [keyword.name for keyword in self.keywords]
         return []
 
+    def _cached_feature(self, name: str, source: Any, build: Callable[[], T]) -> T:
+        """
+        Return a derived feature, rebuilding it only when its source field was replaced.
+
+        Features live in the instance ``__dict__`` next to the field values (like
+        ``functools.cached_property``), which keeps them out of serialization and
+        equality checks.
+
+        Args:
+            name: Feature name
+            source: Field value the feature is derived from
+            build: Function computing the feature
+
+        Returns:
+            Cached or freshly built feature value
+        """
+        feature_cache: Dict[str, Tuple[Any, Any]] = self.__dict__.setdefault("_feature_cache", {})
+        cached = feature_cache.get(name)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        value = build()
+        feature_cache[name] = (source, value)
+        return value
+
+    @property
+    def genre_set(self) -> FrozenSet[str]:
+        """
+        Get set of genre names, computed once per genres value.
+
+        Returns:
+            Frozen set of genre names
+        """
+        return self._cached_feature("genre_set", self.genres, lambda: frozenset(self.genre_names))
+
+    @property
+    def keyword_set(self) -> FrozenSet[str]:
+        """
+        Get set of keyword names, computed once per keywords value.
+
+        Returns:
+            Frozen set of keyword names
+        """
+        return self._cached_feature("keyword_set", self.keywords, lambda: frozenset(self.keyword_names))
+
+    @property
+    def production_company_set(self) -> FrozenSet[int]:
+        """
+        Get set of production company IDs, computed once per production_companies value.
+
+        Returns:
+            Frozen set of production company IDs
+        """
+        return self._cached_feature(
+            "production_company_set",
+            self.production_companies,
+            lambda: frozenset(self.production_company_ids),
+        )
+
+    @property
+    def production_company_name_map(self) -> Dict[int, str]:
+        """
+        Get mapping of production company ID to name, computed once per production_companies value.
+
+        Returns:
+            Dictionary of production company ID to non-empty name
+        """
+        def build() -> Dict[int, str]:
+            return {
+                company.get("id"): company.get("name", "")
+                for company in self.production_companies or []
+                if isinstance(company, dict) and company.get("id") and company.get("name")
+            }
+
+        return self._cached_feature("production_company_name_map", self.production_companies, build)
+
     @property
     def production_company_names(self) -> List[str]:
         """
@@ -309,31 +480,25 @@ class Movie(BaseModel):
         Returns:
             Normalized title with articles removed (if ignore_articles=True)
         """
-        title = self.title.strip()
-        if ignore_articles:
-            # Comprehensive list of articles, prepositions, and conjunctions to ignore
-            # Common English articles: a, an, the
-            # Common prepositions: in, on, at, for, with, by, from, to, of
-            # Common conjunctions: and, or, but
-            # Pattern matches these words at the start of the title (case-insensitive)
-            # followed by whitespace and the rest of the title
-            articles_pattern = r"^(the|a|an|in|on|at|for|with|by|from|to|of|and|or|but)\s+(.+)$"
-            
-            # Remove articles iteratively until no more articles are found at the start
-            # This handles cases like "The A-Team" or "A The Movie"
-            # Limit to 5 iterations to avoid infinite loops with edge cases
-            max_iterations = 5
-            iteration = 0
-            while iteration < max_iterations:
-                match = re.match(articles_pattern, title, re.IGNORECASE)
-                if match:
-                    title = match.group(2).strip()
-                    iteration += 1
-                else:
-                    break
-            
-            return title
-        return title
+        return normalize_title_for_sorting(self.title, ignore_articles=ignore_articles)
+
+    def sort_key(self, ignore_articles: bool = False) -> str:
+        """
+        Get the case-insensitive key used to sort movies by name.
+
+        The key is computed once per title value and reused by later sorts.
+
+        Args:
+            ignore_articles: If True, ignore articles and common words at the beginning
+
+        Returns:
+            Lowercased normalized title
+        """
+        return self._cached_feature(
+            "sort_key_no_articles" if ignore_articles else "sort_key",
+            self.title,
+            lambda: self.normalize_title_for_sorting(ignore_articles=ignore_articles).lower(),
+        )
 
     class Config:
         """Pydantic configuration."""
@@ -447,9 +612,13 @@ def movie_from_tmdb_response(data: Union[Dict[str, Any], Mapping[str, Any]]) ->
         collection_name = collection_data.get("name")
     movie_data.pop("belongs_to_collection", None)
 
-    # Handle director (from credits - will be set during enrichment)
-    # Director is not in the main movie response, so it's None here
-    movie_data.pop("director", None)
+    # Handle director (from credits - set by callers during enrichment)
+    # Director is not in the main movie response, so it's usually None here
+    director: Any = movie_data.pop("director", None)
+    # Credits appended via append_to_response=credits carry the director as well
+    credits_data: Any = movie_data.pop("credits", None)
+    if not director:
+        director = director_from_credits(credits_data)
     movie_data.pop("collection_id", None)
     movie_data.pop("collection_name", None)
 
@@ -462,10 +631,45 @@ def movie_from_tmdb_response(data: Union[Dict[str, Any], Mapping[str, Any]]) ->
         movie_data["collection_id"] = collection_id
     if collection_name:
         movie_data["collection_name"] = collection_name
+    if isinstance(director, str) and director:
+        movie_data["director"] = director
 
     return Movie(**movie_data)
 
 
+def _validate_movie(movie_data: Any, logger: Any) -> Optional[Movie]:
+    """
+    Validate and convert a single movie dictionary to a Movie model.
+
+    Args:
+        movie_data: Movie dictionary or mapping
+        logger: Logger used to report invalid entries
+
+    Returns:
+        Validated Movie model, or None if the entry is invalid
+    """
+    try:
+        if not isinstance(movie_data, (dict, Mapping)):
+            logger.warning(
+                f"Skipping invalid movie data type: {type(movie_data)}. Expected dict or Mapping."
+            )
+            return None
+
+        return movie_from_tmdb_response(movie_data)
+    except (ValueError, TypeError) as e:
+        # Log error but continue processing other movies
+        movie_id: Union[int, str] = "unknown"
+        if isinstance(movie_data, (dict, Mapping)):
+            movie_id_raw: Any = movie_data.get("id", "unknown")
+            movie_id = movie_id_raw if isinstance(movie_id_raw, (int, str)) else "unknown"
+        logger.warning(f"Failed to validate movie {movie_id}: {e}")
+        return None
+    except Exception as e:
+        # Catch any other unexpected errors
+        logger.error(f"Unexpected error validating movie: {e}", exc_info=True)
+        return None
+
+
 def validate_movie_list(movies: List[Mapping[str, Any]]) -> List[Movie]:
     """
     Validate and convert a list of movie dictionaries to Movie models.
@@ -488,29 +692,50 @@ def validate_movie_list(movies: List[Mapping[str, Any]]) -> List[Movie]:
     validated_movies: List[Movie] = []
 
     for movie_data in movies:
-        try:
-            if not isinstance(movie_data, (dict, Mapping)):
-                logger.warning(
-                    f"Skipping invalid movie data type: {type(movie_data)}. Expected dict or Mapping."
-                )
-                continue
-
-            movie: Movie = movie_from_tmdb_response(movie_data)
+        movie = _validate_movie(movie_data, logger)
+        if movie is not None:
             validated_movies.append(movie)
-        except (ValueError, TypeError) as e:
-            # Log error but continue processing other movies
-            movie_id: Union[int, str] = "unknown"
-            if isinstance(movie_data, (dict, Mapping)):
-                movie_id_raw: Any = movie_data.get("id", "unknown")
-                movie_id = movie_id_raw if isinstance(movie_id_raw, (int, str)) else "unknown"
-            logger.warning(f"Failed to validate movie {movie_id}: {e}")
+
+    return validated_movies
+
+
+def iter_unique_movies(
+    movies: Iterable[Mapping[str, Any]],
+    exclude_id: Optional[int] = None,
+    seen: Optional[Set[int]] = None,
+) -> Iterator[Movie]:
+    """
+    Validate movie dictionaries in a single pass, skipping duplicates and an excluded ID.
+
+    Combines validate_movie_list, remove_duplicate_movies and target exclusion so
+    raw API results are only walked once and duplicates are never validated.
+
+    Args:
+        movies: Iterable of movie dictionaries or mappings
+        exclude_id: Movie ID to skip (e.g. the target movie)
+        seen: Set of already-yielded movie IDs; updated in place so callers can
+            share it across several sources
+
+    Yields:
+        Validated, unique Movie models in original order (first occurrence preserved)
+    """
+    from src.utils.logger import get_logger
+
+    logger = get_logger("movie_models")
+    if seen is None:
+        seen = set()
+
+    for movie_data in movies:
+        movie_id = movie_data.get("id") if isinstance(movie_data, (dict, Mapping)) else None
+        if movie_id is not None and (movie_id == exclude_id or movie_id in seen):
             continue
-        except Exception as e:
-            # Catch any other unexpected errors
-            logger.error(f"Unexpected error validating movie: {e}", exc_info=True)
+
+        movie = _validate_movie(movie_data, logger)
+        if movie is None or movie.id == exclude_id or movie.id in seen:
             continue
 
-    return validated_movies
+        seen.add(movie.id)
+        yield movie
 
 
 def remove_duplicate_movies(movies: List[Movie]) -> List[Movie]:
@@ -0,0 +1,177 @@
+"""
+Column-oriented candidate pool for similarity ranking.
+
+Converts a list of Movie models into parallel per-feature columns once per
+ranking run, so scoring walks flat lists of ints instead of re-reading the
+nested genre/keyword/company structures of every Movie for every comparison.
+Set-valued features are interned into a shared vocabulary and stored as
+integer bitsets alongside their set sizes, so Jaccard similarity takes a single
+popcount of the intersection: |A ∪ B| = |A| + |B| - |A ∩ B|.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional
+
+from src.models.Movies import Movie
+
+
+if hasattr(int, "bit_count"):
+
+    def popcount(value: int) -> int:
+        """Return the number of set bits in a non-negative integer."""
+        return value.bit_count()
+
+else:  # Python < 3.10
+
+    def popcount(value: int) -> int:
+        """Return the number of set bits in a non-negative integer."""
+        return bin(value).count("1")
+
+
+def jaccard_bits(bits1: int, bits2: int) -> float:
+    """
+    Calculate Jaccard similarity between two bitsets.
+
+    Args:
+        bits1: Bitset of the first movie
+        bits2: Bitset of the second movie
+
+    Returns:
+        Similarity score between 0.0 and 1.0 (0.0 if either set is empty)
+    """
+    if not bits1 or not bits2:
+        return 0.0
+    return popcount(bits1 & bits2) / popcount(bits1 | bits2)
+
+
+class Vocab:
+    """
+    Interns feature tokens (genre names, keyword names, company IDs) to bit positions.
+
+    Tokens are namespaced so that e.g. a genre and a keyword with the same name
+    get distinct bits. A single vocabulary is shared by the target movie and its
+    candidates so that their bitsets are directly comparable.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty vocabulary."""
+        self._index: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def bits(self, namespace: str, tokens: Iterable[Hashable]) -> int:
+        """
+        Encode tokens as a bitset, interning unseen tokens on the fly.
+
+        Args:
+            namespace: Feature namespace (e.g. "genre", "keyword", "company")
+            tokens: Tokens to encode
+
+        Returns:
+            Integer bitset with one bit set per distinct token
+        """
+        index = self._index
+        mask = 0
+        for token in tokens:
+            key = (namespace, token)
+            mask |= 1 << index.setdefault(key, len(index))
+        return mask
+
+
+class MovieFeatures:
+    """Encoded similarity features of a single movie."""
+
+    __slots__ = (
+        "genre_bits",
+        "keyword_bits",
+        "company_bits",
+        "genre_count",
+        "keyword_count",
+        "company_count",
+        "director_hash",
+        "collection_id",
+    )
+
+    def __init__(self, movie: Movie, vocab: Vocab):
+        """
+        Encode a movie's similarity features against a vocabulary.
+
+        Args:
+            movie: Movie model to encode
+            vocab: Shared vocabulary
+        """
+        self.genre_bits = vocab.bits("genre", movie.genre_set)
+        self.keyword_bits = vocab.bits("keyword", movie.keyword_set)
+        self.company_bits = vocab.bits("company", movie.production_company_set)
+        # Set sizes, so Jaccard unions follow from the intersection alone
+        self.genre_count = popcount(self.genre_bits)
+        self.keyword_count = popcount(self.keyword_bits)
+        self.company_count = popcount(self.company_bits)
+        self.director_hash = movie.director_hash
+        self.collection_id = movie.collection_id
+
+
+class CandidatePool:
+    """
+    Structure-of-arrays view of a candidate list.
+
+    Column ``i`` of every list describes ``movies[i]``.
+    """
+
+    def __init__(self, vocab: Vocab):
+        """
+        Initialize an empty pool.
+
+        Args:
+            vocab: Vocabulary used to encode set-valued features
+        """
+        self.vocab = vocab
+        self.ids: List[int] = []
+        self.movies: List[Movie] = []
+        self.genre_bits: List[int] = []
+        self.keyword_bits: List[int] = []
+        self.company_bits: List[int] = []
+        self.genre_counts: List[int] = []
+        self.keyword_counts: List[int] = []
+        self.company_counts: List[int] = []
+        self.director_hashes: List[Optional[int]] = []
+        self.collection_ids: List[Optional[int]] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, movie: Movie) -> None:
+        """
+        Encode a movie and append it as a new row of the pool.
+
+        Args:
+            movie: Movie model to add
+        """
+        features = MovieFeatures(movie, self.vocab)
+        self.ids.append(movie.id)
+        self.movies.append(movie)
+        self.genre_bits.append(features.genre_bits)
+        self.keyword_bits.append(features.keyword_bits)
+        self.company_bits.append(features.company_bits)
+        self.genre_counts.append(features.genre_count)
+        self.keyword_counts.append(features.keyword_count)
+        self.company_counts.append(features.company_count)
+        self.director_hashes.append(features.director_hash)
+        self.collection_ids.append(features.collection_id)
+
+    @classmethod
+    def from_movies(cls, movies: Iterable[Movie], vocab: Optional[Vocab] = None) -> "CandidatePool":
+        """
+        Build a pool from Movie models.
+
+        Args:
+            movies: Candidate Movie models
+            vocab: Shared vocabulary (a new one is created if not provided)
+
+        Returns:
+            CandidatePool with one row per movie
+        """
+        pool = cls(vocab if vocab is not None else Vocab())
+        for movie in movies:
+            pool.append(movie)
+        return pool
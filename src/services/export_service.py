@@ -4,8 +4,9 @@ This service only handles CSV conversion and file writing.
 All data processing and sorting should be done in other services.
 """
 
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
 
 import csv
 
@@ -13,6 +14,57 @@ from src.models.Movies import Movie
 from src.utils.logger import get_logger
 
 
+# Decimal places of similarity scores written to CSV (scores are kept at full
+# precision everywhere else)
+SCORE_DECIMALS = 4
+
+# Write buffer for CSV files, so rows reach the OS in large chunks instead of
+# one write() call per default-sized (8 KiB) buffer
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Rows handed to csv.writerows at a time when exporting from a (possibly lazy)
+# iterable, so streamed input is never materialized in full
+EXPORT_BATCH_SIZE = 1000
+
+
+def _format_score(value: Any) -> str:
+    """
+    Format a similarity score or metric for CSV output.
+
+    Args:
+        value: Score value (float, str or other)
+
+    Returns:
+        Floats rounded to SCORE_DECIMALS places, other values as str
+    """
+    if isinstance(value, float):
+        return str(round(value, SCORE_DECIMALS))
+    return str(value)
+
+
+def _require_entries(entries: Iterable[Any], message: str) -> Iterator[Any]:
+    """
+    Return an iterator over entries, failing early if there are none.
+
+    Peeks at the first entry so generators can be validated without being
+    materialized.
+
+    Args:
+        entries: Iterable of entries to export
+        message: Error message if entries is empty
+
+    Returns:
+        Iterator yielding all entries, including the peeked one
+
+    Raises:
+        ValueError: If entries is empty
+    """
+    iterator = iter(entries)
+    for first in iterator:
+        return chain((first,), iterator)
+    raise ValueError(message)
+
+
 class ExportService:
     """
     Service for exporting movie data to CSV files.
@@ -123,59 +175,97 @@ class ExportService:
 
         self.logger.info(f"Exporting {len(movies_data)} movie entries to {filepath}")
 
-        with open(filepath, mode, newline="", encoding="utf-8") as csvfile:
+        with open(filepath, mode, newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction="ignore")
 
             if write_header:
                 writer.writeheader()
 
-            for entry in movies_data:
-                if not isinstance(entry, dict):
-                    self.logger.warning(f"Invalid entry in movies_data: expected dict, got {type(entry)}. Skipping.")
-                    continue
+            writer.writerows(self._iter_movie_rows(movies_data))
 
-                movie: Any = entry.get("movie")
-                sort_method: Optional[str] = entry.get("sort_method")
+        self.logger.info(f"Successfully exported movies to {filepath}")
+        return str(filepath)
 
-                if not isinstance(movie, Movie):
-                    self.logger.warning(f"Invalid movie in entry: expected Movie, got {type(movie)}. Skipping.")
-                    continue
+    def _iter_movie_rows(self, movies_data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, str]]:
+        """
+        Yield CSV rows for valid movie entries, skipping (and logging) invalid ones.
 
-                row = self._movie_to_csv_row(movie, sort_method=sort_method)
-                writer.writerow(row)
+        Args:
+            movies_data: Iterable of dictionaries with "movie" and "sort_method" keys
 
-        self.logger.info(f"Successfully exported movies to {filepath}")
-        return str(filepath)
+        Yields:
+            CSV row dictionaries
+        """
+        for entry in movies_data:
+            if not isinstance(entry, dict):
+                self.logger.warning(f"Invalid entry in movies_data: expected dict, got {type(entry)}. Skipping.")
+                continue
 
-    def export_similar_movies_to_csv(
+            movie: Any = entry.get("movie")
+            sort_method: Optional[str] = entry.get("sort_method")
+
+            if not isinstance(movie, Movie):
+                self.logger.warning(f"Invalid movie in entry: expected Movie, got {type(movie)}. Skipping.")
+                continue
+
+            yield self._movie_to_csv_row(movie, sort_method=sort_method)
+
+    def export_movies_to_csv_multi(
         self,
-        similar_movies_data: List[Dict[str, Any]],
-        filename: str = "similar_movies.csv",
+        sections: Sequence[Tuple[str, List[Movie]]],
+        filename: str = "top_movies.csv",
     ) -> str:
         """
-        Export similar movies data to CSV file.
+        Export several sort orderings of movies to one CSV file in a single pass.
+
+        Produces the same file as one export_movies_to_csv write followed by
+        appends for the remaining sections, but opens the file only once.
 
         Args:
-            similar_movies_data: List of dictionaries containing:
-                - "original_movie": Movie model instance
-                - "similar_movie": Movie model instance
-                - "similarity_score": Optional similarity score (float or str)
-                - "similarity_reason": Optional reason for similarity (str)
-                - Any other similarity metrics
+            sections: List of (sort_method, movies) tuples, written in order
             filename: Output CSV filename
 
         Returns:
             Path to the exported CSV file
 
         Raises:
-            ValueError: If similar_movies_data is empty
+            ValueError: If sections contain no movies
         """
-        if not similar_movies_data:
-            raise ValueError("Cannot export empty similar movies data")
+        if not any(movies for _, movies in sections):
+            raise ValueError("Cannot export empty movies data")
 
         filepath = self.output_dir / filename
+        fieldnames = self._get_movie_csv_fieldnames()
+
+        self.logger.info(f"Exporting {len(sections)} movie sections to {filepath}")
+
+        # Rows go through the same validation as export_movies_to_csv, so invalid
+        # entries are logged and skipped, and only written rows are counted
+        rows = self._iter_movie_rows(
+            {"movie": movie, "sort_method": sort_method}
+            for sort_method, movies in sections
+            for movie in movies
+        )
+        rows_written = 0
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+
+            for batch in iter(lambda: list(islice(rows, EXPORT_BATCH_SIZE)), []):
+                writer.writerows(batch)
+                rows_written += len(batch)
+
+        self.logger.info(f"Successfully exported {rows_written} movie entries to {filepath}")
+        return str(filepath)
+
+    def _get_similar_movie_csv_fieldnames(self) -> List[str]:
+        """
+        Get CSV field names for similar movies export.
 
-        fieldnames = [
+        Returns:
+            List of field names for CSV header
+        """
+        return [
             "original_movie_id",
             "original_movie_title",
             "similar_movie_id",
@@ -201,72 +291,138 @@ class ExportService:
             "imdb_id",
         ]
 
-        self.logger.info(f"Exporting {len(similar_movies_data)} similar movie entries to {filepath}")
+    def export_similar_movies_to_csv(
+        self,
+        similar_movies_data: Iterable[Dict[str, Any]],
+        filename: str = "similar_movies.csv",
+    ) -> str:
+        """
+        Export similar movies data to CSV file.
 
-        with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        Args:
+            similar_movies_data: List or lazy iterable of dictionaries containing:
+                - "original_movie": Movie model instance
+                - "similar_movie": Movie model instance
+                - "similarity_score": Optional similarity score (float or str)
+                - "similarity_reason": Optional reason for similarity (str)
+                - Any other similarity metrics
+            filename: Output CSV filename
+
+        Returns:
+            Path to the exported CSV file
+
+        Raises:
+            ValueError: If similar_movies_data is empty
+        """
+        # Checked before opening, so an empty input does not leave an empty file behind
+        entries = _require_entries(similar_movies_data, "Cannot export empty similar movies data")
+
+        filepath = self.output_dir / filename
 
-            for entry in similar_movies_data:
-                if not isinstance(entry, dict):
-                    self.logger.warning(f"Invalid entry in similar_movies_data: expected dict, got {type(entry)}. Skipping.")
-                    continue
-
-                original_movie: Any = entry.get("original_movie")
-                similar_movie: Any = entry.get("similar_movie")
-                similarity_score: Any = entry.get("similarity_score")
-                similarity_reason: Optional[str] = entry.get("similarity_reason")
-                similarity_metrics: Any = entry.get("similarity_metrics", {})
-
-                if not isinstance(original_movie, Movie):
-                    self.logger.warning(f"Invalid original_movie: expected Movie, got {type(original_movie)}. Skipping.")
-                    continue
-
-                if not isinstance(similar_movie, Movie):
-                    self.logger.warning(f"Invalid similar_movie: expected Movie, got {type(similar_movie)}. Skipping.")
-                    continue
-
-                # Convert similarity_score to string
-                similarity_score_str = ""
-                if similarity_score is not None:
-                    similarity_score_str = str(similarity_score)
-
-                # Extract detailed metrics
-                metrics = similarity_metrics if isinstance(similarity_metrics, dict) else {}
-                genre_sim = metrics.get("genre_similarity", "")
-                keyword_sim = metrics.get("keyword_similarity", "")
-                content_sim = metrics.get("content_similarity", "")
-                rating_sim = metrics.get("rating_similarity", "")
-                year_sim = metrics.get("year_similarity", "")
-                shared_genres = metrics.get("shared_genres", [])
-                shared_keywords = metrics.get("shared_keywords", [])
-
-                row = {
-                    "original_movie_id": str(original_movie.id),
-                    "original_movie_title": original_movie.title,
-                    "similar_movie_id": str(similar_movie.id),
-                    "similar_movie_title": similar_movie.title,
-                    "similarity_score": similarity_score_str,
-                    "similarity_reason": similarity_reason or "",
-                    "genre_similarity": str(genre_sim) if genre_sim else "",
-                    "keyword_similarity": str(keyword_sim) if keyword_sim else "",
-                    "content_similarity": str(content_sim) if content_sim else "",
-                    "rating_similarity": str(rating_sim) if rating_sim else "",
-                    "year_similarity": str(year_sim) if year_sim else "",
-                    "shared_genres": ", ".join(shared_genres) if isinstance(shared_genres, list) else "",
-                    "shared_keywords": ", ".join(shared_keywords[:10]) if isinstance(shared_keywords, list) else "",
-                    "genres": ", ".join(similar_movie.genre_names),
-                    "keywords": ", ".join(similar_movie.keyword_names[:10]),
-                    "vote_count": str(similar_movie.vote_count),
-                    "vote_average": str(similar_movie.vote_average),
-                    "popularity": str(similar_movie.popularity),
-                    "release_date": similar_movie.release_date or "",
-                    "release_year": str(similar_movie.release_year) if similar_movie.release_year else "",
-                    "overview": (similar_movie.overview or "")[:500] if similar_movie.overview else "",
-                    "runtime": str(similar_movie.runtime) if similar_movie.runtime else "",
-                    "imdb_id": similar_movie.imdb_id or "",
-                }
-                writer.writerow(row)
-
-        self.logger.info(f"Successfully exported similar movies to {filepath}")
+        self.logger.info(f"Exporting similar movie entries to {filepath}")
+
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+            rows_written = self.write_similar_movies_csv(entries, csvfile)
+
+        self.logger.info(f"Successfully exported {rows_written} similar movies to {filepath}")
         return str(filepath)
+
+    def write_similar_movies_csv(self, similar_movies_data: Iterable[Dict[str, Any]], stream: TextIO) -> int:
+        """
+        Write similar movies data as CSV (header included) to an open text stream.
+
+        Used by export_similar_movies_to_csv for files; callers that only need
+        the CSV text (e.g. io.StringIO in tests) can skip the disk round-trip.
+
+        Args:
+            similar_movies_data: Same entries as for export_similar_movies_to_csv
+            stream: Writable text stream, opened with newline="" if it is a file
+
+        Returns:
+            Number of rows written (invalid entries are skipped)
+
+        Raises:
+            ValueError: If similar_movies_data is empty
+        """
+        entries = _require_entries(similar_movies_data, "Cannot export empty similar movies data")
+
+        writer = csv.DictWriter(stream, fieldnames=self._get_similar_movie_csv_fieldnames())
+        writer.writeheader()
+
+        rows = self._iter_similar_movie_rows(entries)
+        rows_written = 0
+        for batch in iter(lambda: list(islice(rows, EXPORT_BATCH_SIZE)), []):
+            writer.writerows(batch)
+            rows_written += len(batch)
+        return rows_written
+
+    def _iter_similar_movie_rows(self, similar_movies_data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, str]]:
+        """
+        Yield CSV rows for valid similar-movie entries, skipping (and logging) invalid ones.
+
+        Args:
+            similar_movies_data: Iterable of dictionaries with original/similar movies and similarity data
+
+        Yields:
+            CSV row dictionaries
+        """
+        for entry in similar_movies_data:
+            if not isinstance(entry, dict):
+                self.logger.warning(f"Invalid entry in similar_movies_data: expected dict, got {type(entry)}. Skipping.")
+                continue
+
+            original_movie: Any = entry.get("original_movie")
+            similar_movie: Any = entry.get("similar_movie")
+            similarity_score: Any = entry.get("similarity_score")
+            similarity_reason: Optional[str] = entry.get("similarity_reason")
+            similarity_metrics: Any = entry.get("similarity_metrics", {})
+
+            if not isinstance(original_movie, Movie):
+                self.logger.warning(f"Invalid original_movie: expected Movie, got {type(original_movie)}. Skipping.")
+                continue
+
+            if not isinstance(similar_movie, Movie):
+                self.logger.warning(f"Invalid similar_movie: expected Movie, got {type(similar_movie)}. Skipping.")
+                continue
+
+            # Convert similarity_score to string (rounded only here, at serialization)
+            similarity_score_str = ""
+            if similarity_score is not None:
+                similarity_score_str = _format_score(similarity_score)
+
+            # Extract detailed metrics
+            metrics = similarity_metrics if isinstance(similarity_metrics, dict) else {}
+            genre_sim = metrics.get("genre_similarity", "")
+            keyword_sim = metrics.get("keyword_similarity", "")
+            content_sim = metrics.get("content_similarity", "")
+            rating_sim = metrics.get("rating_similarity", "")
+            year_sim = metrics.get("year_similarity", "")
+            shared_genres = metrics.get("shared_genres", [])
+            shared_keywords = metrics.get("shared_keywords", [])
+
+            row = {
+                "original_movie_id": str(original_movie.id),
+                "original_movie_title": original_movie.title,
+                "similar_movie_id": str(similar_movie.id),
+                "similar_movie_title": similar_movie.title,
+                "similarity_score": similarity_score_str,
+                "similarity_reason": similarity_reason or "",
+                "genre_similarity": _format_score(genre_sim) if genre_sim else "",
+                "keyword_similarity": _format_score(keyword_sim) if keyword_sim else "",
+                "content_similarity": _format_score(content_sim) if content_sim else "",
+                "rating_similarity": _format_score(rating_sim) if rating_sim else "",
+                "year_similarity": _format_score(year_sim) if year_sim else "",
+                "shared_genres": ", ".join(shared_genres) if isinstance(shared_genres, list) else "",
+                "shared_keywords": ", ".join(shared_keywords[:10]) if isinstance(shared_keywords, list) else "",
+                "genres": ", ".join(similar_movie.genre_names),
+                "keywords": ", ".join(similar_movie.keyword_names[:10]),
+                "vote_count": str(similar_movie.vote_count),
+                "vote_average": str(similar_movie.vote_average),
+                "popularity": str(similar_movie.popularity),
+                "release_date": similar_movie.release_date or "",
+                "release_year": str(similar_movie.release_year) if similar_movie.release_year else "",
+                "overview": (similar_movie.overview or "")[:500] if similar_movie.overview else "",
+                "runtime": str(similar_movie.runtime) if similar_movie.runtime else "",
+                "imdb_id": similar_movie.imdb_id or "",
+            }
+            yield row
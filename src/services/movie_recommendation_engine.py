@@ -9,15 +9,129 @@ This module orchestrates the complete recommendation workflow by:
 3. Returning top N similar movies for each target movie
 """
 
-import time
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from functools import lru_cache
+from typing import AbstractSet, Any, Callable, Collection, Dict, List, NamedTuple, Optional, Tuple
 
 from src.api.TMDB import TMDBClient
-from src.models.Movies import Movie, movie_from_tmdb_response, remove_duplicate_movies, validate_movie_list
+from src.models.Movies import Movie, director_hash, iter_unique_movies, movie_from_tmdb_response
+from src.services.candidate_pool import CandidatePool, MovieFeatures, Vocab
+from src.services.similarity_kernel import SimilarityWeights, top_n_batch
+from src.utils.concurrency import get_worker_count, parallel_map
 from src.utils.config import get_config
 from src.utils.logger import get_logger
 
 
+# Maximum number of (target, candidate) pairs kept by calculate_similarity_score
+SIMILARITY_CACHE_SIZE = 4096
+
+
+def _as_set(values: Collection[Any]) -> AbstractSet[Any]:
+    """
+    Return values as a set, reusing precomputed sets instead of copying them.
+
+    Args:
+        values: List or set of hashable values
+
+    Returns:
+        Set view of values
+    """
+    if isinstance(values, AbstractSet):
+        return values
+    return set(values)
+
+
+def _jaccard(values1: Collection[Any], values2: Collection[Any]) -> float:
+    """
+    Calculate Jaccard similarity (|A n B| / |A u B|) of two collections.
+
+    Args:
+        values1: List or precomputed set of hashable values
+        values2: List or precomputed set of hashable values
+
+    Returns:
+        Similarity score between 0.0 and 1.0 (0.0 if either is empty)
+    """
+    if not values1 or not values2:
+        return 0.0
+
+    set1 = _as_set(values1)
+    set2 = _as_set(values2)
+
+    # Union size follows from the intersection, so only one set operation is needed
+    intersection = len(set1 & set2)
+    return intersection / (len(set1) + len(set2) - intersection)
+
+
+class EnrichNeeds(NamedTuple):
+    """Optional candidate features to fetch during enrichment."""
+
+    need_keywords: bool = True
+    need_director: bool = True
+
+
+@lru_cache(maxsize=4096)
+def _reason_from_flags(
+    collection_name: Optional[str],
+    shared_company_names: Tuple[str, ...],
+    director: Optional[str],
+    genre_bucket: int,
+    similar_keywords: bool,
+    shared_genres: Tuple[str, ...],
+) -> str:
+    """
+    Build a human-readable similarity reason from discretized similarity flags.
+
+    Args:
+        collection_name: Shared collection name (None if not the same franchise)
+        shared_company_names: Names of shared production companies
+        director: Shared director name (None if not the same director)
+        genre_bucket: 2 for genre similarity > 0.5, 1 for some overlap, 0 for none
+        similar_keywords: Whether keyword similarity is above 0.3
+        shared_genres: Up to three shared genre names (only used for bucket 2)
+
+    Returns:
+        Human-readable similarity reason
+    """
+    reasons = []
+
+    # Collection/franchise (highest priority)
+    if collection_name:
+        reasons.append(f"Same franchise: {collection_name}")
+
+    # Production company (high priority - e.g., Pixar, Disney, Marvel)
+    if shared_company_names:
+        # Show up to 2 production companies
+        company_str = ", ".join(shared_company_names[:2])
+        if len(shared_company_names) > 2:
+            company_str += f" (+{len(shared_company_names) - 2} more)"
+        reasons.append(f"Same studio: {company_str}")
+
+    # Director (high priority)
+    if director:
+        reasons.append(f"Same director: {director}")
+
+    # Genre similarity
+    if genre_bucket == 2:
+        if shared_genres:
+            reasons.append(f"Similar genres: {', '.join(shared_genres)}")
+        else:
+            reasons.append("Similar genres")
+    elif genre_bucket == 1:
+        reasons.append("Some genre overlap")
+
+    # Keyword similarity
+    if similar_keywords:
+        reasons.append("Similar themes/keywords")
+
+    if not reasons:
+        return "General similarity"
+    elif len(reasons) == 1:
+        return reasons[0]
+    else:
+        return "; ".join(reasons[:3])  # Limit to 3 reasons
+
+
 class MovieRecommendationEngine:
     """
     Movie recommendation engine that finds similar movies using a two-stage approach.
@@ -46,7 +160,6 @@ class MovieRecommendationEngine:
         # Configuration
         self.min_vote_count = self.config.get("recommendation.min_vote_count", 100)
         self.min_vote_average = self.config.get("recommendation.min_vote_average", 6.0)
-        self.api_delay = self.config.get("recommendation.api_delay", 0.1)
 
         # Similarity calculation weights from config (focus on actual similarity factors)
         weights = self.config.get("recommendation.weights", {})
@@ -55,9 +168,25 @@ class MovieRecommendationEngine:
         self.director_weight = weights.get("director_similarity", 0.1)
         self.collection_weight = weights.get("collection_similarity", 0.3)
         self.production_company_weight = weights.get("production_company_similarity", 0.2)
+        self.similarity_weights = SimilarityWeights(
+            genre=self.genre_weight,
+            keyword=self.keyword_weight,
+            director=self.director_weight,
+            collection=self.collection_weight,
+            production_company=self.production_company_weight,
+        )
 
-        # Track API calls for performance monitoring
+        # Track API calls for performance monitoring (candidate pools are
+        # fetched on worker threads, so updates go through _count_api_calls)
         self.api_calls_made = 0
+        self._api_calls_lock = threading.Lock()
+
+        # Candidates enriched during the current run, keyed by movie ID, so a
+        # candidate shared by several targets is only fetched once
+        self._enriched_by_id: Dict[int, Movie] = {}
+
+        # Similarity results keyed by (target ID, candidate ID)
+        self._similarity_cache: Dict[Tuple[int, int], Tuple[Movie, Movie, Tuple[float, Dict[str, Any]]]] = {}
 
         self.logger.info("Movie recommendation engine initialized")
 
@@ -71,7 +200,7 @@ class MovieRecommendationEngine:
         Find similar movies for each movie in the list.
 
         This is the main method that orchestrates the complete workflow:
-        1. For each target movie, get candidate pool using selected strategy
+        1. Get the candidate pool of every target movie (concurrently) using the selected strategy
         2. Calculate similarity scores for all candidates
         3. Return top N similar movies for each target
 
@@ -108,16 +237,25 @@ class MovieRecommendationEngine:
         )
 
         self.api_calls_made = 0
+        self._enriched_by_id = {}
         results: List[Dict[str, Any]] = []
 
-        for i, target_movie in enumerate(top_movies, 1):
+        # Stage 1 is independent per target and network-bound, so fetch all
+        # candidate pools concurrently before ranking
+        candidate_pools = parallel_map(
+            lambda movie: self._get_candidate_pool_or_none(movie, strategy),
+            top_movies,
+            get_worker_count(),
+        )
+
+        for i, (target_movie, candidates) in enumerate(zip(top_movies, candidate_pools), 1):
+            if candidates is None:
+                continue
+
             try:
                 self.logger.info(
                     f"Processing movie {i}/{len(top_movies)}: {target_movie.title} (ID: {target_movie.id})"
                 )
-
-                # Stage 1: Get candidate pool
-                candidates = self._get_candidate_pool(target_movie, strategy)
                 self.logger.debug(
                     f"Found {len(candidates)} candidates for {target_movie.title}"
                 )
@@ -148,10 +286,6 @@ class MovieRecommendationEngine:
                         f"No similar movies found for {target_movie.title} after ranking"
                     )
 
-                # Delay to avoid rate limiting
-                if i < len(top_movies):
-                    time.sleep(self.api_delay)
-
             except Exception as e:
                 self.logger.error(
                     f"Error processing {target_movie.title}: {e}", exc_info=True
@@ -165,6 +299,37 @@ class MovieRecommendationEngine:
 
         return results
 
+    def _count_api_calls(self, count: int = 1) -> None:
+        """
+        Add to the API call counter (safe to call from worker threads).
+
+        Args:
+            count: Number of API calls made
+        """
+        with self._api_calls_lock:
+            self.api_calls_made += count
+
+    def _get_candidate_pool_or_none(
+        self, target_movie: Movie, strategy: str
+    ) -> Optional[List[Movie]]:
+        """
+        Get the candidate pool for a target, logging errors instead of raising.
+
+        Args:
+            target_movie: Target movie to find candidates for
+            strategy: Candidate selection strategy
+
+        Returns:
+            List of candidate Movie models, or None if candidate selection failed
+        """
+        try:
+            return self._get_candidate_pool(target_movie, strategy)
+        except Exception as e:
+            self.logger.error(
+                f"Error processing {target_movie.title}: {e}", exc_info=True
+            )
+            return None
+
     def _get_candidate_pool(
         self, target_movie: Movie, strategy: str
     ) -> List[Movie]:
@@ -208,68 +373,87 @@ class MovieRecommendationEngine:
         Returns:
             List of candidate Movie models
         """
+        candidates = self._fetch_tmdb_api_candidates(target_movie)
+
+        # Convert to Movie models, removing duplicates and the target in one pass
+        unique_movies = list(iter_unique_movies(candidates, exclude_id=target_movie.id))
+
+        self.logger.debug(
+            f"TMDB API strategy: {len(candidates)} raw candidates -> "
+            f"{len(unique_movies)} unique candidates (excluding target)"
+        )
+
+        return unique_movies
+
+    def _fetch_tmdb_api_candidates(self, target_movie: Movie) -> List[Dict[str, Any]]:
+        """
+        Fetch raw candidate data from TMDB's similar and recommendations endpoints.
+
+        Both endpoints are requested concurrently; similar movies still come first
+        in the returned list.
+
+        Args:
+            target_movie: Target movie to find candidates for
+
+        Returns:
+            List of raw movie dictionaries filtered by minimum vote count
+        """
         self.logger.debug(
             f"Getting candidates from TMDB API for {target_movie.title}"
         )
-        candidates: List[Movie] = []
+        endpoints = [
+            ("similar", self.tmdb_client.get_similar_movies),
+            ("recommended", self.tmdb_client.get_movie_recommendations),
+        ]
+        results = parallel_map(
+            lambda endpoint: self._fetch_endpoint_candidates(target_movie, *endpoint),
+            endpoints,
+            min(len(endpoints), get_worker_count()),
+        )
 
-        # Get similar movies
-        try:
-            similar_data = self.tmdb_client.get_similar_movies(target_movie.id, page=1)
-            self.api_calls_made += 1
-
-            if similar_data and "results" in similar_data:
-                similar_movies_data = similar_data.get("results", [])
-                # Filter by minimum vote count
-                filtered = [
-                    m
-                    for m in similar_movies_data
-                    if m.get("vote_count", 0) >= self.min_vote_count
-                ]
-                candidates.extend(filtered)
-                self.logger.debug(
-                    f"Found {len(filtered)} similar movies from TMDB API"
-                )
-        except Exception as e:
-            self.logger.warning(f"Error getting similar movies: {e}")
+        candidates: List[Dict[str, Any]] = []
+        for endpoint_candidates in results:
+            candidates.extend(endpoint_candidates)
+        return candidates
 
-        time.sleep(self.api_delay)
+    def _fetch_endpoint_candidates(
+        self,
+        target_movie: Movie,
+        label: str,
+        fetch: Callable[..., Optional[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the first page of one TMDB candidate endpoint.
+
+        Args:
+            target_movie: Target movie to find candidates for
+            label: Endpoint description used in log messages ("similar" or "recommended")
+            fetch: Client method taking a movie ID and page
 
-        # Get recommendations
+        Returns:
+            List of raw movie dictionaries filtered by minimum vote count
+            (empty if the request fails)
+        """
         try:
-            recommendations_data = self.tmdb_client.get_movie_recommendations(
-                target_movie.id, page=1
-            )
-            self.api_calls_made += 1
-
-            if recommendations_data and "results" in recommendations_data:
-                rec_movies_data = recommendations_data.get("results", [])
-                # Filter by minimum vote count
-                filtered = [
-                    m
-                    for m in rec_movies_data
-                    if m.get("vote_count", 0) >= self.min_vote_count
-                ]
-                candidates.extend(filtered)
-                self.logger.debug(
-                    f"Found {len(filtered)} recommended movies from TMDB API"
-                )
+            data = fetch(target_movie.id, page=1)
+            self._count_api_calls()
         except Exception as e:
-            self.logger.warning(f"Error getting recommendations: {e}")
-
-        # Convert to Movie models and remove duplicates
-        movies = validate_movie_list(candidates)
-        unique_movies = remove_duplicate_movies(movies)
+            self.logger.warning(f"Error getting {label} movies: {e}")
+            return []
 
-        # Exclude target movie
-        unique_movies = [m for m in unique_movies if m.id != target_movie.id]
+        if not data or "results" not in data:
+            return []
 
+        # Filter by minimum vote count
+        candidates = [
+            m
+            for m in data.get("results", [])
+            if m.get("vote_count", 0) >= self.min_vote_count
+        ]
         self.logger.debug(
-            f"TMDB API strategy: {len(candidates)} raw candidates -> "
-            f"{len(unique_movies)} unique candidates (excluding target)"
+            f"Found {len(candidates)} {label} movies from TMDB API"
         )
-
-        return unique_movies
+        return candidates
 
     def _get_candidates_same_year(self, target_movie: Movie) -> List[Movie]:
         """
@@ -296,46 +480,55 @@ class MovieRecommendationEngine:
             )
             return []
 
+        candidates = self._fetch_year_candidates(target_movie, target_movie.release_year, 50)
+
+        # Convert to Movie models, excluding the target movie
+        movies = list(iter_unique_movies(candidates, exclude_id=target_movie.id))
+
         self.logger.debug(
-            f"Getting candidates from year {target_movie.release_year} "
-            f"for {target_movie.title}"
+            f"Same year strategy: {len(candidates)} raw candidates -> "
+            f"{len(movies)} candidates (excluding target)"
         )
 
-        candidates: List[Movie] = []
+        return movies
+
+    def _fetch_year_candidates(
+        self, target_movie: Movie, year: int, limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch raw candidate data for the most popular movies of a release year.
+
+        Args:
+            target_movie: Target movie to find candidates for
+            year: Release year to fetch
+            limit: Maximum number of movies to take from the year
+
+        Returns:
+            List of raw movie dictionaries
+        """
+        self.logger.debug(
+            f"Getting candidates from year {year} for {target_movie.title}"
+        )
 
         try:
-            # Get movies from same year, sorted by popularity
+            # Get movies from the year, sorted by popularity
             year_data = self.tmdb_client.get_movies_by_year(
-                year=target_movie.release_year,
+                year=year,
                 min_vote_count=self.min_vote_count,
                 min_vote_average=self.min_vote_average,
                 sort_by="popularity.desc",
                 page=1,
             )
-            self.api_calls_made += 1
+            self._count_api_calls()
 
             if year_data and "results" in year_data:
                 movies_data = year_data.get("results", [])
-                # Get top 50 movies from the year
-                candidates.extend(movies_data[:50])
-                self.logger.debug(
-                    f"Found {len(movies_data)} movies from year {target_movie.release_year}"
-                )
+                self.logger.debug(f"Found {len(movies_data)} movies from year {year}")
+                return movies_data[:limit]
         except Exception as e:
-            self.logger.warning(f"Error getting movies from same year: {e}")
-
-        # Convert to Movie models
-        movies = validate_movie_list(candidates)
-
-        # Exclude target movie
-        movies = [m for m in movies if m.id != target_movie.id]
-
-        self.logger.debug(
-            f"Same year strategy: {len(candidates)} raw candidates -> "
-            f"{len(movies)} candidates (excluding target)"
-        )
+            self.logger.warning(f"Error getting movies from year {year}: {e}")
 
-        return movies
+        return []
 
     def _get_candidates_same_genre(self, target_movie: Movie) -> List[Movie]:
         """
@@ -367,7 +560,7 @@ class MovieRecommendationEngine:
             f"(genres: {target_movie.genre_names})"
         )
 
-        candidates: List[Movie] = []
+        candidates: List[Dict[str, Any]] = []
 
         # Limit to top 2 genres to avoid too many API calls
         genres_to_use = target_movie.genres[:2]
@@ -384,7 +577,7 @@ class MovieRecommendationEngine:
                     page=1,
                     with_genres=genre.id,
                 )
-                self.api_calls_made += 1
+                self._count_api_calls()
 
                 if genre_data and "results" in genre_data:
                     movies_data = genre_data.get("results", [])
@@ -394,20 +587,14 @@ class MovieRecommendationEngine:
                         f"Found {len(movies_data)} movies for genre {genre.name}"
                     )
 
-                time.sleep(self.api_delay)
-
             except Exception as e:
                 self.logger.warning(
                     f"Error getting movies for genre {genre.name}: {e}"
                 )
                 continue
 
-        # Convert to Movie models and remove duplicates
-        movies = validate_movie_list(candidates)
-        unique_movies = remove_duplicate_movies(movies)
-
-        # Exclude target movie
-        unique_movies = [m for m in unique_movies if m.id != target_movie.id]
+        # Convert to Movie models, removing duplicates and the target in one pass
+        unique_movies = list(iter_unique_movies(candidates, exclude_id=target_movie.id))
 
         self.logger.debug(
             f"Same genre strategy: {len(candidates)} raw candidates -> "
@@ -439,16 +626,18 @@ class MovieRecommendationEngine:
         self.logger.debug(
             f"Getting candidates using hybrid strategy for {target_movie.title}"
         )
-        all_candidates: List[Movie] = []
+        all_candidates: List[Dict[str, Any]] = []
 
         # 1. Get TMDB API suggestions (similar + recommendations)
-        tmdb_candidates = self._get_candidates_from_tmdb_api(target_movie)
+        tmdb_candidates = self._fetch_tmdb_api_candidates(target_movie)
         all_candidates.extend(tmdb_candidates)
         self.logger.debug(f"TMDB API: {len(tmdb_candidates)} candidates")
 
         # 2. Get same year movies
         if target_movie.release_year:
-            same_year_candidates = self._get_candidates_same_year(target_movie)
+            same_year_candidates = self._fetch_year_candidates(
+                target_movie, target_movie.release_year, 50
+            )
             all_candidates.extend(same_year_candidates)
             self.logger.debug(
                 f"Same year ({target_movie.release_year}): {len(same_year_candidates)} candidates"
@@ -458,36 +647,15 @@ class MovieRecommendationEngine:
             for year_offset in [-2, -1, 1, 2]:
                 nearby_year = target_movie.release_year + year_offset
                 if nearby_year > 1900 and nearby_year <= 2025:  # Reasonable year range
-                    try:
-                        year_data = self.tmdb_client.get_movies_by_year(
-                            year=nearby_year,
-                            min_vote_count=self.min_vote_count,
-                            min_vote_average=self.min_vote_average,
-                            sort_by="popularity.desc",
-                            page=1,
-                        )
-                        self.api_calls_made += 1
-
-                        if year_data and "results" in year_data:
-                            movies_data = year_data.get("results", [])
-                            # Get top 10 movies from nearby year
-                            nearby_movies = validate_movie_list(movies_data[:10])
-                            all_candidates.extend(nearby_movies)
-                            self.logger.debug(
-                                f"Nearby year {nearby_year}: {len(nearby_movies)} candidates"
-                            )
-
-                        time.sleep(self.api_delay)
-
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Error getting movies from year {nearby_year}: {e}"
-                        )
-                        continue
-
-        # Remove duplicates and exclude target movie
-        unique_candidates = remove_duplicate_movies(all_candidates)
-        unique_candidates = [m for m in unique_candidates if m.id != target_movie.id]
+                    # Get top 10 movies from nearby year
+                    nearby_movies = self._fetch_year_candidates(target_movie, nearby_year, 10)
+                    all_candidates.extend(nearby_movies)
+                    self.logger.debug(
+                        f"Nearby year {nearby_year}: {len(nearby_movies)} candidates"
+                    )
+
+        # Validate, remove duplicates and exclude target movie in one pass
+        unique_candidates = list(iter_unique_movies(all_candidates, exclude_id=target_movie.id))
 
         self.logger.debug(
             f"Hybrid strategy: {len(all_candidates)} raw candidates -> "
@@ -528,37 +696,33 @@ class MovieRecommendationEngine:
         )
 
         # Enrich candidates with details (genres, keywords) if not already enriched
-        # This is needed for accurate similarity calculation
-        enriched_candidates = self._enrich_candidates_if_needed(candidates)
-
-        # Calculate similarity scores
-        scored_movies: List[Tuple[Movie, float, Dict[str, Any]]] = []
-
-        for candidate in enriched_candidates:
-            # Skip if it's the same movie
-            if candidate.id == target_movie.id:
-                continue
+        # This is needed for accurate similarity calculation. Only fetch the
+        # features the target movie can actually match on.
+        needs = self._get_enrich_needs(target_movie)
+        enriched_candidates = self._enrich_candidates_if_needed(candidates, needs)
+
+        # Encode candidates column-wise once, then score by scanning the columns
+        vocab = Vocab()
+        target = MovieFeatures(target_movie, vocab)
+        pool = CandidatePool.from_movies(
+            (candidate for candidate in enriched_candidates if candidate.id != target_movie.id),
+            vocab,
+        )
+        # Select the top N rows by similarity score (highest first, ties keep pool
+        # order), skipping rows whose best possible score cannot make the cut
+        top_rows = top_n_batch(target, pool, self.similarity_weights, top_n)
 
+        # Format results (detailed metrics are only needed for the returned movies)
+        results: List[Dict[str, Any]] = []
+        for score, idx in top_rows:
+            movie = pool.movies[idx]
             try:
-                score, metrics = self.calculate_similarity_score(
-                    target_movie, candidate
-                )
-                scored_movies.append((candidate, score, metrics))
+                _, metrics = self.calculate_similarity_score(target_movie, movie)
             except Exception as e:
                 self.logger.warning(
-                    f"Error calculating similarity for candidate {candidate.id}: {e}"
+                    f"Error calculating similarity for candidate {movie.id}: {e}"
                 )
                 continue
-
-        # Sort by similarity score (highest first)
-        scored_movies.sort(key=lambda x: x[1], reverse=True)
-
-        # Get top N
-        top_similar = scored_movies[:top_n]
-
-        # Format results
-        results: List[Dict[str, Any]] = []
-        for movie, score, metrics in top_similar:
             results.append({
                 "similar_movie": movie,
                 "similarity_score": score,
@@ -567,65 +731,41 @@ class MovieRecommendationEngine:
             })
 
         self.logger.debug(
-            f"Ranked {len(scored_movies)} candidates, returning top {len(results)} "
+            f"Ranked {len(pool)} candidates, returning top {len(results)} "
             f"for {target_movie.title}"
         )
 
         return results
 
     def _calculate_genre_similarity(
-        self, genres1: List[str], genres2: List[str]
+        self, genres1: Collection[str], genres2: Collection[str]
     ) -> float:
         """
         Calculate genre similarity using Jaccard similarity.
 
         Args:
-            genres1: List of genre names from first movie
-            genres2: List of genre names from second movie
+            genres1: Genre names from first movie (list or precomputed set)
+            genres2: Genre names from second movie (list or precomputed set)
 
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        if not genres1 or not genres2:
-            return 0.0
-
-        set1 = set(genres1)
-        set2 = set(genres2)
-
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
-
-        if union == 0:
-            return 0.0
-
-        return intersection / union
+        return _jaccard(genres1, genres2)
 
     def _calculate_keyword_similarity(
-        self, keywords1: List[str], keywords2: List[str]
+        self, keywords1: Collection[str], keywords2: Collection[str]
     ) -> float:
         """
         Calculate keyword similarity using Jaccard similarity.
 
         Args:
-            keywords1: List of keyword names from first movie
-            keywords2: List of keyword names from second movie
+            keywords1: Keyword names from first movie (list or precomputed set)
+            keywords2: Keyword names from second movie (list or precomputed set)
 
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        if not keywords1 or not keywords2:
-            return 0.0
-
-        set1 = set(keywords1)
-        set2 = set(keywords2)
-
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
-
-        if union == 0:
-            return 0.0
-
-        return intersection / union
+        return _jaccard(keywords1, keywords2)
 
     def _calculate_director_similarity(
         self, director1: Optional[str], director2: Optional[str]
@@ -643,8 +783,9 @@ class MovieRecommendationEngine:
         if not director1 or not director2:
             return 0.0
 
-        # Case-insensitive comparison
-        if director1.lower().strip() == director2.lower().strip():
+        # Case-insensitive comparison via pre-hashed normalized names
+        hash1 = director_hash(director1)
+        if hash1 is not None and hash1 == director_hash(director2):
             return 1.0
 
         return 0.0
@@ -671,7 +812,7 @@ class MovieRecommendationEngine:
         return 0.0
 
     def _calculate_production_company_similarity(
-        self, companies1: List[int], companies2: List[int]
+        self, companies1: Collection[int], companies2: Collection[int]
     ) -> float:
         """
         Calculate production company similarity using Jaccard similarity.
@@ -679,27 +820,14 @@ class MovieRecommendationEngine:
         they get a similarity score based on overlap.
 
         Args:
-            companies1: List of production company IDs from first movie
-            companies2: List of production company IDs from second movie
+            companies1: Production company IDs from first movie (list or precomputed set)
+            companies2: Production company IDs from second movie (list or precomputed set)
 
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        if not companies1 or not companies2:
-            return 0.0
-
-        set1 = set(companies1)
-        set2 = set(companies2)
-
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
-
-        if union == 0:
-            return 0.0
-
-        # Jaccard similarity: intersection / union
         # If they share at least one company, score > 0
-        return intersection / union
+        return _jaccard(companies1, companies2)
 
     def calculate_similarity_score(
         self, target_movie: Movie, candidate_movie: Movie
@@ -723,57 +851,71 @@ class MovieRecommendationEngine:
             - similarity_score: Overall similarity score (0.0 to 1.0)
             - metrics_dict: Dictionary containing detailed metrics
         """
-        # Get genre and keyword names
-        genres1 = target_movie.genre_names if target_movie.genres else []
-        genres2 = candidate_movie.genre_names if candidate_movie.genres else []
-        keywords1 = target_movie.keyword_names if target_movie.keywords else []
-        keywords2 = candidate_movie.keyword_names if candidate_movie.keywords else []
-        
-        # Get production company IDs
-        companies1 = target_movie.production_company_ids
-        companies2 = candidate_movie.production_company_ids
-
-        # Calculate individual similarities
-        genre_sim = self._calculate_genre_similarity(genres1, genres2)
-        keyword_sim = self._calculate_keyword_similarity(keywords1, keywords2)
-        director_sim = self._calculate_director_similarity(
-            target_movie.director, candidate_movie.director
-        )
-        collection_sim = self._calculate_collection_similarity(
-            target_movie.collection_id, candidate_movie.collection_id
-        )
-        production_company_sim = self._calculate_production_company_similarity(
-            companies1, companies2
-        )
+        # Reuse previously computed results for the same pair of Movie objects
+        cache_key = (target_movie.id, candidate_movie.id)
+        cached = self._similarity_cache.get(cache_key)
+        if cached is not None and cached[0] is target_movie and cached[1] is candidate_movie:
+            return cached[2]
+
+        # Get genre and keyword name sets (computed once per Movie, so the target's
+        # sets are shared across every candidate it is compared with)
+        genres1 = target_movie.genre_set
+        genres2 = candidate_movie.genre_set
+        keywords1 = target_movie.keyword_set
+        keywords2 = candidate_movie.keyword_set
+
+        # Get production company ID sets
+        companies1 = target_movie.production_company_set
+        companies2 = candidate_movie.production_company_set
+
+        reverse = self._similarity_cache.get((candidate_movie.id, target_movie.id))
+        if reverse is not None and reverse[0] is candidate_movie and reverse[1] is target_movie:
+            # Every component similarity is symmetric, so reuse the scores of the
+            # reverse pair; shared names and the reason are target-side and rebuilt
+            similarity_score, reverse_metrics = reverse[2]
+            genre_sim = reverse_metrics["genre_similarity"]
+            keyword_sim = reverse_metrics["keyword_similarity"]
+            director_sim = reverse_metrics["director_similarity"]
+            collection_sim = reverse_metrics["collection_similarity"]
+            production_company_sim = reverse_metrics["production_company_similarity"]
+        else:
+            # Calculate individual similarities
+            genre_sim = self._calculate_genre_similarity(genres1, genres2)
+            keyword_sim = self._calculate_keyword_similarity(keywords1, keywords2)
+            director_sim = self._calculate_director_similarity(
+                target_movie.director, candidate_movie.director
+            )
+            collection_sim = self._calculate_collection_similarity(
+                target_movie.collection_id, candidate_movie.collection_id
+            )
+            production_company_sim = self._calculate_production_company_similarity(
+                companies1, companies2
+            )
 
-        # Calculate weighted overall similarity score
-        similarity_score = (
-            (genre_sim * self.genre_weight) +
-            (keyword_sim * self.keyword_weight) +
-            (director_sim * self.director_weight) +
-            (collection_sim * self.collection_weight) +
-            (production_company_sim * self.production_company_weight)
-        )
+            # Calculate weighted overall similarity score
+            similarity_score = (
+                (genre_sim * self.genre_weight) +
+                (keyword_sim * self.keyword_weight) +
+                (director_sim * self.director_weight) +
+                (collection_sim * self.collection_weight) +
+                (production_company_sim * self.production_company_weight)
+            )
 
-        # Ensure score is between 0.0 and 1.0
-        similarity_score = max(0.0, min(1.0, similarity_score))
+            # Ensure score is between 0.0 and 1.0
+            similarity_score = max(0.0, min(1.0, similarity_score))
 
         # Find shared genres, keywords, and production companies
-        shared_genres = list(set(genres1).intersection(set(genres2)))
-        shared_keywords = list(set(keywords1).intersection(set(keywords2)))
-        shared_companies = list(set(companies1).intersection(set(companies2)))
+        shared_genres = list(genres1 & genres2)
+        shared_keywords = list(keywords1 & keywords2)
+        shared_companies = list(companies1 & companies2)
         shared_company_names = []
-        if shared_companies and target_movie.production_companies:
-            # Get names of shared production companies
-            company_name_map = {
-                company.get("id"): company.get("name", "")
-                for company in target_movie.production_companies
-                if isinstance(company, dict) and company.get("id")
-            }
+        if shared_companies:
+            # Get names of shared production companies (target's map is built once)
+            company_name_map = target_movie.production_company_name_map
             shared_company_names = [
-                company_name_map.get(company_id, "")
+                company_name_map[company_id]
                 for company_id in shared_companies
-                if company_name_map.get(company_id)
+                if company_id in company_name_map
             ]
 
         # Generate similarity reason
@@ -797,7 +939,12 @@ class MovieRecommendationEngine:
             "similarity_reason": similarity_reason,
         }
 
-        return similarity_score, metrics
+        result = (similarity_score, metrics)
+        if len(self._similarity_cache) >= SIMILARITY_CACHE_SIZE:
+            self._similarity_cache.clear()
+        self._similarity_cache[cache_key] = (target_movie, candidate_movie, result)
+
+        return result
 
     def _generate_similarity_reason(
         self,
@@ -832,115 +979,140 @@ class MovieRecommendationEngine:
         Returns:
             Human-readable similarity reason
         """
-        reasons = []
-
-        # Collection/franchise (highest priority)
-        if collection_sim > 0.0 and collection1:
-            reasons.append(f"Same franchise: {collection1}")
-
-        # Production company (high priority - e.g., Pixar, Disney, Marvel)
-        if production_company_sim > 0.0 and shared_company_names:
-            # Show up to 2 production companies
-            company_str = ", ".join(shared_company_names[:2])
-            if len(shared_company_names) > 2:
-                company_str += f" (+{len(shared_company_names) - 2} more)"
-            reasons.append(f"Same studio: {company_str}")
-
-        # Director (high priority)
-        if director_sim > 0.0 and director1:
-            reasons.append(f"Same director: {director1}")
-
-        # Genre similarity
+        # Discretize the scores so that pairs with the same outcome share a cache entry
         if genre_sim > 0.5:
-            if shared_genres:
-                reasons.append(f"Similar genres: {', '.join(shared_genres[:3])}")
-            else:
-                reasons.append("Similar genres")
+            genre_bucket = 2
         elif genre_sim > 0.0:
-            reasons.append("Some genre overlap")
+            genre_bucket = 1
+        else:
+            genre_bucket = 0
+
+        return _reason_from_flags(
+            collection1 if collection_sim > 0.0 else None,
+            tuple(shared_company_names) if production_company_sim > 0.0 else (),
+            director1 if director_sim > 0.0 else None,
+            genre_bucket,
+            keyword_sim > 0.3,
+            tuple(shared_genres[:3]) if genre_bucket == 2 else (),
+        )
 
-        # Keyword similarity
-        if keyword_sim > 0.3:
-            reasons.append("Similar themes/keywords")
+    def _get_enrich_needs(self, target_movie: Movie) -> EnrichNeeds:
+        """
+        Determine which candidate features can contribute to similarity with a target.
 
-        if not reasons:
-            return "General similarity"
-        elif len(reasons) == 1:
-            return reasons[0]
-        else:
-            return "; ".join(reasons[:3])  # Limit to 3 reasons
+        A factor whose weight is zero, or for which the target movie has no data,
+        scores 0.0 for every candidate, so fetching it for candidates is wasted work.
 
-    def _enrich_candidates_if_needed(self, candidates: List[Movie]) -> List[Movie]:
+        Args:
+            target_movie: Target movie candidates are compared against
+
+        Returns:
+            EnrichNeeds flags for candidate enrichment
+        """
+        return EnrichNeeds(
+            need_keywords=self.keyword_weight > 0 and bool(target_movie.keywords),
+            need_director=self.director_weight > 0 and target_movie.director is not None,
+        )
+
+    def _enrich_candidates_if_needed(
+        self, candidates: List[Movie], needs: Optional[EnrichNeeds] = None
+    ) -> List[Movie]:
         """
         Enrich candidates with detailed information (genres, keywords, director, collection) if needed.
 
         Args:
             candidates: List of candidate movies
+            needs: Which optional features to fetch (all of them if not provided)
 
         Returns:
             List of enriched Movie models
         """
+        if needs is None:
+            needs = EnrichNeeds()
+
+        # Reuse candidates already enriched for earlier targets in this run
+        known = self._enriched_by_id
+        candidates = [known.get(candidate.id, candidate) for candidate in candidates]
+
+        # Candidates are independent and the work is network-bound, so fetch them concurrently
+        results = parallel_map(
+            lambda candidate: self._enrich_candidate(candidate, needs),
+            candidates,
+            get_worker_count(),
+        )
+
         enriched: List[Movie] = []
+        for movie, api_calls in results:
+            enriched.append(movie)
+            self._count_api_calls(api_calls)
+            if api_calls:
+                known[movie.id] = movie
 
-        for candidate in candidates:
-            # Check if movie already has all similarity-related fields
-            # Note: collection_id can be None (not all movies have collections)
-            # We check if director exists to determine if we need to fetch credits
-            needs_enrichment = (
-                not candidate.genres or
-                not candidate.keywords or
-                candidate.director is None  # Director might be None if not fetched yet
-            )
+        return enriched
 
-            if not needs_enrichment:
-                enriched.append(candidate)
-                continue
+    def _enrich_candidate(self, candidate: Movie, needs: EnrichNeeds) -> Tuple[Movie, int]:
+        """
+        Enrich a single candidate with detailed information if needed.
 
-            # Enrich with details
-            try:
-                # Get movie details (includes collection)
-                details_data = self.tmdb_client.get_movie_details(candidate.id)
-                self.api_calls_made += 1
+        Args:
+            candidate: Candidate movie
+            needs: Which optional features to fetch
 
-                if not details_data:
-                    enriched.append(candidate)
-                    continue
+        Returns:
+            Tuple of (enriched Movie model or the original candidate, number of API calls made)
+        """
+        # Check if movie already has all similarity-related fields
+        # Note: collection_id can be None (not all movies have collections)
+        # We check if director exists to determine if we need to fetch credits
+        needs_enrichment = (
+            not candidate.genres or
+            (needs.need_keywords and not candidate.keywords) or
+            (needs.need_director and candidate.director is None)  # Director might be None if not fetched yet
+        )
 
-                # Get keywords
-                keywords_data = self.tmdb_client.get_movie_keywords(candidate.id)
-                self.api_calls_made += 1
+        if not needs_enrichment:
+            return candidate, 0
 
+        api_calls = 0
+
+        # Enrich with details
+        try:
+            # Get movie details (includes collection) with the needed keywords and
+            # credits appended, so one request covers all endpoints
+            append: List[str] = []
+            if needs.need_keywords:
+                append.append("keywords")
+            if needs.need_director:
+                append.append("credits")
+            details_data = self.tmdb_client.get_movie_details(candidate.id, append=tuple(append))
+            api_calls += 1
+
+            if not details_data:
+                return candidate, api_calls
+
+            # Fall back to separate requests if a section is missing from the response
+            if needs.need_keywords and "keywords" not in details_data:
+                keywords_data = self.tmdb_client.get_movie_keywords(candidate.id)
+                api_calls += 1
                 if keywords_data and "keywords" in keywords_data:
                     details_data["keywords"] = keywords_data
 
-                # Get credits to extract director
+            if needs.need_director and "credits" not in details_data:
                 credits_data = self.tmdb_client.get_movie_credits(candidate.id)
-                self.api_calls_made += 1
-
+                api_calls += 1
                 if credits_data and "crew" in credits_data:
-                    # Find director from crew
-                    crew = credits_data.get("crew", [])
-                    director = None
-                    for person in crew:
-                        if person.get("job") == "Director":
-                            director = person.get("name")
-                            break
-                    if director:
-                        details_data["director"] = director
-
-                # Create enriched movie
-                enriched_movie = movie_from_tmdb_response(details_data)
-                enriched.append(enriched_movie)
-
-                time.sleep(self.api_delay)
+                    details_data["credits"] = credits_data
 
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to enrich candidate {candidate.id}: {e}"
-                )
-                enriched.append(candidate)
+            # Create enriched movie
+            enriched_movie = movie_from_tmdb_response(details_data)
 
-        return enriched
+            return enriched_movie, api_calls
+
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to enrich candidate {candidate.id}: {e}"
+            )
+            return candidate, api_calls
 
 
 # Alias for backwards compatibility with tests
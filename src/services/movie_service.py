@@ -3,11 +3,14 @@ Movie service for retrieving, processing, and managing movie data.
 Handles business logic for movie operations including sorting and filtering.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import heapq
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from src.api.TMDB import TMDBClient
-from src.models.Movies import Movie, movie_from_tmdb_response, validate_movie_list
+from src.models.Movies import Movie, iter_unique_movies, movie_from_tmdb_response
 from src.services.export_service import ExportService
+from src.utils.concurrency import get_worker_count, parallel_map
 from src.utils.config import get_config
 from src.utils.logger import get_logger
 
@@ -42,45 +45,47 @@ class MovieService:
         Returns:
             List of Movie models with enriched details (genres, keywords, director, collection, etc.)
         """
-        enriched_movies: List[Movie] = []
-
-        for movie in movies:
-            try:
-                # Get detailed movie information (includes collection)
-                details_data = self.tmdb_client.get_movie_details(movie.id)
-                if not details_data:
-                    # If details not available, use the basic movie data
-                    enriched_movies.append(movie)
-                    continue
-
-                # Get keywords
+        # Movies are independent and the work is network-bound, so fetch them concurrently
+        return parallel_map(self._enrich_movie, movies, get_worker_count())
+
+    def _enrich_movie(self, movie: Movie) -> Movie:
+        """
+        Enrich a single movie with detailed information from TMDB API.
+
+        Args:
+            movie: Movie model with basic information
+
+        Returns:
+            Enriched Movie model, or the original movie if enrichment fails
+        """
+        try:
+            # Get detailed movie information (includes collection) with keywords
+            # and credits appended, so one request covers all three endpoints
+            details_data = self.tmdb_client.get_movie_details(
+                movie.id, append=("keywords", "credits")
+            )
+            if not details_data:
+                # If details not available, use the basic movie data
+                return movie
+
+            # Fall back to separate requests if a section is missing from the response
+            if "keywords" not in details_data:
                 keywords_data = self.tmdb_client.get_movie_keywords(movie.id)
                 if keywords_data and "keywords" in keywords_data:
                     details_data["keywords"] = keywords_data
 
-                # Get credits to extract director
+            if "credits" not in details_data:
                 credits_data = self.tmdb_client.get_movie_credits(movie.id)
                 if credits_data and "crew" in credits_data:
-                    # Find director from crew
-                    crew = credits_data.get("crew", [])
-                    director = None
-                    for person in crew:
-                        if person.get("job") == "Director":
-                            director = person.get("name")
-                            break
-                    if director:
-                        details_data["director"] = director
-
-                # Create enriched movie from detailed data
-                enriched_movie = movie_from_tmdb_response(details_data)
-                enriched_movies.append(enriched_movie)
-
-            except Exception as e:
-                # If enrichment fails, use the original movie data
-                self.logger.warning(f"Failed to enrich movie {movie.id}: {e}. Using basic data.")
-                enriched_movies.append(movie)
+                    details_data["credits"] = credits_data
 
-        return enriched_movies
+            # Create enriched movie from detailed data
+            return movie_from_tmdb_response(details_data)
+
+        except Exception as e:
+            # If enrichment fails, use the original movie data
+            self.logger.warning(f"Failed to enrich movie {movie.id}: {e}. Using basic data.")
+            return movie
 
     def get_top_movies_by_year(
         self,
@@ -114,13 +119,13 @@ class MovieService:
             f"(min_votes: {min_vote_count}, min_rating: {min_vote_average})"
         )
 
-        all_movies: List[Movie] = []
-        page = 1
         max_pages = self.config.get("data.max_pages", 5)
+        # Discover already applies the vote filters and sorts by vote count, so the
+        # first top_n results are the global top and no padding is needed
+        target_count = top_n
 
-        # Fetch movies from multiple pages until we have enough
-        while page <= max_pages and len(all_movies) < top_n * 2:  # Get extra to ensure we have enough after filtering
-            data = self.tmdb_client.get_movies_by_year(
+        def fetch_page(page: int) -> Optional[Dict[str, Any]]:
+            return self.tmdb_client.get_movies_by_year(
                 year=year,
                 min_vote_count=min_vote_count,
                 min_vote_average=min_vote_average,
@@ -128,32 +133,49 @@ class MovieService:
                 page=page,
             )
 
-            if not data or "results" not in data:
-                break
-
-            movies_data = data.get("results", [])
-            if not movies_data:
-                break
-
-            # Convert to Movie models (basic info from discover endpoint)
-            validated_movies = validate_movie_list(movies_data)
-            all_movies.extend(validated_movies)
-
-            self.logger.debug(f"Retrieved {len(validated_movies)} movies from page {page}")
-
-            # Check if there are more pages
-            total_pages = data.get("total_pages", 0)
-            if page >= total_pages:
-                break
+        # The first page tells us how many pages exist and how many results a page holds
+        pages_data: List[Optional[Dict[str, Any]]] = [fetch_page(1)]
+        first_page = pages_data[0]
+        available_pages = 1
+        if first_page and first_page.get("results"):
+            per_page = len(first_page["results"])
+            pages_needed = -(-target_count // per_page)  # ceil division
+            available_pages = min(max_pages, first_page.get("total_pages", 0))
+            last_page = min(available_pages, pages_needed)
+
+            # Remaining pages are independent, so fetch them concurrently
+            pages_data.extend(
+                parallel_map(fetch_page, range(2, last_page + 1), get_worker_count())
+            )
 
-            page += 1
+        def iter_results() -> Iterator[Dict[str, Any]]:
+            page = 0
+            while page < len(pages_data) or page < available_pages:
+                if page == len(pages_data):
+                    # Invalid or duplicate results left the prefetched pages short
+                    # of top_n movies, so fetch one more page
+                    pages_data.append(fetch_page(page + 1))
+                data = pages_data[page]
+                page += 1
+                if not data or "results" not in data:
+                    return
+
+                movies_data = data.get("results", [])
+                if not movies_data:
+                    return
+
+                self.logger.debug(f"Retrieved {len(movies_data)} movies from page {page}")
+                yield from movies_data
+
+        # Convert to Movie models (basic info from discover endpoint), validating
+        # only as many movies as needed instead of every result of the last page
+        all_movies = list(islice(iter_unique_movies(iter_results()), target_count))
 
         if not all_movies:
             raise ValueError(f"No movies found for year {year} with the specified criteria")
 
-        # Sort by vote count and get top N
-        sorted_movies = sorted(all_movies, key=lambda m: m.vote_count, reverse=True)
-        top_movies = sorted_movies[:top_n]
+        # Select top N by vote count without sorting the whole result set
+        top_movies = [all_movies[i] for i in self._indices_by_votes(all_movies, limit=top_n)]
 
         # Enrich movies with detailed information (genres, keywords, etc.)
         enriched_movies = self._enrich_movies_with_details(top_movies)
@@ -171,7 +193,27 @@ class MovieService:
         Returns:
             Sorted list of Movie models
         """
-        return sorted(movies, key=lambda m: m.vote_count, reverse=True)
+        return [movies[i] for i in self._indices_by_votes(movies)]
+
+    def _indices_by_votes(self, movies: List[Movie], limit: Optional[int] = None) -> List[int]:
+        """
+        Order movie indices by vote count (highest first, ties keep input order).
+
+        Vote counts are pulled into a flat list once, so ordering compares plain
+        ints instead of reading the attribute from every Movie on each comparison.
+
+        Args:
+            movies: List of Movie models
+            limit: Only return the first N indices (None for all)
+
+        Returns:
+            List of indices into movies
+        """
+        vote_counts = [movie.vote_count for movie in movies]
+        indices = range(len(vote_counts))
+        if limit is None:
+            return sorted(indices, key=vote_counts.__getitem__, reverse=True)
+        return heapq.nlargest(limit, indices, key=vote_counts.__getitem__)
 
     def sort_movies_by_name(self, movies: List[Movie], ignore_articles: bool = False) -> List[Movie]:
         """
@@ -185,10 +227,10 @@ class MovieService:
         Returns:
             Sorted list of Movie models
         """
-        return sorted(
-            movies,
-            key=lambda m: m.normalize_title_for_sorting(ignore_articles=ignore_articles).lower(),
-        )
+        # Compute each (cached) sort key exactly once, then order indices by key
+        keys = [movie.sort_key(ignore_articles=ignore_articles) for movie in movies]
+        order = sorted(range(len(movies)), key=keys.__getitem__)
+        return [movies[i] for i in order]
 
     def prepare_movies_for_export(
         self, movies: List[Movie], sort_method: str
@@ -235,9 +277,10 @@ class MovieService:
 
         This method:
         1. Retrieves top N movies from the specified year
-        2. Sorts them by votes (highest first) and saves to CSV
-        3. Sorts them by name (with articles) and appends to the same CSV
-        4. Sorts them by name (without articles) and appends to the same CSV
+        2. Sorts them by votes (highest first)
+        3. Sorts them by name (with articles)
+        4. Sorts them by name (without articles)
+        5. Writes all three orderings to the same CSV in one pass
 
         Args:
             year: Release year
@@ -262,29 +305,18 @@ class MovieService:
             min_vote_average=min_vote_average,
         )
 
-        # Export with votes sort (first write, overwrites if exists)
-        votes_data = self.prepare_movies_for_export(top_movies, sort_method="votes")
-        filepath = self.export_service.export_movies_to_csv(
-            movies_data=votes_data, filename=filename, append=False
-        )
-        self.logger.debug(f"Exported {len(votes_data)} movies sorted by votes")
-
-        # Export with name sort (with articles) - append to file
-        name_data = self.prepare_movies_for_export(top_movies, sort_method="name")
-        self.export_service.export_movies_to_csv(
-            movies_data=name_data, filename=filename, append=True
-        )
-        self.logger.debug(f"Appended {len(name_data)} movies sorted by name (with articles)")
-
-        # Export with name sort (without articles) - append to file
-        name_no_articles_data = self.prepare_movies_for_export(
-            top_movies, sort_method="name_no_articles"
-        )
-        self.export_service.export_movies_to_csv(
-            movies_data=name_no_articles_data, filename=filename, append=True
+        # Compute all three orderings in memory and write them in a single pass
+        sections = [
+            ("votes", self.sort_movies_by_votes(top_movies)),
+            ("name", self.sort_movies_by_name(top_movies, ignore_articles=False)),
+            ("name_no_articles", self.sort_movies_by_name(top_movies, ignore_articles=True)),
+        ]
+        filepath = self.export_service.export_movies_to_csv_multi(
+            sections=sections, filename=filename
         )
         self.logger.debug(
-            f"Appended {len(name_no_articles_data)} movies sorted by name (without articles)"
+            f"Exported {len(top_movies)} movies sorted by votes, name (with articles) "
+            f"and name (without articles)"
         )
 
         self.logger.info(
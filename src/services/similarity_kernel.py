@@ -0,0 +1,118 @@
+"""
+Fused similarity ranking kernel over a CandidatePool.
+
+Ranks the candidates of a pool against a target in a single loop, with the
+target's features and the factor weights bound to locals so the per-candidate
+work is plain int/float arithmetic. Set sizes are precomputed on both sides, so
+each Jaccard term needs one popcount (of the intersection) per candidate.
+"""
+
+import heapq
+from typing import List, NamedTuple, Tuple
+
+from src.services.candidate_pool import CandidatePool, MovieFeatures, popcount
+
+
+class SimilarityWeights(NamedTuple):
+    """Weights of the similarity factors."""
+
+    genre: float
+    keyword: float
+    director: float
+    collection: float
+    production_company: float
+
+
+def top_n_batch(
+    target: MovieFeatures, pool: CandidatePool, weights: SimilarityWeights, top_n: int
+) -> List[Tuple[float, int]]:
+    """
+    Select the top N pool rows by similarity score without scoring every row in full.
+
+    Matches the factors of MovieRecommendationEngine.calculate_similarity_score:
+    Jaccard similarity of genre, keyword and production company bitsets plus
+    binary director and collection matches. Terms are accumulated in the same
+    order, so scores are identical to the pairwise calculation.
+
+    Keeps a running min-heap of the best N rows. For each row the cheap scalar
+    factors (director and collection) are evaluated first; the row's set-based
+    factors can add at most their full weight, so when that upper bound cannot
+    beat the current N-th best score the popcount work is skipped entirely.
+
+    Args:
+        target: Encoded features of the target movie
+        pool: Candidate pool encoded with the same vocabulary as the target
+        weights: Factor weights
+        top_n: Number of rows to return
+
+    Returns:
+        List of (score, row index) tuples, highest score first, ties in pool order
+    """
+    if top_n <= 0:
+        return []
+
+    t_genres = target.genre_bits
+    t_keywords = target.keyword_bits
+    t_companies = target.company_bits
+    t_genre_count = target.genre_count
+    t_keyword_count = target.keyword_count
+    t_company_count = target.company_count
+    t_director = target.director_hash
+    t_collection = target.collection_id
+    w_genre, w_keyword, w_director, w_collection, w_company = weights
+
+    # Factors with zero weight or no target data can never contribute
+    use_genre = bool(w_genre and t_genres)
+    use_keyword = bool(w_keyword and t_keywords)
+    use_director = bool(w_director and t_director is not None)
+    use_collection = bool(w_collection and t_collection is not None)
+    use_company = bool(w_company and t_companies)
+
+    # Heap entries are (score, -index) so the root is the lowest score and,
+    # among equal scores, the latest row (which loses ties to earlier rows)
+    heap: List[Tuple[float, int]] = []
+    for idx, (genres, keywords, director, collection, companies, n_genres, n_keywords, n_companies) in enumerate(zip(
+        pool.genre_bits,
+        pool.keyword_bits,
+        pool.director_hashes,
+        pool.collection_ids,
+        pool.company_bits,
+        pool.genre_counts,
+        pool.keyword_counts,
+        pool.company_counts,
+    )):
+        director_term = w_director if use_director and director == t_director else 0.0
+        collection_term = w_collection if use_collection and collection == t_collection else 0.0
+
+        if len(heap) == top_n:
+            upper = director_term + collection_term
+            if use_genre and genres:
+                upper += w_genre
+            if use_keyword and keywords:
+                upper += w_keyword
+            if use_company and companies:
+                upper += w_company
+            if upper < heap[0][0]:
+                continue
+
+        score = 0.0
+        if use_genre and genres:
+            shared = popcount(t_genres & genres)
+            score += shared / (t_genre_count + n_genres - shared) * w_genre
+        if use_keyword and keywords:
+            shared = popcount(t_keywords & keywords)
+            score += shared / (t_keyword_count + n_keywords - shared) * w_keyword
+        score += director_term
+        score += collection_term
+        if use_company and companies:
+            shared = popcount(t_companies & companies)
+            score += shared / (t_company_count + n_companies - shared) * w_company
+
+        # Ensure score is between 0.0 and 1.0
+        entry = (max(0.0, min(1.0, score)), -idx)
+        if len(heap) < top_n:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    return [(score, -neg_idx) for score, neg_idx in sorted(heap, reverse=True)]
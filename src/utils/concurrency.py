@@ -0,0 +1,48 @@
+"""
+Concurrency helpers for I/O-bound work such as TMDB API calls.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+from src.utils.config import get_config
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def get_worker_count() -> int:
+    """
+    Get the number of worker threads to use for I/O-bound work.
+
+    Returns:
+        Configured performance.worker_threads, or 1 if parallel processing is disabled
+    """
+    config = get_config()
+    if not config.get("performance.parallel_enabled", True):
+        return 1
+    return max(1, int(config.get("performance.worker_threads", 4)))
+
+
+def parallel_map(func: Callable[[T], R], items: Iterable[T], max_workers: int) -> List[R]:
+    """
+    Apply a function to every item using a thread pool, preserving input order.
+
+    Falls back to a plain loop when only one worker is requested or there is at
+    most one item, so small inputs do not pay for thread start-up.
+
+    Args:
+        func: Function to apply (should handle its own exceptions)
+        items: Items to process
+        max_workers: Maximum number of concurrent worker threads
+
+    Returns:
+        List of results in the same order as items
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
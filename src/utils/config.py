@@ -2,12 +2,86 @@
 Configuration management module for loading environment variables and YAML config.
 """
 
+import copy
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, Union
 
-import yaml
-from dotenv import load_dotenv
+
+@lru_cache(maxsize=None)
+def _yaml_loader() -> Tuple[Any, Any]:
+    """
+    Import PyYAML on first use and pick its fastest safe loader.
+
+    PyYAML (and python-dotenv) are imported lazily so that importing this module
+    stays cheap for code that never loads a config file.
+
+    Returns:
+        Tuple of (yaml module, loader class)
+    """
+    import yaml
+
+    try:
+        # libyaml C parser (much faster), when PyYAML was built with it
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - pure-Python fallback
+        from yaml import SafeLoader as loader
+
+    return yaml, loader
+
+
+# Environment values treated as true by Config.get_env_bool (compared lowercased)
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
+
+# Resolved .env paths already loaded into os.environ by this process
+_loaded_env_files: Set[Path] = set()
+
+
+def load_env_file(env_file: Union[str, Path]) -> bool:
+    """
+    Load a .env file into the environment once per process.
+
+    Missing files and files that were already loaded are skipped without
+    reading or parsing them again.
+
+    Args:
+        env_file: Path to .env file
+
+    Returns:
+        True if the file was loaded by this call, False if it was skipped
+    """
+    env_path = Path(env_file).resolve()
+    if env_path in _loaded_env_files or not env_path.is_file():
+        return False
+
+    from dotenv import load_dotenv
+
+    load_dotenv(env_path)
+    _loaded_env_files.add(env_path)
+    return True
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, caching the result per path and modification time.
+
+    Editing the file changes its mtime, which makes the next call re-parse it.
+
+    Args:
+        path: Resolved path of the YAML file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+
+    Returns:
+        Parsed configuration dictionary (shared; callers must copy before mutating)
+    """
+    yaml, loader = _yaml_loader()
+    # Read the whole (small) file at once so the parser works on one buffer
+    # instead of pulling the stream in chunks through read() callbacks
+    with open(path, "rb") as f:
+        data = f.read()
+    return yaml.load(data, Loader=loader) or {}
 
 
 class Config:
@@ -31,7 +105,7 @@ class Config:
         # Load environment variables
         if env_file is None:
             env_file = self.project_root / ".env"
-        load_dotenv(env_file)
+        load_env_file(env_file)
 
         # Load YAML configuration
         if config_file is None:
@@ -39,6 +113,9 @@ class Config:
 
         self.config_data = self._load_yaml(config_file)
 
+        # Every section and leaf keyed by its dotted path, so get() is one lookup
+        self._flat: Dict[str, Any] = dict(self._flatten(self.config_data))
+
     def _load_yaml(self, config_file: Path) -> Dict[str, Any]:
         """
         Load YAML configuration file.
@@ -49,11 +126,17 @@ class Config:
         Returns:
             Configuration dictionary
         """
+        config_file = Path(config_file)
         if not config_file.exists():
             raise FileNotFoundError(f"Config file not found: {config_file}")
 
-        with open(config_file, "r") as f:
-            return yaml.safe_load(f) or {}
+        # Identical files are parsed once per process; each Config gets its own copy
+        parsed = _load_yaml_cached(str(config_file.resolve()), config_file.stat().st_mtime_ns)
+        if not isinstance(parsed, dict):
+            raise ValueError(
+                f"Config file must contain a mapping at the top level, got {type(parsed).__name__}: {config_file}"
+            )
+        return copy.deepcopy(parsed)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -66,19 +149,32 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split(".")
-        value = self.config_data
+        value = self._flat.get(key)
+        return default if value is None else value
 
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+    def _flatten(self, data: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+        """
+        Yield every non-null value of a nested config dictionary with its dotted path.
 
-            if value is None:
-                return default
+        Sections are yielded as well as their leaves, so get() can return a whole
+        section (e.g. 'recommendation.weights'). Keys that no dotted path can
+        reach (non-strings such as integer status codes, or keys containing a
+        dot) are skipped; they stay available inside their parent section.
 
-        return value
+        Args:
+            data: Config dictionary (or nested section)
+            prefix: Dotted path of data, including the trailing dot
+
+        Yields:
+            Tuples of (dotted key, value)
+        """
+        for k, value in data.items():
+            if not isinstance(k, str) or "." in k or value is None:
+                continue
+            key = f"{prefix}{k}"
+            yield key, value
+            if isinstance(value, dict):
+                yield from self._flatten(value, f"{key}.")
 
     def get_env(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
@@ -104,8 +200,10 @@ class Config:
         Returns:
             Boolean value
         """
-        value = os.getenv(key, str(default)).lower()
-        return value in ("true", "1", "yes", "on")
+        value = os.environ.get(key)
+        if value is None:
+            return default
+        return value.lower() in _TRUTHY
 
     def get_env_int(self, key: str, default: int = 0) -> int:
         """
@@ -118,11 +216,17 @@ class Config:
         Returns:
             Integer value
         """
+        value = os.environ.get(key)
+        if value is None:
+            return default
         try:
-            return int(os.getenv(key, str(default)))
+            return int(value)
         except ValueError:
             return default
 
+    # Environment-backed settings are read once per Config instance; the API key
+    # is looked up on every access so a missing key keeps raising.
+
     # TMDB API Configuration
     @property
     def tmdb_api_key(self) -> str:
@@ -132,72 +236,68 @@ class Config:
             raise ValueError("TMDB_API_KEY not found in environment variables")
         return api_key
 
-    @property
+    @cached_property
     def tmdb_api_base_url(self) -> str:
         """Get TMDB API base URL."""
         return self.get_env("TMDB_API_BASE_URL", "https://api.themoviedb.org/3")
 
     # Application Configuration
-    @property
+    @cached_property
     def environment(self) -> str:
         """Get application environment."""
         return self.get_env("ENVIRONMENT", "development")
 
-    @property
+    @cached_property
     def log_level(self) -> str:
         """Get logging level."""
         return self.get_env("LOG_LEVEL", "INFO")
 
     # Caching Configuration
-    @property
+    @cached_property
     def cache_enabled(self) -> bool:
         """Check if caching is enabled."""
         return self.get_env_bool("CACHE_ENABLED", True)
 
-    @property
+    @cached_property
     def cache_ttl(self) -> int:
         """Get cache TTL in seconds."""
         return self.get_env_int("CACHE_TTL", 3600)
 
-    @property
+    @cached_property
     def redis_host(self) -> str:
         """Get Redis host."""
         return self.get_env("REDIS_HOST", "localhost")
 
-    @property
+    @cached_property
     def redis_port(self) -> int:
         """Get Redis port."""
         return self.get_env_int("REDIS_PORT", 6379)
 
-    @property
+    @cached_property
     def redis_db(self) -> int:
         """Get Redis database number."""
         return self.get_env_int("REDIS_DB", 0)
 
     # Rate Limiting
-    @property
+    @cached_property
     def rate_limit_requests(self) -> int:
         """Get rate limit requests per period."""
         return self.get_env_int("RATE_LIMIT_REQUESTS", 40)
 
-    @property
+    @cached_property
     def rate_limit_period(self) -> int:
         """Get rate limit period in seconds."""
         return self.get_env_int("RATE_LIMIT_PERIOD", 10)
 
 
-# Singleton instance
-_config_instance: Optional[Config] = None
-
-
+@lru_cache(maxsize=None)
 def get_config() -> Config:
     """
     Get singleton configuration instance.
 
+    The instance is created on first call and cached for the process lifetime.
+
     Returns:
         Config instance
     """
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = Config()
-    return _config_instance
+    return Config()
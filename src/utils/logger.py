@@ -2,16 +2,121 @@
 Logging configuration module for the TMDB Movie Recommendation application.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import colorlog
 
 
+# Log format shared by console and file output
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Formatters are stateless, so one instance of each is shared by all handlers
+_FILE_FORMATTER = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+_COLOR_FORMATTER = colorlog.ColoredFormatter(
+    f"%(log_color)s{LOG_FORMAT}",
+    datefmt=DATE_FORMAT,
+    log_colors={
+        "DEBUG": "cyan",
+        "INFO": "green",
+        "WARNING": "yellow",
+        "ERROR": "red",
+        "CRITICAL": "red,bg_white",
+    },
+)
+
+
+# Background listeners writing queued records to each log file, keyed by resolved path
+_file_queues: Dict[Path, "queue.SimpleQueue[logging.LogRecord]"] = {}
+_file_queues_lock = threading.Lock()
+
+
+def _stop_file_listener(
+    listener: logging.handlers.QueueListener, file_handler: logging.Handler
+) -> None:
+    """
+    Drain a file's queue and then close the file.
+
+    The listener must stop first so records still queued are written before
+    the handler is closed.
+
+    Args:
+        listener: Listener writing queued records to the file
+        file_handler: Handler owning the log file
+    """
+    listener.stop()
+    file_handler.close()
+
+
+def _get_file_queue(
+    log_file: str, max_bytes: int, backup_count: int
+) -> "queue.SimpleQueue[logging.LogRecord]":
+    """
+    Get the queue feeding a rotating log file, starting its listener thread on first use.
+
+    Loggers only enqueue records; a single QueueListener per file does the disk
+    writes and rotation off the calling thread. The rotation settings of the first
+    call for a file are used.
+
+    Args:
+        log_file: Path to log file
+        max_bytes: Maximum size of log file before rotation
+        backup_count: Number of backup files to keep
+
+    Returns:
+        Queue to attach a QueueHandler to
+    """
+    log_path = Path(log_file).resolve()
+    with _file_queues_lock:
+        record_queue = _file_queues.get(log_path)
+        if record_queue is None:
+            # Ensure log directory exists
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_path,
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding="utf-8",
+            )
+            file_handler.setFormatter(_FILE_FORMATTER)
+
+            record_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(
+                record_queue, file_handler, respect_handler_level=True
+            )
+            listener.start()
+            # Flush remaining records and close the file on interpreter exit
+            atexit.register(_stop_file_listener, listener, file_handler)
+
+            _file_queues[log_path] = record_queue
+        return record_queue
+
+
+def _use_color(stream) -> bool:
+    """
+    Check whether ANSI colors should be written to a stream.
+
+    Args:
+        stream: Output stream of the console handler
+
+    Returns:
+        True if the stream is a terminal and NO_COLOR is not set
+    """
+    if os.environ.get("NO_COLOR") is not None:
+        return False
+    isatty = getattr(stream, "isatty", None)
+    return bool(isatty and isatty())
+
+
 def setup_logger(
     name: str = "tmdb_app",
     log_level: str = "INFO",
@@ -37,55 +142,28 @@ def setup_logger(
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
+    level = getattr(logging, log_level.upper())
+    logger.setLevel(level)
 
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
 
-    # Define log format
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    date_format = "%Y-%m-%d %H:%M:%S"
-
-    # Console handler with color
+    # Console handler, colored only on an interactive terminal (and unless NO_COLOR is set)
     if console_enabled:
-        console_handler = colorlog.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, log_level.upper()))
-
-        # Colored formatter for console
-        color_formatter = colorlog.ColoredFormatter(
-            "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt=date_format,
-            log_colors={
-                "DEBUG": "cyan",
-                "INFO": "green",
-                "WARNING": "yellow",
-                "ERROR": "red",
-                "CRITICAL": "red,bg_white",
-            },
-        )
-        console_handler.setFormatter(color_formatter)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(level)
+        console_handler.setFormatter(_COLOR_FORMATTER if _use_color(sys.stdout) else _FILE_FORMATTER)
         logger.addHandler(console_handler)
 
-    # File handler with rotation
+    # File handler with rotation, written by a background listener thread
     if file_enabled:
         if log_file is None:
             log_file = "logs/app.log"
 
-        # Ensure log directory exists
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding="utf-8",
+        file_handler = logging.handlers.QueueHandler(
+            _get_file_queue(log_file, max_bytes, backup_count)
         )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-
-        # Standard formatter for file
-        file_formatter = logging.Formatter(log_format, datefmt=date_format)
-        file_handler.setFormatter(file_formatter)
+        file_handler.setLevel(level)
         logger.addHandler(file_handler)
 
     # Prevent propagation to root logger
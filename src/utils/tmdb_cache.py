@@ -0,0 +1,194 @@
+"""
+Persistent on-disk cache for stable TMDB API responses.
+
+Movie details, keywords and credits rarely change, yet every run re-fetches
+them for the same movie IDs. This module stores those responses in a
+``shelve`` database with a time-to-live so warm runs skip the network.
+
+The cache is single-process: depending on the platform, shelve may use a dbm
+backend (such as dbm.dumb) without inter-process locking, so the process that
+opens the database holds an exclusive lock file until it closes it. Other
+processes using the same directory run without the cache instead of
+corrupting it.
+"""
+
+import atexit
+import shelve
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+from src.utils.logger import get_logger
+
+
+DEFAULT_CACHE_DIR = "~/.cache/tmdb"
+
+
+def _try_lock_exclusive(lock_file: IO[bytes]) -> bool:
+    """
+    Take an exclusive, non-blocking lock on an open file.
+
+    Args:
+        lock_file: File opened in binary mode
+
+    Returns:
+        True if the lock was acquired, False if another holder has it
+    """
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:  # pragma: no cover - Windows
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+class TMDBCache:
+    """
+    Thread-safe, TTL-based persistent cache for TMDB JSON responses.
+
+    Entries are stored as ``(timestamp, data)`` pairs keyed by request
+    identifier. Expired entries are treated as misses and overwritten on the
+    next successful request.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR, ttl: int = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache database (created if missing)
+            ttl: Time-to-live for entries in seconds
+        """
+        self.logger = get_logger("tmdb_cache")
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db: Optional[shelve.Shelf] = None
+        self._lock_file: Optional[IO[bytes]] = None
+        self._disabled = False
+
+    def _open(self) -> Optional[shelve.Shelf]:
+        """
+        Open the underlying database on first use.
+
+        Returns:
+            Open shelf, or None if the cache could not be opened
+        """
+        if self._db is None and not self._disabled:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                lock_file = open(self.cache_dir / "responses.lock", "a+b")
+                if not _try_lock_exclusive(lock_file):
+                    lock_file.close()
+                    self.logger.info(
+                        f"TMDB response cache at {self.cache_dir} is in use by another process; "
+                        "running without it"
+                    )
+                    self._disabled = True
+                    return None
+                self._lock_file = lock_file
+                self._db = shelve.open(str(self.cache_dir / "responses"))
+            except Exception as e:
+                self.logger.warning(f"Disabling TMDB response cache at {self.cache_dir}: {e}")
+                self._release_lock()
+                self._disabled = True
+        return self._db
+
+    def _release_lock(self) -> None:
+        """Release the inter-process lock, if held (closing the file drops the lock)."""
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Request identifier
+
+        Returns:
+            Cached response data, or None if missing or expired
+        """
+        with self._lock:
+            db = self._open()
+            if db is None:
+                return None
+            try:
+                entry = db.get(key)
+            except Exception as e:
+                self.logger.warning(f"Failed to read cache entry {key}: {e}")
+                return None
+
+        if entry is None:
+            return None
+
+        stored_at, data = entry
+        if time.time() - stored_at > self.ttl:
+            return None
+        return data
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Request identifier
+            data: Response data to cache
+        """
+        with self._lock:
+            db = self._open()
+            if db is None:
+                return
+            try:
+                db[key] = (time.time(), data)
+            except Exception as e:
+                self.logger.warning(f"Failed to write cache entry {key}: {e}")
+
+    def close(self) -> None:
+        """Flush and close the underlying database."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            self._release_lock()
+
+
+_cache_instances: Dict[Path, TMDBCache] = {}
+_cache_instances_lock = threading.Lock()
+
+
+def get_tmdb_cache(cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR, ttl: int = 3600) -> TMDBCache:
+    """
+    Get the shared cache instance for a directory.
+
+    A database file can only be opened once per process, so all clients
+    using the same directory share one instance.
+
+    Args:
+        cache_dir: Directory holding the cache database
+        ttl: Time-to-live for entries in seconds
+
+    Returns:
+        TMDBCache instance
+    """
+    path = Path(cache_dir).expanduser()
+    with _cache_instances_lock:
+        cache = _cache_instances.get(path)
+        if cache is None:
+            cache = TMDBCache(path, ttl=ttl)
+            _cache_instances[path] = cache
+            # Some dbm backends only persist their index on close
+            atexit.register(cache.close)
+        else:
+            cache.ttl = ttl
+        return cache
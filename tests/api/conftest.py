@@ -3,12 +3,18 @@ Pytest configuration and fixtures for real API tests.
 
 This module provides fixtures for tests that use the actual TMDB API.
 All fixtures automatically load the API key from .env file or environment.
+Service modules are imported inside the fixtures, so collecting (or
+deselecting) these tests does not import the API client and services.
 
 Fixtures:
     - tmdb_api_key: Loads API key from environment/env file
     - real_tmdb_client: Creates a real TMDBClient instance
     - real_movie_service: Creates MovieService with real API
     - real_recommendation_service: Creates RecommendationService with real API
+    - real_top_movies_2020: Top 5 movies of 2020, fetched once per session
+      (or reused from the pytest cache with --use-tmdb-cache)
+    - real_endpoint_responses: One response per TMDB endpoint, fetched concurrently
+      (or replayed from the pytest cache with --use-tmdb-cache)
     - real_export_service: Creates ExportService with temp directory
 """
 
@@ -16,22 +22,22 @@ import os
 from pathlib import Path
 
 import pytest
-from dotenv import load_dotenv
 
-from src.api.TMDB import TMDBClient
-from src.services.export_service import ExportService
-from src.services.movie_service import MovieService
-from src.services.movie_recommendation_engine import RecommendationService
+from src.api.rate_limiter import RateLimiter
+from src.utils.concurrency import parallel_map
+from src.utils.config import load_env_file
 
 
 # Load .env file before checking for API key
 _project_root = Path(__file__).parent.parent.parent
-_env_file = _project_root / ".env"
-if _env_file.exists():
-    load_dotenv(_env_file)
+load_env_file(_project_root / ".env")
 
+# pytest cache keys used with --use-tmdb-cache
+TOP_MOVIES_2020_CACHE_KEY = "tmdb/top_2020"
+ENDPOINT_RESPONSES_CACHE_KEY = "tmdb/endpoint_responses"
 
-@pytest.fixture(scope="module")
+
+@pytest.fixture(scope="session")
 def tmdb_api_key():
     """
     Get TMDB API key from environment variable or .env file.
@@ -48,21 +54,40 @@ def tmdb_api_key():
     return api_key
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def real_tmdb_client(tmdb_api_key):
     """
     Create a real TMDB client instance using the actual API key.
+
+    The client (and its pooled HTTP session) is shared by the whole test
+    session, so keep-alive connections are reused across test modules.
     
     Args:
         tmdb_api_key: TMDB API key from environment
         
-    Returns:
+    Yields:
         TMDBClient instance
     """
-    return TMDBClient(api_key=tmdb_api_key)
+    from src.api.TMDB import TMDBClient
+
+    # Real API tests must hit TMDB, not the on-disk response cache (which is also
+    # single-process and would be contended by pytest-xdist workers)
+    client = TMDBClient(api_key=tmdb_api_key, use_cache=False)
 
+    # Under pytest-xdist every worker process has its own rate limiter, so split
+    # the request budget between workers to stay within TMDB's limit overall
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    if workers > 1:
+        client.rate_limiter = RateLimiter(
+            max(1, client.config.rate_limit_requests // workers),
+            client.config.rate_limit_period,
+        )
 
-@pytest.fixture(scope="module")
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
 def real_movie_service(real_tmdb_client):
     """
     Create a real MovieService instance with real TMDB client.
@@ -73,10 +98,12 @@ def real_movie_service(real_tmdb_client):
     Returns:
         MovieService instance
     """
+    from src.services.movie_service import MovieService
+
     return MovieService(tmdb_client=real_tmdb_client)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def real_recommendation_service(real_tmdb_client):
     """
     Create a real RecommendationService instance with real TMDB client.
@@ -87,9 +114,96 @@ def real_recommendation_service(real_tmdb_client):
     Returns:
         RecommendationService instance
     """
+    from src.services.movie_recommendation_engine import RecommendationService
+
     return RecommendationService(tmdb_client=real_tmdb_client)
 
 
+@pytest.fixture(scope="session")
+def real_top_movies_2020(request, real_movie_service):
+    """
+    Fetch the top 5 movies of 2020 once and share them across all real API tests.
+
+    With ``--use-tmdb-cache`` the movies are stored in the pytest cache
+    (``.pytest_cache``) and reused by later runs instead of being fetched again;
+    clear them with ``--cache-clear``.
+
+    Tests must not mutate the returned list; slice it to use fewer movies.
+
+    Args:
+        request: Pytest fixture request, used to reach the pytest cache
+        real_movie_service: MovieService instance using the real API
+
+    Returns:
+        List of the top 5 Movie models from 2020 by vote count
+    """
+    from src.models.Movies import Movie
+
+    use_cache = request.config.getoption("--use-tmdb-cache")
+    if use_cache:
+        cached = request.config.cache.get(TOP_MOVIES_2020_CACHE_KEY, None)
+        if cached is not None:
+            return [Movie(**data) for data in cached]
+
+    movies = real_movie_service.get_top_movies_by_year(
+        year=2020,
+        top_n=5,
+        min_vote_count=100,
+        min_vote_average=6.0
+    )
+
+    if use_cache:
+        request.config.cache.set(
+            TOP_MOVIES_2020_CACHE_KEY, [movie.model_dump(mode="json") for movie in movies]
+        )
+    return movies
+
+
+@pytest.fixture(scope="session")
+def real_endpoint_responses(request, real_tmdb_client):
+    """
+    Fetch one response from each TMDB endpoint concurrently, once per session.
+
+    Per-movie endpoints use The Matrix (ID 603); the discover endpoints use
+    2020 movies with at least 100 votes and a 6.0 average. The requests are
+    independent, so they are issued together on worker threads (sharing the
+    client's connection pool and rate limiter) and the tests only wait for
+    the slowest one.
+
+    With ``--use-tmdb-cache`` a complete set of responses is stored in the
+    pytest cache and replayed by later runs without any network requests.
+
+    Args:
+        request: Pytest fixture request, used to reach the pytest cache
+        real_tmdb_client: TMDB client using the real API
+
+    Returns:
+        Dictionary of raw responses keyed by TMDBClient method name
+    """
+    use_cache = request.config.getoption("--use-tmdb-cache")
+    if use_cache:
+        cached = request.config.cache.get(ENDPOINT_RESPONSES_CACHE_KEY, None)
+        if cached is not None:
+            return cached
+
+    movie_id = 603
+    discover_filters = {"year": 2020, "min_vote_count": 100, "min_vote_average": 6.0, "page": 1}
+    fetchers = {
+        "get_movies_by_year": lambda: real_tmdb_client.get_movies_by_year(**discover_filters),
+        "discover_movies": lambda: real_tmdb_client.discover_movies(with_genres=28, **discover_filters),
+        "get_movie_details": lambda: real_tmdb_client.get_movie_details(movie_id),
+        "get_movie_keywords": lambda: real_tmdb_client.get_movie_keywords(movie_id),
+        "get_similar_movies": lambda: real_tmdb_client.get_similar_movies(movie_id, page=1),
+        "get_movie_recommendations": lambda: real_tmdb_client.get_movie_recommendations(movie_id, page=1),
+    }
+    responses = dict(zip(fetchers, parallel_map(lambda fetch: fetch(), list(fetchers.values()), len(fetchers))))
+
+    # Only record complete sets, so a failed request is retried on the next run
+    if use_cache and all(response is not None for response in responses.values()):
+        request.config.cache.set(ENDPOINT_RESPONSES_CACHE_KEY, responses)
+    return responses
+
+
 @pytest.fixture
 def real_export_service(tmp_path):
     """
@@ -101,6 +215,8 @@ def real_export_service(tmp_path):
     Returns:
         ExportService instance
     """
+    from src.services.export_service import ExportService
+
     output_dir = tmp_path / "api_test_output"
     output_dir.mkdir(parents=True, exist_ok=True)
     return ExportService(output_dir=str(output_dir))
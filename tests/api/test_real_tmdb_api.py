@@ -22,14 +22,12 @@ Note:
 """
 
 import csv
+from operator import itemgetter
 from pathlib import Path
 
 import pytest
 
-from src.api.TMDB import TMDBClient
-from src.services.export_service import ExportService
-from src.services.movie_service import MovieService
-from src.services.movie_recommendation_engine import MovieRecommendationEngine
+from tests.conftest import _flatten_similar_movies_for_export, _is_sorted
 
 
 @pytest.mark.api
@@ -43,102 +41,48 @@ class TestRealTMDBAPI:
         assert real_tmdb_client.api_key is not None
         assert real_tmdb_client.base_url == "https://api.themoviedb.org/3"
 
-    def test_real_api_get_movies_by_year(self, real_tmdb_client):
-        """Test getting movies from a real year using the actual API."""
-        # Test with a known year with many movies
-        year = 2020
-        response = real_tmdb_client.get_movies_by_year(
-            year=year,
-            min_vote_count=100,
-            min_vote_average=6.0,
-            page=1
-        )
-        
-        assert response is not None
-        assert "results" in response
-        assert "page" in response
-        assert "total_pages" in response
-        assert len(response["results"]) > 0
-        
-        # Verify movie structure
-        movie = response["results"][0]
-        assert "id" in movie
-        assert "title" in movie
-        assert "release_date" in movie
-        assert "vote_count" in movie
-        assert "vote_average" in movie
-
-    def test_real_api_get_movie_details(self, real_tmdb_client):
-        """Test getting movie details using the actual API."""
-        # Test with a known movie ID (The Matrix)
-        movie_id = 603
-        response = real_tmdb_client.get_movie_details(movie_id)
-        
-        assert response is not None
-        assert response["id"] == movie_id
-        assert "title" in response
-        assert "overview" in response
-        assert "genres" in response
-        assert "release_date" in response
-
-    def test_real_api_get_movie_keywords(self, real_tmdb_client):
-        """Test getting movie keywords using the actual API."""
-        # Test with a known movie ID (The Matrix)
-        movie_id = 603
-        response = real_tmdb_client.get_movie_keywords(movie_id)
-        
-        assert response is not None
-        assert "id" in response
-        assert "keywords" in response
-        assert isinstance(response["keywords"], list)
+    @pytest.mark.parametrize(
+        "endpoint, required_keys, item_keys, require_items",
+        [
+            (
+                "get_movies_by_year",
+                {"results", "page", "total_pages"},
+                {"id", "title", "release_date", "vote_count", "vote_average"},
+                True,
+            ),
+            # Action movies (genre ID 28)
+            ("discover_movies", {"results"}, {"id", "title"}, False),
+            ("get_movie_details", {"id", "title", "overview", "genres", "release_date"}, set(), False),
+            ("get_movie_keywords", {"id", "keywords"}, set(), False),
+            ("get_similar_movies", {"results"}, {"id", "title"}, True),
+            # Recommendations may be empty for some movies
+            ("get_movie_recommendations", {"results"}, {"id", "title"}, False),
+        ],
+    )
+    def test_real_api_endpoint_response(
+        self, real_endpoint_responses, endpoint, required_keys, item_keys, require_items
+    ):
+        """Test the response shape of each TMDB endpoint using the actual API."""
+        response = real_endpoint_responses[endpoint]
 
-    def test_real_api_get_similar_movies(self, real_tmdb_client):
-        """Test getting similar movies using the actual API."""
-        # Test with a known movie ID (The Matrix)
-        movie_id = 603
-        response = real_tmdb_client.get_similar_movies(movie_id, page=1)
-        
         assert response is not None
-        assert "results" in response
-        assert len(response["results"]) > 0
-        
-        # Verify similar movie structure
-        similar_movie = response["results"][0]
-        assert "id" in similar_movie
-        assert "title" in similar_movie
-        assert similar_movie["id"] != movie_id  # Should be different from original
-
-    def test_real_api_get_movie_recommendations(self, real_tmdb_client):
-        """Test getting movie recommendations using the actual API."""
-        # Test with a known movie ID (The Matrix)
+        assert required_keys <= response.keys()
+
+        if "results" in response:
+            results = response["results"]
+            if require_items:
+                assert len(results) > 0
+            if results:
+                assert item_keys <= results[0].keys()
+
+    def test_real_api_per_movie_endpoints(self, real_endpoint_responses):
+        """Test that per-movie endpoints describe The Matrix (ID 603) and not other movies."""
         movie_id = 603
-        response = real_tmdb_client.get_movie_recommendations(movie_id, page=1)
-        
-        assert response is not None
-        assert "results" in response
-        # Recommendations may be empty for some movies
-        if len(response["results"]) > 0:
-            recommended_movie = response["results"][0]
-            assert "id" in recommended_movie
-            assert "title" in recommended_movie
-
-    def test_real_api_discover_movies_with_genre(self, real_tmdb_client):
-        """Test discovering movies with genre filter using the actual API."""
-        # Test with Action genre (ID: 28)
-        response = real_tmdb_client.discover_movies(
-            year=2020,
-            min_vote_count=100,
-            min_vote_average=6.0,
-            with_genres=28,  # Action
-            page=1
-        )
-        
-        assert response is not None
-        assert "results" in response
-        if len(response["results"]) > 0:
-            movie = response["results"][0]
-            assert "id" in movie
-            assert "title" in movie
+
+        assert real_endpoint_responses["get_movie_details"]["id"] == movie_id
+        assert isinstance(real_endpoint_responses["get_movie_keywords"]["keywords"], list)
+        # Similar movies should be different from the original
+        assert real_endpoint_responses["get_similar_movies"]["results"][0]["id"] != movie_id
 
 
 @pytest.mark.api
@@ -147,17 +91,12 @@ class TestRealTMDBAPI:
 class TestRealMovieService:
     """Tests for MovieService using the real TMDB API."""
 
-    def test_real_get_top_movies_by_year(self, real_movie_service):
+    def test_real_get_top_movies_by_year(self, real_top_movies_2020):
         """Test getting top movies from a real year using the actual API."""
         year = 2020
         top_n = 5
         
-        movies = real_movie_service.get_top_movies_by_year(
-            year=year,
-            top_n=top_n,
-            min_vote_count=100,
-            min_vote_average=6.0
-        )
+        movies = real_top_movies_2020
         
         assert len(movies) == top_n
         assert all(movie.release_year == year for movie in movies)
@@ -166,16 +105,16 @@ class TestRealMovieService:
         
         # Verify movies are sorted by vote count (descending)
         vote_counts = [movie.vote_count for movie in movies]
-        assert vote_counts == sorted(vote_counts, reverse=True)
+        assert _is_sorted(vote_counts, reverse=True)
 
-    def test_real_export_top_movies_to_csv(self, real_movie_service, tmp_path):
+    def test_real_export_top_movies_to_csv(self, real_movie_service, real_export_service, monkeypatch):
         """Test exporting top movies to CSV using the actual API."""
         year = 2020
         top_n = 3
         filename = "real_api_test_movies.csv"
         
-        # Update export service to use tmp_path
-        real_movie_service.export_service = ExportService(output_dir=str(tmp_path))
+        # Export to the temporary directory (restored after the test, since the service is shared)
+        monkeypatch.setattr(real_movie_service, "export_service", real_export_service)
         
         movies, csv_path = real_movie_service.get_and_export_top_movies(
             year=year,
@@ -186,62 +125,58 @@ class TestRealMovieService:
         )
         
         assert len(movies) == top_n
-        assert Path(csv_path).exists()
+        csv_file = Path(csv_path)
+        assert csv_file.exists()
         
-        # Verify CSV content
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        # Verify CSV content (plain rows indexed by header position, no per-row dicts)
+        with csv_file.open("r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            get_fields = itemgetter(*(header.index(name) for name in ("sort_method", "title", "vote_count")))
+            triples = [get_fields(row) for row in reader]
         
         # Should have top_n * 3 rows (3 sort methods)
-        assert len(rows) == top_n * 3
+        assert len(triples) == top_n * 3
+        
+        # Collect sort methods, titles and the votes section in a single pass over the rows
+        sort_methods, titles, votes = set(), set(), []
+        for sort_method, title, vote_count in triples:
+            sort_methods.add(sort_method)
+            titles.add(title)
+            if sort_method == "votes":
+                votes.append(int(vote_count))
         
         # Verify all sort methods are present
-        sort_methods = {row["sort_method"] for row in rows}
         assert "votes" in sort_methods
         assert "name" in sort_methods
         assert "name_no_articles" in sort_methods
         
-        # Verify movies are present
-        titles = {row["title"] for row in rows}
+        # Verify movies are present and the votes section is ordered
         assert len(titles) == top_n
+        assert _is_sorted(votes, reverse=True)
 
-    def test_real_sort_movies_by_name_with_articles(self, real_movie_service):
+    def test_real_sort_movies_by_name_with_articles(self, real_movie_service, real_top_movies_2020):
         """Test sorting movies by name (with articles) using real API data."""
-        year = 2020
-        movies = real_movie_service.get_top_movies_by_year(
-            year=year,
-            top_n=5,
-            min_vote_count=100,
-            min_vote_average=6.0
-        )
+        movies = real_top_movies_2020
         
         # Sort by name with articles
         sorted_movies = real_movie_service.sort_movies_by_name(movies, ignore_articles=False)
         
         # Verify sorting
         titles = [movie.title for movie in sorted_movies]
-        assert titles == sorted(titles)
+        assert _is_sorted(titles)
 
-    def test_real_sort_movies_by_name_without_articles(self, real_movie_service):
+    def test_real_sort_movies_by_name_without_articles(self, real_movie_service, real_top_movies_2020):
         """Test sorting movies by name (without articles) using real API data."""
-        year = 2020
-        movies = real_movie_service.get_top_movies_by_year(
-            year=year,
-            top_n=5,
-            min_vote_count=100,
-            min_vote_average=6.0
-        )
+        movies = real_top_movies_2020
         
         # Sort by name without articles
         sorted_movies = real_movie_service.sort_movies_by_name(movies, ignore_articles=True)
         
-        # Verify sorting (normalized titles should be alphabetical)
-        normalized_titles = [
-            movie.normalize_title_for_sorting(ignore_articles=True).lower()
-            for movie in sorted_movies
-        ]
-        assert normalized_titles == sorted(normalized_titles)
+        # Verify sorting (normalized titles should be alphabetical); sort_key reuses
+        # the normalized title already computed by sort_movies_by_name
+        normalized_titles = [movie.sort_key(ignore_articles=True) for movie in sorted_movies]
+        assert _is_sorted(normalized_titles)
 
 
 @pytest.mark.api
@@ -250,16 +185,10 @@ class TestRealMovieService:
 class TestRealRecommendationService:
     """Tests for RecommendationService using the real TMDB API."""
 
-    def test_real_find_similar_movies(self, real_recommendation_service, real_movie_service):
+    def test_real_find_similar_movies(self, real_recommendation_service, real_top_movies_2020):
         """Test finding similar movies using the actual API."""
         # Get a real movie first
-        year = 2020
-        movies = real_movie_service.get_top_movies_by_year(
-            year=year,
-            top_n=1,
-            min_vote_count=100,
-            min_vote_average=6.0
-        )
+        movies = real_top_movies_2020[:1]
         
         if not movies:
             pytest.skip("No movies found for testing")
@@ -291,16 +220,10 @@ class TestRealRecommendationService:
                 # Verify similar movie is different from original
                 assert similar["similar_movie"].id != original_movie.id
 
-    def test_real_get_similar_movies_for_multiple(self, real_recommendation_service, real_movie_service):
+    def test_real_get_similar_movies_for_multiple(self, real_recommendation_service, real_top_movies_2020):
         """Test getting similar movies for multiple movies using the actual API."""
         # Get real movies
-        year = 2020
-        movies = real_movie_service.get_top_movies_by_year(
-            year=year,
-            top_n=2,
-            min_vote_count=100,
-            min_vote_average=6.0
-        )
+        movies = real_top_movies_2020[:2]
         
         if len(movies) < 2:
             pytest.skip("Not enough movies found for testing")
@@ -329,13 +252,13 @@ class TestRealRecommendationService:
 class TestRealCompleteWorkflow:
     """End-to-end tests using the real TMDB API."""
 
-    def test_real_complete_workflow_top_movies(self, real_movie_service, tmp_path):
+    def test_real_complete_workflow_top_movies(self, real_movie_service, real_export_service, monkeypatch):
         """Test complete workflow: get top movies and export to CSV using real API."""
         year = 2020
         top_n = 5
         
-        # Update export service to use tmp_path
-        real_movie_service.export_service = ExportService(output_dir=str(tmp_path))
+        # Export to the temporary directory (restored after the test, since the service is shared)
+        monkeypatch.setattr(real_movie_service, "export_service", real_export_service)
         
         # Get and export top movies
         movies, csv_path = real_movie_service.get_and_export_top_movies(
@@ -346,39 +269,27 @@ class TestRealCompleteWorkflow:
             min_vote_average=6.0
         )
         
-        # Verify results
+        # Verify results (CSV layout is checked in test_real_export_top_movies_to_csv)
         assert len(movies) == top_n
-        assert Path(csv_path).exists()
-        
-        # Verify CSV has all three sort methods
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        
-        assert len(rows) == top_n * 3
-        sort_methods = {row["sort_method"] for row in rows}
-        assert sort_methods == {"votes", "name", "name_no_articles"}
+        assert Path(csv_path).stat().st_size > 0
         
         # Verify votes are sorted correctly
-        votes_rows = [r for r in rows if r["sort_method"] == "votes"]
-        vote_counts = [int(r["vote_count"]) for r in votes_rows]
-        assert vote_counts == sorted(vote_counts, reverse=True)
+        vote_counts = [movie.vote_count for movie in movies]
+        assert _is_sorted(vote_counts, reverse=True)
         
         # Verify name sorting (with articles)
-        name_rows = [r for r in rows if r["sort_method"] == "name"]
-        titles = [r["title"] for r in name_rows]
-        assert titles == sorted(titles)
+        titles = [movie.title for movie in real_movie_service.sort_movies_by_name(movies)]
+        assert _is_sorted(titles)
 
     def test_real_complete_workflow_with_similar_movies(
-        self, real_movie_service, real_recommendation_service, tmp_path
+        self, real_movie_service, real_recommendation_service, real_export_service, monkeypatch
     ):
         """Test complete workflow with similar movies using real API."""
         year = 2020
         top_n = 3
         
-        # Update export service to use tmp_path
-        real_movie_service.export_service = ExportService(output_dir=str(tmp_path))
-        export_service = ExportService(output_dir=str(tmp_path))
+        # Export to the temporary directory (restored after the test, since the service is shared)
+        monkeypatch.setattr(real_movie_service, "export_service", real_export_service)
         
         # Get top movies
         movies, movies_csv_path = real_movie_service.get_and_export_top_movies(
@@ -402,35 +313,24 @@ class TestRealCompleteWorkflow:
         # May have 0 results if API doesn't return similar movies
         if len(similar_movies_data) > 0:
             # Prepare for export (flatten the data)
-            export_data = []
-            for item in similar_movies_data:
-                original_movie = item.get("original_movie")
-                similar_movies = item.get("similar_movies", [])
-                for similar_entry in similar_movies:
-                    export_data.append({
-                        "original_movie": original_movie,
-                        "similar_movie": similar_entry.get("similar_movie"),
-                        "similarity_score": similar_entry.get("similarity_score"),
-                        "similarity_reason": similar_entry.get("similarity_reason"),
-                        "similarity_metrics": similar_entry.get("similarity_metrics", {}),
-                    })
+            export_data = _flatten_similar_movies_for_export(similar_movies_data)
             
             if len(export_data) > 0:
                 # Export similar movies
-                similar_csv_path = export_service.export_similar_movies_to_csv(
+                similar_csv_path = real_export_service.export_similar_movies_to_csv(
                     similar_movies_data=export_data,
                     filename="real_workflow_similar.csv",
                 )
                 
-                assert Path(similar_csv_path).exists()
+                similar_path = Path(similar_csv_path)
+                assert similar_path.exists()
                 
-                # Verify CSV structure
-                with open(similar_csv_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
+                # Verify CSV structure (only the first row is needed)
+                with similar_path.open("r", newline="", encoding="utf-8") as f:
+                    first = next(csv.DictReader(f), None)
                 
-                assert len(rows) > 0
-                assert "original_movie_id" in rows[0]
-                assert "similar_movie_id" in rows[0]
-                assert "similarity_score" in rows[0]
+                assert first is not None
+                assert "original_movie_id" in first
+                assert "similar_movie_id" in first
+                assert "similarity_score" in first
 
@@ -8,23 +8,58 @@ This module provides:
 - Utility functions for consistent test data
 """
 
+import copy
+import csv
 import os
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.models.Movies import Movie
+from src.utils.config import load_env_file
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--use-tmdb-cache",
+        action="store_true",
+        default=False,
+        help="Reuse real TMDB API results stored in the pytest cache by earlier runs",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """
+    Skip real API tests up front when no TMDB API key is available.
+
+    Marking them at collection time avoids setting up their session fixtures
+    only to skip inside tmdb_api_key.
+
+    Args:
+        config: Pytest configuration
+        items: Collected test items
+    """
+    load_env_file(Path(__file__).parent.parent / ".env")
+    if os.getenv("TMDB_API_KEY"):
+        return
+
+    skip_api = pytest.mark.skip(reason="TMDB_API_KEY not found in environment or .env file")
+    for item in items:
+        if item.get_closest_marker("api") is not None:
+            item.add_marker(skip_api)
 
 
 # ============================================================================
 # Mock API Response Fixtures
 # ============================================================================
 
-@pytest.fixture
-def mock_tmdb_api_response() -> Dict[str, Any]:
-    """Mock TMDB API response for discover/movie endpoint."""
+@pytest.fixture(scope="session")
+def _mock_tmdb_api_response_data() -> Dict[str, Any]:
+    """Mock TMDB API response for discover/movie endpoint (built once per session)."""
     return {
         "page": 1,
         "results": [
@@ -82,10 +117,167 @@ def mock_tmdb_api_response() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def mock_tmdb_api_response(_mock_tmdb_api_response_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Mock TMDB API response for discover/movie endpoint (a fresh copy per test)."""
+    return copy.deepcopy(_mock_tmdb_api_response_data)
+
+
 # ============================================================================
 # Helper Functions for Dynamic Mock Data
 # ============================================================================
 
+_MOVIE_DETAILS_BY_ID: Dict[int, Dict[str, Any]] = {
+    1: {
+        "id": 1,
+        "title": "The Matrix",
+        "release_date": "1999-03-31",
+        "vote_count": 25000,
+        "vote_average": 8.7,
+        "popularity": 85.5,
+        "overview": "A computer hacker learns about the true nature of reality",
+        "poster_path": "/poster1.jpg",
+        "backdrop_path": "/backdrop1.jpg",
+        "adult": False,
+        "original_language": "en",
+        "original_title": "The Matrix",
+        "video": False,
+        "genres": [
+            {"id": 28, "name": "Action"},
+            {"id": 878, "name": "Science Fiction"},
+        ],
+        "runtime": 136,
+        "status": "Released",
+        "tagline": "Welcome to the Real World",
+        "budget": 63000000,
+        "revenue": 467200000,
+        "homepage": "https://www.warnerbros.com/movies/matrix",
+        "imdb_id": "tt0133093",
+        "production_companies": [],
+        "production_countries": [],
+        "spoken_languages": [],
+    },
+    2: {
+        "id": 2,
+        "title": "Inception",
+        "release_date": "1999-07-16",  # Changed to 1999 for testing
+        "vote_count": 30000,
+        "vote_average": 8.8,
+        "popularity": 90.2,
+        "overview": "A skilled thief is given a chance at redemption",
+        "poster_path": "/poster2.jpg",
+        "backdrop_path": "/backdrop2.jpg",
+        "adult": False,
+        "original_language": "en",
+        "original_title": "Inception",
+        "video": False,
+        "genres": [
+            {"id": 28, "name": "Action"},
+            {"id": 878, "name": "Science Fiction"},
+            {"id": 53, "name": "Thriller"},
+        ],
+        "runtime": 148,
+        "status": "Released",
+        "tagline": "Your mind is the scene of the crime",
+        "budget": 160000000,
+        "revenue": 825500000,
+        "homepage": "https://www.warnerbros.com/movies/inception",
+        "imdb_id": "tt1375666",
+        "production_companies": [],
+        "production_countries": [],
+        "spoken_languages": [],
+    },
+    3: {
+        "id": 3,
+        "title": "A Beautiful Mind",
+        "release_date": "1999-12-21",  # Changed to 1999 for testing
+        "vote_count": 20000,
+        "vote_average": 8.2,
+        "popularity": 75.3,
+        "overview": "A mathematical genius",
+        "poster_path": "/poster3.jpg",
+        "backdrop_path": "/backdrop3.jpg",
+        "adult": False,
+        "original_language": "en",
+        "original_title": "A Beautiful Mind",
+        "video": False,
+        "genres": [
+            {"id": 18, "name": "Drama"},
+            {"id": 36, "name": "History"},
+        ],
+        "runtime": 135,
+        "status": "Released",
+        "tagline": "A Beautiful Mind",
+        "budget": 58000000,
+        "revenue": 313500000,
+        "homepage": "https://www.universalstudios.com/movies/a-beautiful-mind",
+        "imdb_id": "tt0268978",
+        "production_companies": [],
+        "production_countries": [],
+        "spoken_languages": [],
+    },
+    4: {
+        "id": 4,
+        "title": "The Matrix Reloaded",
+        "release_date": "2003-05-15",
+        "vote_count": 15000,
+        "vote_average": 7.2,
+        "popularity": 70.0,
+        "overview": "Neo and his allies continue the fight",
+        "poster_path": "/poster4.jpg",
+        "backdrop_path": "/backdrop4.jpg",
+        "adult": False,
+        "original_language": "en",
+        "original_title": "The Matrix Reloaded",
+        "video": False,
+        "genres": [
+            {"id": 28, "name": "Action"},
+            {"id": 878, "name": "Science Fiction"},
+        ],
+        "runtime": 138,
+        "status": "Released",
+        "tagline": "Free your mind",
+        "budget": 150000000,
+        "revenue": 742100000,
+        "homepage": "https://www.warnerbros.com/movies/matrix-reloaded",
+        "imdb_id": "tt0234215",
+        "production_companies": [],
+        "production_countries": [],
+        "spoken_languages": [],
+    },
+    5: {
+        "id": 5,
+        "title": "Blade Runner",
+        "release_date": "1982-06-25",
+        "vote_count": 18000,
+        "vote_average": 8.1,
+        "popularity": 65.0,
+        "overview": "A blade runner must pursue and terminate replicants",
+        "poster_path": "/poster5.jpg",
+        "backdrop_path": "/backdrop5.jpg",
+        "adult": False,
+        "original_language": "en",
+        "original_title": "Blade Runner",
+        "video": False,
+        "genres": [
+            {"id": 28, "name": "Action"},
+            {"id": 878, "name": "Science Fiction"},
+            {"id": 9648, "name": "Mystery"},
+        ],
+        "runtime": 117,
+        "status": "Released",
+        "tagline": "Man has made his match... now it's his problem.",
+        "budget": 28000000,
+        "revenue": 41600000,
+        "homepage": "https://www.warnerbros.com/movies/blade-runner",
+        "imdb_id": "tt0083658",
+        "production_companies": [],
+        "production_countries": [],
+        "spoken_languages": [],
+    },
+}
+
+
 def _get_movie_details_by_id(movie_id: int) -> Dict[str, Any]:
     """
     Helper function to get movie details by ID for testing.
@@ -94,158 +286,54 @@ def _get_movie_details_by_id(movie_id: int) -> Dict[str, Any]:
         movie_id: TMDB movie ID
 
     Returns:
-        Mock movie details dictionary
+        Mock movie details dictionary (a fresh shallow copy, since enrichment
+        adds top-level keys to responses but never modifies nested values)
     """
-    movies = {
-        1: {
-            "id": 1,
-            "title": "The Matrix",
-            "release_date": "1999-03-31",
-            "vote_count": 25000,
-            "vote_average": 8.7,
-            "popularity": 85.5,
-            "overview": "A computer hacker learns about the true nature of reality",
-            "poster_path": "/poster1.jpg",
-            "backdrop_path": "/backdrop1.jpg",
-            "adult": False,
-            "original_language": "en",
-            "original_title": "The Matrix",
-            "video": False,
-            "genres": [
-                {"id": 28, "name": "Action"},
-                {"id": 878, "name": "Science Fiction"},
-            ],
-            "runtime": 136,
-            "status": "Released",
-            "tagline": "Welcome to the Real World",
-            "budget": 63000000,
-            "revenue": 467200000,
-            "homepage": "https://www.warnerbros.com/movies/matrix",
-            "imdb_id": "tt0133093",
-            "production_companies": [],
-            "production_countries": [],
-            "spoken_languages": [],
-        },
-        2: {
-            "id": 2,
-            "title": "Inception",
-            "release_date": "1999-07-16",  # Changed to 1999 for testing
-            "vote_count": 30000,
-            "vote_average": 8.8,
-            "popularity": 90.2,
-            "overview": "A skilled thief is given a chance at redemption",
-            "poster_path": "/poster2.jpg",
-            "backdrop_path": "/backdrop2.jpg",
-            "adult": False,
-            "original_language": "en",
-            "original_title": "Inception",
-            "video": False,
-            "genres": [
-                {"id": 28, "name": "Action"},
-                {"id": 878, "name": "Science Fiction"},
-                {"id": 53, "name": "Thriller"},
-            ],
-            "runtime": 148,
-            "status": "Released",
-            "tagline": "Your mind is the scene of the crime",
-            "budget": 160000000,
-            "revenue": 825500000,
-            "homepage": "https://www.warnerbros.com/movies/inception",
-            "imdb_id": "tt1375666",
-            "production_companies": [],
-            "production_countries": [],
-            "spoken_languages": [],
-        },
-        3: {
-            "id": 3,
-            "title": "A Beautiful Mind",
-            "release_date": "1999-12-21",  # Changed to 1999 for testing
-            "vote_count": 20000,
-            "vote_average": 8.2,
-            "popularity": 75.3,
-            "overview": "A mathematical genius",
-            "poster_path": "/poster3.jpg",
-            "backdrop_path": "/backdrop3.jpg",
-            "adult": False,
-            "original_language": "en",
-            "original_title": "A Beautiful Mind",
-            "video": False,
-            "genres": [
-                {"id": 18, "name": "Drama"},
-                {"id": 36, "name": "History"},
-            ],
-            "runtime": 135,
-            "status": "Released",
-            "tagline": "A Beautiful Mind",
-            "budget": 58000000,
-            "revenue": 313500000,
-            "homepage": "https://www.universalstudios.com/movies/a-beautiful-mind",
-            "imdb_id": "tt0268978",
-            "production_companies": [],
-            "production_countries": [],
-            "spoken_languages": [],
-        },
-        4: {
-            "id": 4,
-            "title": "The Matrix Reloaded",
-            "release_date": "2003-05-15",
-            "vote_count": 15000,
-            "vote_average": 7.2,
-            "popularity": 70.0,
-            "overview": "Neo and his allies continue the fight",
-            "poster_path": "/poster4.jpg",
-            "backdrop_path": "/backdrop4.jpg",
-            "adult": False,
-            "original_language": "en",
-            "original_title": "The Matrix Reloaded",
-            "video": False,
-            "genres": [
-                {"id": 28, "name": "Action"},
-                {"id": 878, "name": "Science Fiction"},
-            ],
-            "runtime": 138,
-            "status": "Released",
-            "tagline": "Free your mind",
-            "budget": 150000000,
-            "revenue": 742100000,
-            "homepage": "https://www.warnerbros.com/movies/matrix-reloaded",
-            "imdb_id": "tt0234215",
-            "production_companies": [],
-            "production_countries": [],
-            "spoken_languages": [],
-        },
-        5: {
-            "id": 5,
-            "title": "Blade Runner",
-            "release_date": "1982-06-25",
-            "vote_count": 18000,
-            "vote_average": 8.1,
-            "popularity": 65.0,
-            "overview": "A blade runner must pursue and terminate replicants",
-            "poster_path": "/poster5.jpg",
-            "backdrop_path": "/backdrop5.jpg",
-            "adult": False,
-            "original_language": "en",
-            "original_title": "Blade Runner",
-            "video": False,
-            "genres": [
-                {"id": 28, "name": "Action"},
-                {"id": 878, "name": "Science Fiction"},
-                {"id": 9648, "name": "Mystery"},
-            ],
-            "runtime": 117,
-            "status": "Released",
-            "tagline": "Man has made his match... now it's his problem.",
-            "budget": 28000000,
-            "revenue": 41600000,
-            "homepage": "https://www.warnerbros.com/movies/blade-runner",
-            "imdb_id": "tt0083658",
-            "production_companies": [],
-            "production_countries": [],
-            "spoken_languages": [],
-        },
-    }
-    return movies.get(movie_id, movies[1])  # Default to movie 1 if not found
+    return dict(_MOVIE_DETAILS_BY_ID.get(movie_id, _MOVIE_DETAILS_BY_ID[1]))  # Default to movie 1 if not found
+
+
+_KEYWORDS_BY_ID: Dict[int, Dict[str, Any]] = {
+    1: {
+        "id": 1,
+        "keywords": [
+            {"id": 100, "name": "artificial intelligence"},
+            {"id": 101, "name": "virtual reality"},
+            {"id": 102, "name": "hacker"},
+        ],
+    },
+    2: {
+        "id": 2,
+        "keywords": [
+            {"id": 103, "name": "dream"},
+            {"id": 104, "name": "subconscious"},
+            {"id": 105, "name": "heist"},
+        ],
+    },
+    3: {
+        "id": 3,
+        "keywords": [
+            {"id": 106, "name": "mathematics"},
+            {"id": 107, "name": "genius"},
+            {"id": 108, "name": "schizophrenia"},
+        ],
+    },
+    4: {
+        "id": 4,
+        "keywords": [
+            {"id": 100, "name": "artificial intelligence"},
+            {"id": 101, "name": "virtual reality"},
+            {"id": 109, "name": "sequel"},
+        ],
+    },
+    5: {
+        "id": 5,
+        "keywords": [
+            {"id": 110, "name": "dystopia"},
+            {"id": 111, "name": "android"},
+            {"id": 112, "name": "noir"},
+        ],
+    },
+}
 
 
 def _get_keywords_by_id(movie_id: int) -> Dict[str, Any]:
@@ -256,51 +344,75 @@ def _get_keywords_by_id(movie_id: int) -> Dict[str, Any]:
         movie_id: TMDB movie ID
 
     Returns:
-        Mock keywords dictionary
+        Mock keywords dictionary (a fresh shallow copy, see _get_movie_details_by_id)
     """
-    keywords_map = {
-        1: {
-            "id": 1,
-            "keywords": [
-                {"id": 100, "name": "artificial intelligence"},
-                {"id": 101, "name": "virtual reality"},
-                {"id": 102, "name": "hacker"},
-            ],
-        },
-        2: {
-            "id": 2,
-            "keywords": [
-                {"id": 103, "name": "dream"},
-                {"id": 104, "name": "subconscious"},
-                {"id": 105, "name": "heist"},
-            ],
-        },
-        3: {
-            "id": 3,
-            "keywords": [
-                {"id": 106, "name": "mathematics"},
-                {"id": 107, "name": "genius"},
-                {"id": 108, "name": "schizophrenia"},
-            ],
-        },
-        4: {
-            "id": 4,
-            "keywords": [
-                {"id": 100, "name": "artificial intelligence"},
-                {"id": 101, "name": "virtual reality"},
-                {"id": 109, "name": "sequel"},
-            ],
-        },
-        5: {
-            "id": 5,
-            "keywords": [
-                {"id": 110, "name": "dystopia"},
-                {"id": 111, "name": "android"},
-                {"id": 112, "name": "noir"},
-            ],
-        },
-    }
-    return keywords_map.get(movie_id, keywords_map[1])  # Default to movie 1 if not found
+    return dict(_KEYWORDS_BY_ID.get(movie_id, _KEYWORDS_BY_ID[1]))  # Default to movie 1 if not found
+
+
+def _iter_similar_movies_for_export(similar_movies_data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Helper generator flattening similar movies results into ExportService rows lazily.
+
+    Args:
+        similar_movies_data: Results of find_similar_movies_for_each
+
+    Yields:
+        One dictionary per (original movie, similar movie) pair
+    """
+    for item in similar_movies_data:
+        original_movie = item["original_movie"]
+        for entry in item.get("similar_movies", ()):
+            yield {
+                "original_movie": original_movie,
+                "similar_movie": entry["similar_movie"],
+                "similarity_score": entry["similarity_score"],
+                "similarity_reason": entry["similarity_reason"],
+                "similarity_metrics": entry.get("similarity_metrics") or {},
+            }
+
+
+def _flatten_similar_movies_for_export(similar_movies_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Helper function to flatten similar movies results into a list of ExportService rows.
+
+    Args:
+        similar_movies_data: Results of find_similar_movies_for_each
+
+    Returns:
+        One dictionary per (original movie, similar movie) pair
+    """
+    return list(_iter_similar_movies_for_export(similar_movies_data))
+
+
+def _read_csv_rows(path: Union[str, Path]) -> List[Dict[str, str]]:
+    """
+    Read an exported CSV file into a list of row dictionaries.
+
+    Args:
+        path: Path to the CSV file
+
+    Returns:
+        List of rows keyed by the header fields
+    """
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _is_sorted(values: Sequence[Any], reverse: bool = False) -> bool:
+    """
+    Helper function to check ordering with one linear scan over adjacent pairs.
+
+    Args:
+        values: Values to check
+        reverse: Whether values should be in descending order
+
+    Returns:
+        True if values are sorted (ascending, or descending if reverse is set)
+    """
+    pairs = zip(values, islice(values, 1, None))
+    if reverse:
+        return all(a >= b for a, b in pairs)
+    return all(a <= b for a, b in pairs)
 
 
 @pytest.fixture
@@ -315,9 +427,9 @@ def mock_keywords_response() -> Dict[str, Any]:
     return _get_keywords_by_id(1)
 
 
-@pytest.fixture
-def mock_similar_movies_response() -> Dict[str, Any]:
-    """Mock TMDB API response for similar movies endpoint."""
+@pytest.fixture(scope="session")
+def _mock_similar_movies_response_data() -> Dict[str, Any]:
+    """Mock TMDB API response for similar movies endpoint (built once per session)."""
     return {
         "page": 1,
         "results": [
@@ -359,21 +471,27 @@ def mock_similar_movies_response() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def mock_similar_movies_response(_mock_similar_movies_response_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Mock TMDB API response for similar movies endpoint (a fresh copy per test)."""
+    return copy.deepcopy(_mock_similar_movies_response_data)
+
+
 # ============================================================================
 # Sample Movie Data Fixtures
 # ============================================================================
 
-@pytest.fixture
-def sample_movies() -> List[Movie]:
+@pytest.fixture(scope="session")
+def _sample_movies_data() -> Tuple[Movie, ...]:
     """
-    Sample Movie models for testing.
+    Sample Movie models, validated once per session; use sample_movies in tests.
 
     Returns:
-        List of 3 Movie objects with complete metadata for testing
+        Tuple of 3 Movie objects with complete metadata for testing
     """
     from src.models.Movies import Genre, Keyword, Movie
 
-    return [
+    return (
         Movie(
             id=1,
             title="The Matrix",
@@ -438,27 +556,54 @@ def sample_movies() -> List[Movie]:
             tagline="",
             imdb_id="tt0268978",
         ),
-    ]
+    )
+
+
+@pytest.fixture
+def sample_movies(_sample_movies_data: Tuple[Movie, ...]) -> Tuple[Movie, ...]:
+    """
+    Sample Movie models for testing, shared by all tests.
+
+    Tests must not modify these movies; use mutable_sample_movies instead.
+
+    Returns:
+        Tuple of 3 Movie objects with complete metadata for testing
+    """
+    return _sample_movies_data
+
+
+@pytest.fixture
+def mutable_sample_movies(_sample_movies_data: Tuple[Movie, ...]) -> List[Movie]:
+    """
+    Sample Movie models that a test may modify.
+
+    The models are rebuilt from their data rather than deep-copied, so they
+    also start without the derived features cached on the shared models.
+
+    Returns:
+        List of 3 Movie objects with complete metadata for testing (fresh models per test)
+    """
+    return [Movie.model_validate(movie.model_dump()) for movie in _sample_movies_data]
 
 
 # ============================================================================
 # Test Environment Fixtures
 # ============================================================================
 
-@pytest.fixture
-def test_output_dir(tmp_path: Path) -> Path:
+@pytest.fixture(scope="module")
+def test_output_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """
-    Create a temporary output directory for tests.
+    Create a temporary output directory shared by the tests of a module.
+
+    Tests in a module must use distinct export filenames.
 
     Args:
-        tmp_path: Pytest's temporary directory fixture
+        tmp_path_factory: Pytest's session-wide temporary directory factory
 
     Returns:
         Path to the test output directory
     """
-    output_dir = tmp_path / "test_data"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir
+    return tmp_path_factory.mktemp("test_data")
 
 
 @pytest.fixture
@@ -475,14 +620,15 @@ def mock_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @pytest.fixture
-def cleanup_test_files():
+def mock_tmdb_client() -> MagicMock:
     """
-    Cleanup test files after tests.
+    Create an unconfigured TMDB client mock for a single test.
 
-    Note: Actual cleanup is handled by pytest's tmp_path fixture.
-    This fixture exists for backwards compatibility.
-    """
-    yield
-    # Cleanup will be handled by tmp_path fixture
-    pass
+    A plain MagicMock is cheap to build (no autospec), and copying a configured
+    template would share its child mocks between tests, so each test gets a
+    new one. Shared response payloads are cached by the session fixtures above.
 
+    Returns:
+        MagicMock standing in for TMDBClient
+    """
+    return MagicMock()
@@ -10,87 +10,37 @@ This module tests:
 """
 
 import csv
+import io
+import re
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import NamedTuple
+from unittest.mock import MagicMock
 
 import pytest
 
+from src.api.TMDB import TMDBClient
 from src.services.export_service import ExportService
 from src.services.movie_service import MovieService
 from src.services.movie_recommendation_engine import RecommendationService
-
-
-def flatten_similar_movies_for_export(similar_movies_data):
-    """Helper function to flatten similar movies data for export."""
-    export_data = []
-    for item in similar_movies_data:
-        original_movie = item.get("original_movie")
-        similar_movies = item.get("similar_movies", [])
-
-        for similar_entry in similar_movies:
-            export_data.append({
-                "original_movie": original_movie,
-                "similar_movie": similar_entry.get("similar_movie"),
-                "similarity_score": similar_entry.get("similarity_score"),
-                "similarity_reason": similar_entry.get("similarity_reason"),
-                "similarity_metrics": similar_entry.get("similarity_metrics", {}),
-            })
-
-    return export_data
-
-
-@pytest.mark.integration
-@pytest.mark.e2e
-class TestEndToEnd:
-    """End-to-end tests for the complete application workflow."""
-
-    @pytest.fixture
-    def setup_mocked_services(self, test_output_dir, mock_env_vars):
-        """Set up all services with mocked TMDB client."""
-        mock_tmdb_client = MagicMock()
-
-        # Create comprehensive mock responses
-        discover_response = {
-            "page": 1,
-            "results": [
-                {
-                    "id": 1,
-                    "title": "The Matrix",
-                    "release_date": "1999-03-31",
-                    "vote_count": 25000,
-                    "vote_average": 8.7,
-                    "popularity": 85.5,
-                    "overview": "A computer hacker learns about the true nature of reality",
-                    "poster_path": "/poster1.jpg",
-                    "backdrop_path": "/backdrop1.jpg",
-                    "adult": False,
-                    "original_language": "en",
-                    "original_title": "The Matrix",
-                    "video": False,
-                    "genre_ids": [28, 878],
-                },
-                {
-                    "id": 2,
-                    "title": "Inception",
-                    "release_date": "1999-07-16",  # Changed to 1999 for testing
-                    "vote_count": 30000,
-                    "vote_average": 8.8,
-                    "popularity": 90.2,
-                    "overview": "A skilled thief is given a chance at redemption",
-                    "poster_path": "/poster2.jpg",
-                    "backdrop_path": "/backdrop2.jpg",
-                    "adult": False,
-                    "original_language": "en",
-                    "original_title": "Inception",
-                    "video": False,
-                    "genre_ids": [28, 878, 53],
-                },
-            ],
-            "total_pages": 1,
-            "total_results": 2,
-        }
-
-        movie_details_response = {
+from tests.conftest import (
+    _flatten_similar_movies_for_export,
+    _get_keywords_by_id,
+    _get_movie_details_by_id,
+    _is_sorted,
+    _iter_similar_movies_for_export,
+    _read_csv_rows,
+)
+
+
+# Error raised when discover returns nothing usable (compiled once for the parametrized test)
+_NO_MOVIES_FOUND = re.compile("No movies found")
+
+# Shared TMDB payloads, wired into the mock as-is (the services copy response
+# dicts before modifying them; tests replace return values rather than mutate)
+_DISCOVER_RESPONSE = {
+    "page": 1,
+    "results": [
+        {
             "id": 1,
             "title": "The Matrix",
             "release_date": "1999-03-31",
@@ -104,101 +54,134 @@ class TestEndToEnd:
             "original_language": "en",
             "original_title": "The Matrix",
             "video": False,
-            "genres": [
-                {"id": 28, "name": "Action"},
-                {"id": 878, "name": "Science Fiction"},
-            ],
-            "runtime": 136,
-            "status": "Released",
-            "tagline": "Welcome to the Real World",
-            "budget": 63000000,
-            "revenue": 467200000,
-            "homepage": "https://www.warnerbros.com/movies/matrix",
-            "imdb_id": "tt0133093",
-            "production_companies": [],
-            "production_countries": [],
-            "spoken_languages": [],
-        }
-
-        keywords_response = {
-            "id": 1,
-            "keywords": [
-                {"id": 100, "name": "artificial intelligence"},
-                {"id": 101, "name": "virtual reality"},
-                {"id": 102, "name": "hacker"},
-            ],
-        }
-
-        similar_movies_response = {
-            "page": 1,
-            "results": [
-                {
-                    "id": 4,
-                    "title": "The Matrix Reloaded",
-                    "release_date": "2003-05-15",
-                    "vote_count": 15000,
-                    "vote_average": 7.2,
-                    "popularity": 70.0,
-                    "overview": "Neo and his allies continue the fight",
-                    "poster_path": "/poster4.jpg",
-                    "backdrop_path": "/backdrop4.jpg",
-                    "adult": False,
-                    "original_language": "en",
-                    "original_title": "The Matrix Reloaded",
-                    "video": False,
-                    "genre_ids": [28, 878],
-                },
-                {
-                    "id": 5,
-                    "title": "Blade Runner",
-                    "release_date": "1982-06-25",
-                    "vote_count": 18000,
-                    "vote_average": 8.1,
-                    "popularity": 65.0,
-                    "overview": "A blade runner must pursue and terminate replicants",
-                    "poster_path": "/poster5.jpg",
-                    "backdrop_path": "/backdrop5.jpg",
-                    "adult": False,
-                    "original_language": "en",
-                    "original_title": "Blade Runner",
-                    "video": False,
-                    "genre_ids": [28, 878, 9648],
-                },
-            ],
-            "total_pages": 1,
-            "total_results": 2,
-        }
-
-        # Configure mock responses - use side_effect to return different data based on movie ID
-        from tests.conftest import _get_movie_details_by_id, _get_keywords_by_id
-        
-        mock_tmdb_client.get_movies_by_year.return_value = discover_response
-        mock_tmdb_client.get_movie_details.side_effect = lambda movie_id: _get_movie_details_by_id(movie_id)
-        mock_tmdb_client.get_movie_keywords.side_effect = lambda movie_id: _get_keywords_by_id(movie_id)
-        mock_tmdb_client.get_similar_movies.return_value = similar_movies_response
-        # Also need to mock get_movie_recommendations for the recommendation service
-        mock_tmdb_client.get_movie_recommendations.return_value = similar_movies_response
-
-        with patch("src.services.movie_service.TMDBClient", return_value=mock_tmdb_client), \
-             patch("src.services.movie_recommendation_engine.TMDBClient", return_value=mock_tmdb_client):
-            
-            movie_service = MovieService(tmdb_client=mock_tmdb_client)
-            recommendation_service = RecommendationService(tmdb_client=mock_tmdb_client)
-            export_service = ExportService(output_dir=str(test_output_dir))
-
-            return {
-                "movie_service": movie_service,
-                "recommendation_service": recommendation_service,
-                "export_service": export_service,
-                "tmdb_client": mock_tmdb_client,
-            }
+            "genre_ids": [28, 878],
+        },
+        {
+            "id": 2,
+            "title": "Inception",
+            "release_date": "1999-07-16",  # Changed to 1999 for testing
+            "vote_count": 30000,
+            "vote_average": 8.8,
+            "popularity": 90.2,
+            "overview": "A skilled thief is given a chance at redemption",
+            "poster_path": "/poster2.jpg",
+            "backdrop_path": "/backdrop2.jpg",
+            "adult": False,
+            "original_language": "en",
+            "original_title": "Inception",
+            "video": False,
+            "genre_ids": [28, 878, 53],
+        },
+    ],
+    "total_pages": 1,
+    "total_results": 2,
+}
+
+_SIMILAR_MOVIES_RESPONSE = {
+    "page": 1,
+    "results": [
+        {
+            "id": 4,
+            "title": "The Matrix Reloaded",
+            "release_date": "2003-05-15",
+            "vote_count": 15000,
+            "vote_average": 7.2,
+            "popularity": 70.0,
+            "overview": "Neo and his allies continue the fight",
+            "poster_path": "/poster4.jpg",
+            "backdrop_path": "/backdrop4.jpg",
+            "adult": False,
+            "original_language": "en",
+            "original_title": "The Matrix Reloaded",
+            "video": False,
+            "genre_ids": [28, 878],
+        },
+        {
+            "id": 5,
+            "title": "Blade Runner",
+            "release_date": "1982-06-25",
+            "vote_count": 18000,
+            "vote_average": 8.1,
+            "popularity": 65.0,
+            "overview": "A blade runner must pursue and terminate replicants",
+            "poster_path": "/poster5.jpg",
+            "backdrop_path": "/backdrop5.jpg",
+            "adult": False,
+            "original_language": "en",
+            "original_title": "Blade Runner",
+            "video": False,
+            "genre_ids": [28, 878, 9648],
+        },
+    ],
+    "total_pages": 1,
+    "total_results": 2,
+}
+
+
+class _Services(NamedTuple):
+    """Services under test and the TMDB client mock they share."""
+
+    movie_service: MovieService
+    recommendation_service: RecommendationService
+    export_service: ExportService
+    tmdb_client: MagicMock
+
+
+def _configure_mock_tmdb_client(mock_tmdb_client: MagicMock) -> None:
+    """
+    Reset a shared TMDB client mock and wire in the default responses.
+
+    Args:
+        mock_tmdb_client: Mock shared by the services of this module
+    """
+    mock_tmdb_client.reset_mock(return_value=True, side_effect=True)
+
+    # Use side_effect to return different data based on movie ID
+    mock_tmdb_client.get_movies_by_year.return_value = _DISCOVER_RESPONSE
+    mock_tmdb_client.get_movie_details.side_effect = lambda movie_id, **kwargs: _get_movie_details_by_id(movie_id)
+    mock_tmdb_client.get_movie_keywords.side_effect = lambda movie_id: _get_keywords_by_id(movie_id)
+    mock_tmdb_client.get_similar_movies.return_value = _SIMILAR_MOVIES_RESPONSE
+    # Also need to mock get_movie_recommendations for the recommendation service
+    mock_tmdb_client.get_movie_recommendations.return_value = _SIMILAR_MOVIES_RESPONSE
+
+
+@pytest.fixture(scope="module")
+def _mocked_services(tmp_path_factory):
+    """Build the services once per module around a shared TMDB client mock."""
+    # Specced so calls to methods TMDBClient lacks fail instead of returning mocks
+    mock_tmdb_client = MagicMock(spec=TMDBClient)
+    output_dir = tmp_path_factory.mktemp("test_data")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TMDB_API_KEY", "test_api_key_12345")
+        mp.setenv("LOG_LEVEL", "DEBUG")
+        mp.setattr("src.services.movie_service.TMDBClient", lambda *args, **kwargs: mock_tmdb_client)
+        mp.setattr("src.services.movie_recommendation_engine.TMDBClient", lambda *args, **kwargs: mock_tmdb_client)
+        yield _Services(
+            movie_service=MovieService(tmdb_client=mock_tmdb_client),
+            recommendation_service=RecommendationService(tmdb_client=mock_tmdb_client),
+            export_service=ExportService(output_dir=str(output_dir)),
+            tmdb_client=mock_tmdb_client,
+        )
+
+
+@pytest.mark.integration
+@pytest.mark.e2e
+class TestEndToEnd:
+    """End-to-end tests for the complete application workflow."""
+
+    @pytest.fixture
+    def setup_mocked_services(self, _mocked_services):
+        """Set up all services with mocked TMDB client (responses reset for each test)."""
+        _configure_mock_tmdb_client(_mocked_services.tmdb_client)
+        return _mocked_services
 
     def test_complete_application_workflow(self, setup_mocked_services):
         """Test the complete application workflow from start to finish."""
         services = setup_mocked_services
-        movie_service = services["movie_service"]
-        recommendation_service = services["recommendation_service"]
-        export_service = services["export_service"]
+        movie_service = services.movie_service
+        recommendation_service = services.recommendation_service
+        export_service = services.export_service
 
         # Step 1: Get top movies for a year
         year = 1999
@@ -212,15 +195,18 @@ class TestEndToEnd:
 
         # Verify Step 1
         assert len(movies) == top_n
-        assert Path(movies_csv_path).exists()
+        movies_path = Path(movies_csv_path)
+        assert movies_path.exists()
 
         # Verify CSV has all three sort methods
-        with open(movies_csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        assert len(rows) == top_n * 3  # 2 movies * 3 sort methods
-        sort_methods = {row["sort_method"] for row in rows}
+        row_count = 0
+        sort_methods = set()
+        with movies_path.open("r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                row_count += 1
+                sort_methods.add(row["sort_method"])
+
+        assert row_count == top_n * 3  # 2 movies * 3 sort methods
         assert sort_methods == {"votes", "name", "name_no_articles"}
 
         # Step 2: Find similar movies for each top movie
@@ -238,7 +224,7 @@ class TestEndToEnd:
             assert len(item["similar_movies"]) > 0
 
         # Step 3: Prepare similar movies for export
-        export_data = flatten_similar_movies_for_export(similar_movies_data)
+        export_data = _flatten_similar_movies_for_export(similar_movies_data)
 
         # Verify Step 3
         assert len(export_data) > 0
@@ -256,31 +242,35 @@ class TestEndToEnd:
         )
 
         # Verify Step 4
-        assert Path(similar_csv_path).exists()
+        similar_path = Path(similar_csv_path)
+        assert similar_path.exists()
 
-        with open(similar_csv_path, "r", encoding="utf-8") as f:
+        # Stream the rows, verifying similarity scores are valid
+        row_count = 0
+        with similar_path.open("r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            rows = list(reader)
-
-        assert len(rows) > 0
-        assert "original_movie_id" in rows[0]
-        assert "similar_movie_id" in rows[0]
-        assert "similarity_score" in rows[0]
-        assert "similarity_reason" in rows[0]
-        assert "genre_similarity" in rows[0]
-        assert "keyword_similarity" in rows[0]
-
-        # Verify similarity scores are valid
-        for row in rows:
-            score = float(row["similarity_score"]) if row["similarity_score"] else 0.0
-            assert 0.0 <= score <= 1.0
+            for row in reader:
+                row_count += 1
+                score = float(row["similarity_score"]) if row["similarity_score"] else 0.0
+                assert 0.0 <= score <= 1.0
+
+        assert row_count > 0
+        for column in (
+            "original_movie_id",
+            "similar_movie_id",
+            "similarity_score",
+            "similarity_reason",
+            "genre_similarity",
+            "keyword_similarity",
+        ):
+            assert column in reader.fieldnames
 
     def test_workflow_data_consistency(self, setup_mocked_services):
         """Test that data is consistent throughout the workflow."""
         services = setup_mocked_services
-        movie_service = services["movie_service"]
-        recommendation_service = services["recommendation_service"]
-        export_service = services["export_service"]
+        movie_service = services.movie_service
+        recommendation_service = services.recommendation_service
+        export_service = services.export_service
 
         # Get top movies
         movies, movies_csv_path = movie_service.get_and_export_top_movies(
@@ -296,22 +286,18 @@ class TestEndToEnd:
             strategy="tmdb_api"
         )
 
-        # Export similar movies
-        export_data = flatten_similar_movies_for_export(similar_movies_data)
-        similar_csv_path = export_service.export_similar_movies_to_csv(
-            similar_movies_data=export_data,
-            filename="test_similar_consistency.csv",
-        )
+        # Write similar movies CSV in memory (file export is covered by test_complete_workflow)
+        similar_csv = io.StringIO(newline="")
+        export_service.write_similar_movies_csv(_iter_similar_movies_for_export(similar_movies_data), similar_csv)
+        similar_csv.seek(0)
 
         # Verify original movies in similar movies CSV match top movies
-        with open(similar_csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            similar_rows = list(reader)
-
-        original_movie_ids_in_similar = {
-            int(row["original_movie_id"]) for row in similar_rows
-        }
         top_movie_ids = {movie.id for movie in movies}
+        original_movie_ids_in_similar = set()
+        for row in csv.DictReader(similar_csv):
+            original_movie_id = int(row["original_movie_id"])
+            assert original_movie_id in top_movie_ids
+            original_movie_ids_in_similar.add(original_movie_id)
 
         assert original_movie_ids_in_similar == top_movie_ids
 
@@ -320,8 +306,8 @@ class TestEndToEnd:
     def test_workflow_sorting_verification(self, setup_mocked_services):
         """Test that sorting works correctly in the exported CSV."""
         services = setup_mocked_services
-        movie_service = services["movie_service"]
-        export_service = services["export_service"]
+        movie_service = services.movie_service
+        export_service = services.export_service
 
         # Get and export movies
         movies, csv_path = movie_service.get_and_export_top_movies(
@@ -330,51 +316,35 @@ class TestEndToEnd:
             filename="test_sorting.csv",
         )
 
-        # Read CSV and verify sorting
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        # Filter by sort method
-        votes_rows = [r for r in rows if r["sort_method"] == "votes"]
-        name_rows = [r for r in rows if r["sort_method"] == "name"]
+        # Read CSV and split the sections by sort method in one pass
+        vote_counts = []
+        titles = []
+        for row in _read_csv_rows(csv_path):
+            if row["sort_method"] == "votes":
+                vote_counts.append(int(row["vote_count"]))
+            elif row["sort_method"] == "name":
+                titles.append(row["title"])
 
-        # Verify votes sorting (highest first)
-        vote_counts = [int(r["vote_count"]) for r in votes_rows]
-        assert vote_counts == sorted(vote_counts, reverse=True), "Votes should be sorted descending"
+        # Verify votes sorting (highest first) with a linear check
+        assert _is_sorted(vote_counts, reverse=True), "Votes should be sorted descending"
 
         # Verify name sorting (alphabetical)
-        titles = [r["title"] for r in name_rows]
-        assert titles == sorted(titles), "Names should be sorted alphabetically"
-
-    def test_workflow_error_handling(self, setup_mocked_services):
-        """Test error handling in the workflow."""
+        assert _is_sorted(titles), "Names should be sorted alphabetically"
+
+    @pytest.mark.parametrize(
+        "discover_response",
+        [
+            None,  # API failure
+            {"page": 1, "results": [], "total_pages": 0, "total_results": 0},
+        ],
+        ids=["api-failure", "empty-results"],
+    )
+    def test_workflow_no_movies_found(self, setup_mocked_services, discover_response):
+        """Test that a failed or empty discover response stops the workflow with an error."""
         services = setup_mocked_services
-        movie_service = services["movie_service"]
-        tmdb_client = services["tmdb_client"]
-
-        # Mock API to return None (simulating failure)
-        tmdb_client.get_movies_by_year.return_value = None
+        movie_service = services.movie_service
+        services.tmdb_client.get_movies_by_year.return_value = discover_response
 
-        # Should raise ValueError when no movies found
-        with pytest.raises(ValueError, match="No movies found"):
-            movie_service.get_top_movies_by_year(year=1999, top_n=10)
-
-    def test_workflow_empty_results(self, setup_mocked_services):
-        """Test workflow with empty API results."""
-        services = setup_mocked_services
-        movie_service = services["movie_service"]
-        tmdb_client = services["tmdb_client"]
-
-        # Mock API to return empty results
-        tmdb_client.get_movies_by_year.return_value = {
-            "page": 1,
-            "results": [],
-            "total_pages": 0,
-            "total_results": 0,
-        }
-
-        # Should raise ValueError
-        with pytest.raises(ValueError, match="No movies found"):
+        with pytest.raises(ValueError, match=_NO_MOVIES_FOUND):
             movie_service.get_top_movies_by_year(year=1999, top_n=10)
 
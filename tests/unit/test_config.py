@@ -0,0 +1,140 @@
+"""
+Unit tests for Config.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.utils import config as config_module
+from src.utils.config import Config, load_env_file
+
+
+class TestConfig:
+    """Test suite for Config lookups."""
+
+    @pytest.fixture
+    def config(self, tmp_path, mock_env_vars):
+        """Create a Config from a temporary YAML file."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "api:\n"
+            "  timeout: 30\n"
+            "  cache_enabled: false\n"
+            "recommendation:\n"
+            "  weights:\n"
+            "    genre_similarity: 0.2\n"
+            "  min_vote_count: null\n"
+        )
+        return Config(env_file=str(tmp_path / ".env"), config_file=config_file)
+
+    def test_get_resolves_dotted_keys(self, config):
+        """Test that dotted keys resolve leaves and nested sections."""
+        assert config.get("api.timeout") == 30
+        assert config.get("api.cache_enabled") is False
+        assert config.get("recommendation.weights") == {"genre_similarity": 0.2}
+
+    def test_get_returns_default_for_missing_or_null_keys(self, config):
+        """Test that missing keys, null values and paths through leaves use the default."""
+        assert config.get("api.missing", 5) == 5
+        assert config.get("recommendation.min_vote_count", 100) == 100
+        assert config.get("api.timeout.seconds", "n/a") == "n/a"
+
+    def test_get_returns_same_section_object_and_honours_each_default(self, config):
+        """Test that repeated lookups return the same section object and each call's own default."""
+        assert config.get("api.missing", 1) == 1
+        assert config.get("api.missing", 2) == 2
+        assert config.get("recommendation.weights") is config.get("recommendation.weights")
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [("true", True), ("YES", True), ("On", True), ("1", True), ("t", True), ("false", False), ("0", False), ("", False)],
+    )
+    def test_get_env_bool(self, config, monkeypatch, raw, expected):
+        """Test boolean parsing of environment variables."""
+        monkeypatch.setenv("CONFIG_TEST_FLAG", raw)
+        assert config.get_env_bool("CONFIG_TEST_FLAG") is expected
+
+    def test_get_env_bool_and_int_defaults(self, config, monkeypatch):
+        """Test that unset or invalid variables fall back to the default."""
+        monkeypatch.delenv("CONFIG_TEST_FLAG", raising=False)
+        monkeypatch.setenv("CONFIG_TEST_INT", "ten")
+
+        assert config.get_env_bool("CONFIG_TEST_FLAG", True) is True
+        assert config.get_env_int("CONFIG_TEST_FLAG", 7) == 7
+        assert config.get_env_int("CONFIG_TEST_INT", 7) == 7
+
+    def test_env_backed_settings_are_read_once(self, config, monkeypatch):
+        """Test that env-backed settings are snapshotted on first access, except the API key."""
+        monkeypatch.setenv("CACHE_TTL", "120")
+        monkeypatch.setenv("REDIS_HOST", "cache.internal")
+        assert config.cache_ttl == 120
+        assert config.redis_host == "cache.internal"
+
+        monkeypatch.setenv("CACHE_TTL", "60")
+        monkeypatch.setenv("REDIS_HOST", "elsewhere")
+        monkeypatch.setenv("TMDB_API_KEY", "rotated_key")
+
+        assert config.cache_ttl == 120
+        assert config.redis_host == "cache.internal"
+        assert config.tmdb_api_key == "rotated_key"
+
+    def test_non_mapping_config_is_rejected_at_load(self, tmp_path, mock_env_vars):
+        """Test that a config file without a top-level mapping fails early."""
+        config_file = tmp_path / "bad.yaml"
+        config_file.write_text("- api\n- data\n")
+
+        with pytest.raises(ValueError):
+            Config(env_file=str(tmp_path / ".env"), config_file=config_file)
+
+    def test_keys_unreachable_by_dotted_paths_still_load(self, tmp_path, mock_env_vars):
+        """Test that integer and dotted keys are kept in their section instead of failing the load."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "api:\n"
+            "  timeout: 30\n"
+            "  retry_status:\n"
+            "    429: rate limited\n"
+            "    503: unavailable\n"
+            "  cache.ttl: 5\n"
+        )
+
+        config = Config(env_file=str(tmp_path / ".env"), config_file=config_file)
+
+        assert config.get("api.timeout") == 30
+        assert config.get("api.retry_status") == {429: "rate limited", 503: "unavailable"}
+        assert config.get("api.retry_status.429", "n/a") == "n/a"
+        assert config.get("api")["cache.ttl"] == 5
+
+    def test_yaml_is_parsed_once_per_file_version(self, config, tmp_path):
+        """Test that unchanged config files are parsed once and edits are picked up."""
+        config_file = tmp_path / "config.yaml"
+        with patch("yaml.load", wraps=yaml.load) as yaml_load:
+            again = Config(env_file=str(tmp_path / ".env"), config_file=config_file)
+            yaml_load.assert_not_called()
+
+            again.config_data["api"]["timeout"] = 99
+            assert config.get("api.timeout") == 30
+
+            stat = config_file.stat()
+            config_file.write_text("api:\n  timeout: 60\n")
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            edited = Config(env_file=str(tmp_path / ".env"), config_file=config_file)
+
+        yaml_load.assert_called_once()
+        assert edited.get("api.timeout") == 60
+
+    def test_load_env_file_parses_each_file_once(self, tmp_path, monkeypatch):
+        """Test that .env files are loaded once per process and missing files are skipped."""
+        monkeypatch.setattr(config_module, "_loaded_env_files", set())
+        monkeypatch.delenv("CONFIG_TEST_VALUE", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text("CONFIG_TEST_VALUE=loaded\n")
+
+        assert load_env_file(tmp_path / "missing.env") is False
+        assert load_env_file(env_file) is True
+        assert load_env_file(str(env_file)) is False
+        assert os.environ["CONFIG_TEST_VALUE"] == "loaded"
+        monkeypatch.delenv("CONFIG_TEST_VALUE")
@@ -9,13 +9,15 @@ Tests the ExportService class which handles:
 """
 
 import csv
+import io
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from src.models.Movies import Movie
-from src.services.export_service import ExportService
+from src.services.export_service import CSV_WRITE_BUFFER_SIZE, EXPORT_BATCH_SIZE, ExportService
+from tests.conftest import _read_csv_rows
 
 
 class TestExportService:
@@ -50,9 +52,7 @@ class TestExportService:
         assert Path(filepath).exists()
 
         # Read and verify CSV
-        with open(filepath, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        rows = _read_csv_rows(filepath)
 
         assert len(rows) == 3
         assert rows[0]["title"] == "The Matrix"
@@ -73,14 +73,41 @@ class TestExportService:
         )
 
         # Verify both entries exist
-        with open(filepath, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        rows = _read_csv_rows(filepath)
 
         assert len(rows) == 2
         assert rows[0]["sort_method"] == "votes"
         assert rows[1]["sort_method"] == "name"
 
+    def test_export_movies_to_csv_multi(self, export_service, sample_movies):
+        """Test writing several sort orderings to one CSV in a single pass."""
+        filepath = export_service.export_movies_to_csv_multi(
+            sections=[("votes", sample_movies[:2]), ("name", sample_movies[1:])],
+            filename="test_multi.csv",
+        )
+
+        with open(filepath, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+            f.seek(0)
+            rows = list(csv.DictReader(f))
+
+        assert sum(line.startswith("sort_method,") for line in lines) == 1
+        assert [row["sort_method"] for row in rows] == ["votes", "votes", "name", "name"]
+        assert rows[2]["id"] == str(sample_movies[1].id)
+
+    def test_export_movies_to_csv_multi_logs_skipped_entries(self, export_service, sample_movies):
+        """Test that invalid movies are logged and skipped, and only written rows are reported."""
+        with patch.object(export_service, "logger") as logger:
+            filepath = export_service.export_movies_to_csv_multi(
+                sections=[("votes", [sample_movies[0], None]), ("name", [{"id": 99}, sample_movies[1]])],
+                filename="test_multi_skipped.csv",
+            )
+
+        rows = _read_csv_rows(filepath)
+        assert [row["id"] for row in rows] == [str(sample_movies[0].id), str(sample_movies[1].id)]
+        assert logger.warning.call_count == 2
+        assert "Successfully exported 2 movie entries" in logger.info.call_args.args[0]
+
     def test_export_similar_movies_to_csv(self, export_service, sample_movies):
         """Test exporting similar movies to CSV."""
         similar_movies_data = [
@@ -108,9 +135,7 @@ class TestExportService:
         assert Path(filepath).exists()
 
         # Read and verify CSV
-        with open(filepath, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        rows = _read_csv_rows(filepath)
 
         assert len(rows) == 1
         assert rows[0]["original_movie_id"] == "1"
@@ -119,6 +144,93 @@ class TestExportService:
         assert rows[0]["similarity_reason"] == "Similar genres and themes"
         assert "Action" in rows[0]["shared_genres"]
 
+    def test_export_similar_movies_rounds_scores_at_serialization(self, export_service, sample_movies):
+        """Test that full-precision scores are rounded only when written to CSV."""
+        similar_movies_data = [
+            {
+                "original_movie": sample_movies[0],
+                "similar_movie": sample_movies[1],
+                "similarity_score": 0.1 + 0.2,
+                "similarity_metrics": {"genre_similarity": 2 / 3},
+            }
+        ]
+
+        filepath = export_service.export_similar_movies_to_csv(
+            similar_movies_data=similar_movies_data, filename="test_similar_rounding.csv"
+        )
+
+        rows = _read_csv_rows(filepath)
+
+        assert rows[0]["similarity_score"] == "0.3"
+        assert rows[0]["genre_similarity"] == "0.6667"
+        assert similar_movies_data[0]["similarity_score"] == 0.1 + 0.2
+
+    def test_write_similar_movies_csv_to_stream_matches_file(self, export_service, sample_movies):
+        """Test that writing to an in-memory stream produces the same CSV as the file export."""
+        similar_movies_data = [
+            {
+                "original_movie": sample_movies[0],
+                "similar_movie": sample_movies[2],
+                "similarity_score": 0.5,
+                "similarity_metrics": {"shared_genres": ["Drama"]},
+            }
+        ]
+
+        buffer = io.StringIO(newline="")
+        export_service.write_similar_movies_csv(similar_movies_data, buffer)
+        filepath = export_service.export_similar_movies_to_csv(
+            similar_movies_data=similar_movies_data, filename="test_similar_stream.csv"
+        )
+
+        with open(filepath, "r", newline="", encoding="utf-8") as f:
+            assert buffer.getvalue() == f.read()
+
+    @pytest.mark.parametrize(
+        "method", ["export_movies_to_csv", "export_movies_to_csv_multi", "export_similar_movies_to_csv"]
+    )
+    def test_large_exports_use_buffered_writes(self, export_service, sample_movies, method):
+        """Test that 10k-row exports go through one large-buffered open and keep every row."""
+        n_rows = 10_000
+        movie = sample_movies[0]
+        args = {
+            "export_movies_to_csv": {"movies_data": [{"movie": movie, "sort_method": "votes"}] * n_rows},
+            "export_movies_to_csv_multi": {"sections": [("votes", [movie] * n_rows)]},
+            "export_similar_movies_to_csv": {
+                "similar_movies_data": [{"original_movie": movie, "similar_movie": movie}] * n_rows
+            },
+        }[method]
+
+        with patch("src.services.export_service.open", wraps=open, create=True) as opened:
+            filepath = getattr(export_service, method)(filename=f"test_large_{method}.csv", **args)
+
+        opened.assert_called_once()
+        assert opened.call_args.kwargs["buffering"] == CSV_WRITE_BUFFER_SIZE
+        assert len(_read_csv_rows(filepath)) == n_rows
+
+    def test_export_similar_movies_from_generator(self, export_service, sample_movies):
+        """Test that a lazy iterable is streamed in batches and every valid row is written."""
+        n_entries = EXPORT_BATCH_SIZE * 2 + 500
+        entries = (
+            {"original_movie": sample_movies[0], "similar_movie": sample_movies[i % 3], "similarity_score": 0.5}
+            for i in range(n_entries)
+        )
+
+        buffer = io.StringIO(newline="")
+        rows_written = export_service.write_similar_movies_csv(entries, buffer)
+        buffer.seek(0)
+
+        assert rows_written == n_entries
+        assert sum(1 for _ in csv.DictReader(buffer)) == n_entries
+
+    def test_export_similar_movies_empty_generator_writes_no_file(self, export_service, test_output_dir):
+        """Test that an empty generator is rejected before the output file is created."""
+        with pytest.raises(ValueError, match="Cannot export empty similar movies data"):
+            export_service.export_similar_movies_to_csv(
+                similar_movies_data=(entry for entry in []), filename="test_empty_generator.csv"
+            )
+
+        assert not (test_output_dir / "test_empty_generator.csv").exists()
+
     def test_export_movies_to_csv_empty_data(self, export_service):
         """Test exporting empty movies data raises error."""
         with pytest.raises(ValueError, match="Cannot export empty movies data"):
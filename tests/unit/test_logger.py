@@ -0,0 +1,61 @@
+"""
+Unit tests for the logging setup.
+"""
+
+import logging.handlers
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.logger import setup_logger
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestFileLogging:
+    """Test suite for queued file logging."""
+
+    def test_records_logged_at_exit_reach_the_file(self, tmp_path):
+        """Test that records still queued at interpreter exit are written before the file closes."""
+        log_file = tmp_path / "app.log"
+        script = textwrap.dedent(
+            f"""
+            from src.utils.logger import setup_logger
+
+            logger = setup_logger("exit_test", log_file={str(log_file)!r}, console_enabled=False)
+            for i in range(500):
+                logger.info(f"record {{i}}")
+            logger.info("last record before exit")
+            """
+        )
+
+        subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, check=True, timeout=30)
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 501
+        assert lines[-1].endswith("last record before exit")
+
+    def test_exit_handlers_drain_queue_before_closing_file(self, tmp_path):
+        """Test that the exit handlers write queued records and leave the file closed, not reopened."""
+        log_file = tmp_path / "app.log"
+        exit_handlers = []
+
+        with patch("src.utils.logger.atexit.register", side_effect=lambda *args: exit_handlers.append(args)):
+            logger = setup_logger("drain_test", log_file=str(log_file), console_enabled=False)
+        for i in range(500):
+            logger.info(f"record {i}")
+        logger.info("last record before exit")
+
+        # atexit runs handlers in reverse registration order
+        for func, *args in reversed(exit_handlers):
+            func(*args)
+
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 501
+        assert lines[-1].endswith("last record before exit")
+        registered = [obj for func, *args in exit_handlers for obj in (getattr(func, "__self__", None), *args)]
+        file_handler = next(obj for obj in registered if isinstance(obj, logging.handlers.RotatingFileHandler))
+        assert file_handler.stream is None
@@ -5,189 +5,158 @@ Tests the core similarity calculation methods using mock data to verify
 that the calculations are mathematically correct.
 """
 
-from unittest.mock import MagicMock, patch
+import itertools
+import threading
+from unittest.mock import patch
 
 import pytest
 
-from src.models.Movies import Movie, Genre, Keyword
+from src.models.Movies import Movie, Genre, Keyword, director_hash, movie_from_tmdb_response
+from src.services.candidate_pool import CandidatePool, MovieFeatures, Vocab, jaccard_bits
 from src.services.movie_recommendation_engine import MovieRecommendationEngine
+from src.services.similarity_kernel import top_n_batch
+from src.utils.concurrency import parallel_map
+
+
+@pytest.fixture(scope="module")
+def sample_movie_1():
+    """Sample movie shared by the tests in this module (tests must not modify it)."""
+    return Movie(
+        id=1,
+        title="The Matrix",
+        release_date="1999-03-31",
+        release_year=1999,
+        vote_count=25000,
+        vote_average=8.7,
+        popularity=85.5,
+        overview="A computer hacker learns about the true nature of reality",
+        genres=[
+            Genre(id=28, name="Action"),
+            Genre(id=878, name="Science Fiction"),
+            Genre(id=53, name="Thriller"),
+        ],
+        keywords=[
+            Keyword(id=1, name="artificial intelligence"),
+            Keyword(id=2, name="virtual reality"),
+            Keyword(id=3, name="hacker"),
+        ],
+        director="Lana Wachowski",
+        collection_id=2344,
+        collection_name="The Matrix Collection",
+        production_companies=[
+            {"id": 79, "name": "Village Roadshow Pictures"},
+            {"id": 174, "name": "Warner Bros. Pictures"},
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_movie_2():
+    """Second shared sample movie (tests must not modify it)."""
+    return Movie(
+        id=2,
+        title="Inception",
+        release_date="2010-07-16",
+        release_year=2010,
+        vote_count=30000,
+        vote_average=8.8,
+        popularity=90.2,
+        overview="A skilled thief is given a chance at redemption",
+        genres=[
+            Genre(id=28, name="Action"),
+            Genre(id=878, name="Science Fiction"),
+            Genre(id=18, name="Drama"),
+        ],
+        keywords=[
+            Keyword(id=1, name="artificial intelligence"),
+            Keyword(id=4, name="dream"),
+            Keyword(id=5, name="heist"),
+        ],
+        director="Christopher Nolan",
+        collection_id=None,
+        collection_name=None,
+        production_companies=[
+            {"id": 174, "name": "Warner Bros. Pictures"},
+            {"id": 923, "name": "Legendary Pictures"},
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_movie_3():
+    """Third shared sample movie (tests must not modify it)."""
+    return Movie(
+        id=3,
+        title="The Matrix Reloaded",
+        release_date="2003-05-15",
+        release_year=2003,
+        vote_count=15000,
+        vote_average=7.2,
+        popularity=70.0,
+        overview="Neo and his allies continue the fight",
+        genres=[
+            Genre(id=28, name="Action"),
+            Genre(id=878, name="Science Fiction"),
+            Genre(id=53, name="Thriller"),
+        ],
+        keywords=[
+            Keyword(id=1, name="artificial intelligence"),
+            Keyword(id=2, name="virtual reality"),
+            Keyword(id=6, name="sequel"),
+        ],
+        director="Lana Wachowski",
+        collection_id=2344,
+        collection_name="The Matrix Collection",
+        production_companies=[
+            {"id": 79, "name": "Village Roadshow Pictures"},
+            {"id": 174, "name": "Warner Bros. Pictures"},
+        ],
+    )
 
 
 class TestMovieRecommendationEngine:
     """Test suite for MovieRecommendationEngine similarity calculations."""
 
     @pytest.fixture
-    def mock_tmdb_client(self):
-        """Create a mock TMDB client."""
-        client = MagicMock()
-        return client
-
-    @pytest.fixture
-    def engine(self, mock_tmdb_client, mock_env_vars):
+    def engine(self, mock_tmdb_client, mock_env_vars, monkeypatch):
         """Create a MovieRecommendationEngine instance with mocked dependencies."""
-        with patch("src.services.movie_recommendation_engine.TMDBClient", return_value=mock_tmdb_client):
-            engine = MovieRecommendationEngine(tmdb_client=mock_tmdb_client)
-            return engine
-
-    @pytest.fixture
-    def sample_movie_1(self):
-        """Create a sample movie for testing."""
-        return Movie(
-            id=1,
-            title="The Matrix",
-            release_date="1999-03-31",
-            release_year=1999,
-            vote_count=25000,
-            vote_average=8.7,
-            popularity=85.5,
-            overview="A computer hacker learns about the true nature of reality",
-            genres=[
-                Genre(id=28, name="Action"),
-                Genre(id=878, name="Science Fiction"),
-                Genre(id=53, name="Thriller"),
-            ],
-            keywords=[
-                Keyword(id=1, name="artificial intelligence"),
-                Keyword(id=2, name="virtual reality"),
-                Keyword(id=3, name="hacker"),
-            ],
-            director="Lana Wachowski",
-            collection_id=2344,
-            collection_name="The Matrix Collection",
-            production_companies=[
-                {"id": 79, "name": "Village Roadshow Pictures"},
-                {"id": 174, "name": "Warner Bros. Pictures"},
-            ],
-        )
-
-    @pytest.fixture
-    def sample_movie_2(self):
-        """Create another sample movie for testing."""
-        return Movie(
-            id=2,
-            title="Inception",
-            release_date="2010-07-16",
-            release_year=2010,
-            vote_count=30000,
-            vote_average=8.8,
-            popularity=90.2,
-            overview="A skilled thief is given a chance at redemption",
-            genres=[
-                Genre(id=28, name="Action"),
-                Genre(id=878, name="Science Fiction"),
-                Genre(id=18, name="Drama"),
-            ],
-            keywords=[
-                Keyword(id=1, name="artificial intelligence"),
-                Keyword(id=4, name="dream"),
-                Keyword(id=5, name="heist"),
-            ],
-            director="Christopher Nolan",
-            collection_id=None,
-            collection_name=None,
-            production_companies=[
-                {"id": 174, "name": "Warner Bros. Pictures"},
-                {"id": 923, "name": "Legendary Pictures"},
-            ],
-        )
-
-    @pytest.fixture
-    def sample_movie_3(self):
-        """Create a third sample movie for testing."""
-        return Movie(
-            id=3,
-            title="The Matrix Reloaded",
-            release_date="2003-05-15",
-            release_year=2003,
-            vote_count=15000,
-            vote_average=7.2,
-            popularity=70.0,
-            overview="Neo and his allies continue the fight",
-            genres=[
-                Genre(id=28, name="Action"),
-                Genre(id=878, name="Science Fiction"),
-                Genre(id=53, name="Thriller"),
-            ],
-            keywords=[
-                Keyword(id=1, name="artificial intelligence"),
-                Keyword(id=2, name="virtual reality"),
-                Keyword(id=6, name="sequel"),
-            ],
-            director="Lana Wachowski",
-            collection_id=2344,
-            collection_name="The Matrix Collection",
-            production_companies=[
-                {"id": 79, "name": "Village Roadshow Pictures"},
-                {"id": 174, "name": "Warner Bros. Pictures"},
-            ],
+        monkeypatch.setattr(
+            "src.services.movie_recommendation_engine.TMDBClient", lambda *args, **kwargs: mock_tmdb_client
         )
+        return MovieRecommendationEngine(tmdb_client=mock_tmdb_client)
 
     # Test individual similarity calculations
 
-    def test_calculate_genre_similarity_identical(self, engine):
-        """Test genre similarity with identical genres."""
-        genres1 = ["Action", "Sci-Fi", "Thriller"]
-        genres2 = ["Action", "Sci-Fi", "Thriller"]
-
-        similarity = engine._calculate_genre_similarity(genres1, genres2)
-
-        # Jaccard similarity: 3 shared / 3 total = 1.0
-        assert similarity == 1.0
-
-    def test_calculate_genre_similarity_partial_overlap(self, engine):
-        """Test genre similarity with partial overlap."""
-        genres1 = ["Action", "Sci-Fi", "Thriller"]
-        genres2 = ["Action", "Sci-Fi", "Drama"]
-
-        similarity = engine._calculate_genre_similarity(genres1, genres2)
-
-        # Jaccard similarity: 2 shared / 4 total = 0.5
-        assert similarity == 0.5
-
-    def test_calculate_genre_similarity_no_overlap(self, engine):
-        """Test genre similarity with no overlap."""
-        genres1 = ["Action", "Sci-Fi"]
-        genres2 = ["Drama", "Romance"]
-
-        similarity = engine._calculate_genre_similarity(genres1, genres2)
-
-        assert similarity == 0.0
-
-    def test_calculate_genre_similarity_empty_lists(self, engine):
-        """Test genre similarity with empty lists."""
-        similarity = engine._calculate_genre_similarity([], [])
-        assert similarity == 0.0
-
-        similarity = engine._calculate_genre_similarity(["Action"], [])
-        assert similarity == 0.0
-
-    def test_calculate_keyword_similarity_identical(self, engine):
-        """Test keyword similarity with identical keywords."""
-        keywords1 = ["ai", "virtual reality", "hacker"]
-        keywords2 = ["ai", "virtual reality", "hacker"]
-
-        similarity = engine._calculate_keyword_similarity(keywords1, keywords2)
-
-        assert similarity == 1.0
-
-    def test_calculate_keyword_similarity_partial_overlap(self, engine):
-        """Test keyword similarity with partial overlap."""
-        keywords1 = ["ai", "virtual reality", "hacker"]
-        keywords2 = ["ai", "virtual reality", "dream"]
-
-        similarity = engine._calculate_keyword_similarity(keywords1, keywords2)
-
-        # Jaccard similarity: 2 shared / 4 total = 0.5
-        assert similarity == 0.5
-
-    def test_calculate_keyword_similarity_no_overlap(self, engine):
-        """Test keyword similarity with no overlap."""
-        keywords1 = ["ai", "virtual reality"]
-        keywords2 = ["romance", "comedy"]
-
-        similarity = engine._calculate_keyword_similarity(keywords1, keywords2)
-
-        assert similarity == 0.0
+    @pytest.mark.parametrize(
+        "genres1, genres2, expected",
+        [
+            # Jaccard similarity: 3 shared / 3 total = 1.0
+            (["Action", "Sci-Fi", "Thriller"], ["Action", "Sci-Fi", "Thriller"], 1.0),
+            # Jaccard similarity: 2 shared / 4 total = 0.5
+            (["Action", "Sci-Fi", "Thriller"], ["Action", "Sci-Fi", "Drama"], 0.5),
+            (["Action", "Sci-Fi"], ["Drama", "Romance"], 0.0),
+            ([], [], 0.0),
+            (["Action"], [], 0.0),
+        ],
+        ids=["identical", "partial-overlap", "no-overlap", "both-empty", "one-empty"],
+    )
+    def test_calculate_genre_similarity(self, engine, genres1, genres2, expected):
+        """Test genre Jaccard similarity for identical, overlapping, disjoint and empty genres."""
+        assert engine._calculate_genre_similarity(genres1, genres2) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "keywords1, keywords2, expected",
+        [
+            (["ai", "virtual reality", "hacker"], ["ai", "virtual reality", "hacker"], 1.0),
+            # Jaccard similarity: 2 shared / 4 total = 0.5
+            (["ai", "virtual reality", "hacker"], ["ai", "virtual reality", "dream"], 0.5),
+            (["ai", "virtual reality"], ["romance", "comedy"], 0.0),
+        ],
+        ids=["identical", "partial-overlap", "no-overlap"],
+    )
+    def test_calculate_keyword_similarity(self, engine, keywords1, keywords2, expected):
+        """Test keyword Jaccard similarity for identical, overlapping and disjoint keywords."""
+        assert engine._calculate_keyword_similarity(keywords1, keywords2) == pytest.approx(expected)
 
     def test_calculate_director_similarity_same_director(self, engine):
         """Test director similarity with same director."""
@@ -227,6 +196,13 @@ class TestMovieRecommendationEngine:
         similarity = engine._calculate_director_similarity(None, None)
         assert similarity == 0.0
 
+    def test_director_hash_survives_enrichment(self):
+        """Test that the enriched director is kept and hashed case-insensitively."""
+        movie = movie_from_tmdb_response({"id": 10, "title": "Memento", "director": "Christopher Nolan"})
+
+        assert movie.director == "Christopher Nolan"
+        assert movie.director_hash == director_hash(" christopher nolan ")
+
     def test_calculate_collection_similarity_same_collection(self, engine):
         """Test collection similarity with same collection."""
         collection_id1 = 2344
@@ -339,8 +315,8 @@ class TestMovieRecommendationEngine:
 
         assert metrics["collection_similarity"] == 0.0
         assert metrics["director_similarity"] == 0.0
-        assert metrics["genre_similarity"] == 0.5
-        assert metrics["keyword_similarity"] == 0.2
+        assert metrics["genre_similarity"] == pytest.approx(0.5)
+        assert metrics["keyword_similarity"] == pytest.approx(0.2)
         assert metrics["production_company_similarity"] == pytest.approx(0.333, abs=0.01)
 
         # Shared items
@@ -353,6 +329,135 @@ class TestMovieRecommendationEngine:
 
         assert 0.0 <= score <= 1.0
 
+    def test_calculate_similarity_score_memoizes_same_pair(self, engine, sample_movie_1, sample_movie_2):
+        """Test that repeated pairs reuse results but updated movies are rescored."""
+        first = engine.calculate_similarity_score(sample_movie_1, sample_movie_2)
+        second = engine.calculate_similarity_score(sample_movie_1, sample_movie_2)
+        assert second is first
+
+        same_franchise = sample_movie_2.model_copy(update={"collection_id": sample_movie_1.collection_id})
+        score, metrics = engine.calculate_similarity_score(sample_movie_1, same_franchise)
+        assert metrics["collection_similarity"] == 1.0
+        assert score > first[0]
+
+    def test_calculate_similarity_score_reuses_reverse_pair(self, engine, sample_movie_1, sample_movie_3):
+        """Test that scoring (b, a) after (a, b) reuses the symmetric scores but keeps target-side details."""
+        forward_score, forward_metrics = engine.calculate_similarity_score(sample_movie_1, sample_movie_3)
+
+        with patch.object(engine, "_calculate_genre_similarity") as genre_similarity:
+            reverse_score, reverse_metrics = engine.calculate_similarity_score(sample_movie_3, sample_movie_1)
+
+        genre_similarity.assert_not_called()
+        assert reverse_score == forward_score
+        assert reverse_metrics["collection_similarity"] == forward_metrics["collection_similarity"]
+        assert sorted(reverse_metrics["shared_genres"]) == sorted(forward_metrics["shared_genres"])
+        assert reverse_metrics is not forward_metrics
+
+    def test_target_feature_sets_are_built_once(self, engine, sample_movie_1, sample_movie_2, sample_movie_3):
+        """Test that the target's genre, keyword and company features are reused across candidates."""
+        genres = sample_movie_1.genre_set
+        keywords = sample_movie_1.keyword_set
+        company_names = sample_movie_1.production_company_name_map
+
+        engine.calculate_similarity_score(sample_movie_1, sample_movie_2)
+        engine.calculate_similarity_score(sample_movie_1, sample_movie_3)
+
+        assert sample_movie_1.genre_set is genres
+        assert sample_movie_1.keyword_set is keywords
+        assert sample_movie_1.production_company_name_map is company_names
+
+    def test_candidate_pool_precomputes_set_sizes(self, sample_movie_1, sample_movie_2, sample_movie_3):
+        """Test that pool rows and target features carry the sizes of their encoded sets."""
+        vocab = Vocab()
+        target = MovieFeatures(sample_movie_1, vocab)
+        pool = CandidatePool.from_movies([sample_movie_2, sample_movie_3], vocab)
+
+        assert (target.genre_count, target.keyword_count, target.company_count) == (
+            len(sample_movie_1.genre_set),
+            len(sample_movie_1.keyword_set),
+            len(sample_movie_1.production_company_set),
+        )
+        assert pool.genre_counts == [len(movie.genre_set) for movie in pool.movies]
+        assert pool.keyword_counts == [len(movie.keyword_set) for movie in pool.movies]
+        assert pool.company_counts == [len(movie.production_company_set) for movie in pool.movies]
+
+    def test_bitset_jaccard_matches_set_helpers(self, engine, sample_movie_1, sample_movie_2, sample_movie_3):
+        """Test that bitset Jaccard equals the set-based helpers exactly for every set-valued factor."""
+        movies = [sample_movie_1, sample_movie_2, sample_movie_3]
+        vocab = Vocab()
+        features = [MovieFeatures(movie, vocab) for movie in movies]
+
+        for (movie_a, bits_a), (movie_b, bits_b) in itertools.product(zip(movies, features), repeat=2):
+            assert jaccard_bits(bits_a.genre_bits, bits_b.genre_bits) == engine._calculate_genre_similarity(
+                movie_a.genre_set, movie_b.genre_set
+            )
+            assert jaccard_bits(bits_a.keyword_bits, bits_b.keyword_bits) == engine._calculate_keyword_similarity(
+                movie_a.keyword_set, movie_b.keyword_set
+            )
+            assert jaccard_bits(
+                bits_a.company_bits, bits_b.company_bits
+            ) == engine._calculate_production_company_similarity(
+                movie_a.production_company_set, movie_b.production_company_set
+            )
+
+    def test_top_n_batch_matches_pairwise_score(self, engine, sample_movie_1, sample_movie_2, sample_movie_3):
+        """Test that ranking every pool row gives the pairwise similarity score of each candidate."""
+        vocab = Vocab()
+        target = MovieFeatures(sample_movie_1, vocab)
+        pool = CandidatePool.from_movies([sample_movie_2, sample_movie_3], vocab)
+
+        rows = top_n_batch(target, pool, engine.similarity_weights, len(pool))
+
+        assert pool.ids == [2, 3]
+        assert sorted(idx for _, idx in rows) == [0, 1]
+        for score, idx in rows:
+            expected, _ = engine.calculate_similarity_score(sample_movie_1, pool.movies[idx])
+            assert score == expected
+
+    def test_top_n_batch_matches_full_scoring(self, engine, sample_movie_1, sample_movie_2, sample_movie_3):
+        """Test that pruned top-N selection returns the same rows as scoring every candidate."""
+        candidates = [sample_movie_2, sample_movie_3] + [
+            sample_movie_2.model_copy(update={"id": 10 + i}) for i in range(5)
+        ] + [sample_movie_3.model_copy(update={"id": 20})]
+        vocab = Vocab()
+        target = MovieFeatures(sample_movie_1, vocab)
+        pool = CandidatePool.from_movies(candidates, vocab)
+
+        scores = [engine.calculate_similarity_score(sample_movie_1, movie)[0] for movie in pool.movies]
+        expected = sorted(((score, idx) for idx, score in enumerate(scores)), key=lambda row: (-row[0], row[1]))
+
+        for top_n in (1, 2, 3, len(pool), len(pool) + 1):
+            assert top_n_batch(target, pool, engine.similarity_weights, top_n) == expected[:top_n]
+
+    def test_calculate_similarity_and_rank_returns_top_n_in_score_order(
+        self, engine, sample_movie_1, sample_movie_2, sample_movie_3
+    ):
+        """Test that ranking keeps the N best candidates, highest score first, ties in input order."""
+        tied_copy = sample_movie_3.model_copy(update={"id": 4})
+        candidates = [sample_movie_2, sample_movie_3, tied_copy]
+
+        results = engine._calculate_similarity_and_rank(sample_movie_1, candidates, top_n=2)
+
+        assert [result["similar_movie"].id for result in results] == [3, 4]
+        assert results[0]["similarity_score"] >= results[1]["similarity_score"]
+
+    def test_calculate_similarity_and_rank_builds_reasons_only_for_winners(
+        self, engine, sample_movie_1, sample_movie_2, sample_movie_3
+    ):
+        """Test that metrics and reasons are only built for the returned top N candidates."""
+        candidates = [sample_movie_2, sample_movie_3] + [
+            sample_movie_2.model_copy(update={"id": 10 + i}) for i in range(4)
+        ]
+
+        with patch.object(
+            engine, "calculate_similarity_score", wraps=engine.calculate_similarity_score
+        ) as pairwise:
+            results = engine._calculate_similarity_and_rank(sample_movie_1, candidates, top_n=2)
+
+        assert len(results) == 2
+        assert pairwise.call_count == 2
+        assert all(isinstance(result["similarity_reason"], str) for result in results)
+
     def test_similarity_reason_generation_same_franchise(self, engine, sample_movie_1, sample_movie_3):
         """Test similarity reason for same franchise movies."""
         score, metrics = engine.calculate_similarity_score(sample_movie_1, sample_movie_3)
@@ -420,6 +525,50 @@ class TestMovieRecommendationEngine:
         mock_tmdb_client.get_similar_movies.assert_called_once()
         mock_tmdb_client.get_movie_recommendations.assert_called_once()
 
+    def test_fetch_tmdb_api_candidates_requests_endpoints_concurrently(
+        self, engine, mock_tmdb_client, sample_movie_1
+    ):
+        """Test that both endpoints are in flight together and similar movies stay first."""
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def respond(movie_id):
+            def side_effect(target_id, page=1):
+                both_in_flight.wait()
+                return {"results": [{"id": movie_id, "title": f"Movie {movie_id}", "vote_count": 1000}]}
+            return side_effect
+
+        mock_tmdb_client.get_similar_movies.side_effect = respond(100)
+        mock_tmdb_client.get_movie_recommendations.side_effect = respond(101)
+
+        with patch("src.services.movie_recommendation_engine.get_worker_count", return_value=4):
+            candidates = engine._fetch_tmdb_api_candidates(sample_movie_1)
+
+        assert [movie["id"] for movie in candidates] == [100, 101]
+        assert engine.api_calls_made == 2
+
+    def test_get_candidates_from_tmdb_api_dedupes_and_excludes_target(
+        self, engine, mock_tmdb_client, sample_movie_1
+    ):
+        """Test that duplicates and the target movie are dropped in a single pass."""
+        movie_data = {
+            "id": 100,
+            "title": "Similar Movie 1",
+            "vote_count": 1000,
+            "release_date": "2000-01-01",
+            "vote_average": 7.5,
+            "popularity": 50.0,
+            "overview": "Overview",
+            "genre_ids": [28, 878],
+        }
+        target_data = dict(movie_data, id=sample_movie_1.id, title=sample_movie_1.title)
+
+        mock_tmdb_client.get_similar_movies.return_value = {"results": [movie_data, target_data]}
+        mock_tmdb_client.get_movie_recommendations.return_value = {"results": [movie_data]}
+
+        candidates = engine._get_candidates_from_tmdb_api(sample_movie_1)
+
+        assert [movie.id for movie in candidates] == [100]
+
     def test_get_candidates_same_year(self, engine, mock_tmdb_client, sample_movie_1):
         """Test getting candidates from same year."""
         # Mock API response
@@ -503,3 +652,70 @@ class TestMovieRecommendationEngine:
         assert "original_movie" in results[0]
         assert "similar_movies" in results[0]
         assert results[0]["original_movie"].id == sample_movie_1.id
+
+    def test_find_similar_movies_for_each_fetches_pools_concurrently(
+        self, engine, mock_tmdb_client, sample_movie_1, sample_movie_2, sample_movie_3
+    ):
+        """Test that candidate pools are fetched for every target and results keep target order."""
+        def similar_side_effect(movie_id, page=1):
+            if movie_id == sample_movie_2.id:
+                raise RuntimeError("boom")
+            return {"results": [{"id": 100 + movie_id, "title": f"Candidate {movie_id}", "vote_count": 1000}]}
+
+        mock_tmdb_client.get_similar_movies.side_effect = similar_side_effect
+        mock_tmdb_client.get_movie_recommendations.side_effect = RuntimeError("boom")
+        mock_tmdb_client.get_movie_details.return_value = None
+
+        with patch("src.services.movie_recommendation_engine.get_worker_count", return_value=4), \
+             patch(
+                 "src.services.movie_recommendation_engine.parallel_map",
+                 wraps=parallel_map,
+             ) as pool_map:
+            results = engine.find_similar_movies_for_each(
+                top_movies=[sample_movie_1, sample_movie_2, sample_movie_3],
+                similar_per_movie=1,
+                strategy="tmdb_api",
+            )
+
+        assert pool_map.call_args_list[0].args[1] == [sample_movie_1, sample_movie_2, sample_movie_3]
+        assert [entry["original_movie"].id for entry in results] == [sample_movie_1.id, sample_movie_3.id]
+        assert [entry["similar_movies"][0]["similar_movie"].id for entry in results] == [101, 103]
+        # 2 successful similar requests + 2 enrichment requests
+        assert engine.api_calls_made == 4
+
+    def test_enrich_candidates_skips_credits_without_director_signal(self, engine, mock_tmdb_client, sample_movie_2):
+        """Test that candidate credits are not fetched when the target has no director."""
+        target = sample_movie_2.model_copy(update={"director": None})
+        candidate = Movie(id=100, title="Candidate")
+        mock_tmdb_client.get_movie_details.return_value = {
+            "id": 100,
+            "title": "Candidate",
+            "genres": [{"id": 28, "name": "Action"}],
+        }
+        mock_tmdb_client.get_movie_keywords.return_value = {
+            "keywords": [{"id": 1, "name": "artificial intelligence"}]
+        }
+
+        needs = engine._get_enrich_needs(target)
+        enriched = engine._enrich_candidates_if_needed([candidate], needs)
+
+        assert needs.need_director is False
+        assert enriched[0].genre_names == ["Action"]
+        mock_tmdb_client.get_movie_credits.assert_not_called()
+
+    def test_enrich_candidates_reuses_candidates_shared_between_targets(self, engine, mock_tmdb_client):
+        """Test that a candidate shared by several targets is only fetched once per run."""
+        mock_tmdb_client.get_movie_details.return_value = {
+            "id": 100,
+            "title": "Candidate",
+            "genres": [{"id": 28, "name": "Action"}],
+            "keywords": {"keywords": [{"id": 1, "name": "heist"}]},
+            "credits": {"crew": [{"job": "Director", "name": "Test Director"}]},
+        }
+
+        first = engine._enrich_candidates_if_needed([Movie(id=100, title="Candidate")])
+        second = engine._enrich_candidates_if_needed([Movie(id=100, title="Candidate")])
+
+        mock_tmdb_client.get_movie_details.assert_called_once()
+        assert second[0] is first[0]
+        assert second[0].director == "Test Director"
@@ -7,29 +7,30 @@ Tests the MovieService class which handles:
 - Preparing movie data for export
 """
 
-from unittest.mock import MagicMock, patch
+import copy
+from unittest.mock import patch
 
 import pytest
 
-from src.models.Movies import Movie
+from src.models.Movies import Movie, normalize_title_for_sorting
 from src.services.movie_service import MovieService
+from tests.conftest import (
+    _KEYWORDS_BY_ID,
+    _MOVIE_DETAILS_BY_ID,
+    _get_keywords_by_id,
+    _get_movie_details_by_id,
+    _is_sorted,
+)
 
 
 class TestMovieService:
     """Test suite for MovieService functionality."""
 
     @pytest.fixture
-    def mock_tmdb_client(self):
-        """Create a mock TMDB client."""
-        client = MagicMock()
-        return client
-
-    @pytest.fixture
-    def movie_service(self, mock_tmdb_client, mock_env_vars):
+    def movie_service(self, mock_tmdb_client, mock_env_vars, monkeypatch):
         """Create a MovieService instance with mocked dependencies."""
-        with patch("src.services.movie_service.TMDBClient", return_value=mock_tmdb_client):
-            service = MovieService(tmdb_client=mock_tmdb_client)
-            return service
+        monkeypatch.setattr("src.services.movie_service.TMDBClient", lambda *args, **kwargs: mock_tmdb_client)
+        return MovieService(tmdb_client=mock_tmdb_client)
 
     def test_sort_movies_by_votes(self, movie_service, sample_movies):
         """Test sorting movies by vote count."""
@@ -62,6 +63,35 @@ class TestMovieService:
         assert sorted_movies[1].title == "Inception"
         assert sorted_movies[2].title == "The Matrix"
 
+    def test_sort_movies_by_name_reuses_normalized_titles(self, movie_service, mutable_sample_movies):
+        """Test that sorting normalizes each title once and later lookups hit the cache."""
+        with patch(
+            "src.models.Movies.normalize_title_for_sorting", wraps=normalize_title_for_sorting
+        ) as normalize:
+            sorted_movies = movie_service.sort_movies_by_name(mutable_sample_movies, ignore_articles=True)
+            keys = [movie.sort_key(ignore_articles=True) for movie in sorted_movies]
+
+        assert normalize.call_count == len(mutable_sample_movies)
+        assert _is_sorted(keys)
+
+    @pytest.mark.parametrize(
+        "title, expected",
+        [
+            ("The Matrix", "Matrix"),
+            ("A Beautiful Mind", "Beautiful Mind"),
+            ("An American Tail", "American Tail"),
+            ("The A-Team", "A-Team"),
+            ("  Of Mice and Men ", "Mice and Men"),
+            ("Inception", "Inception"),
+            ("Theory of Everything", "Theory of Everything"),
+            ("The", "The"),
+        ],
+    )
+    def test_normalize_title_for_sorting_removes_leading_articles(self, title, expected):
+        """Test article removal on titles directly, without building Movie models."""
+        assert normalize_title_for_sorting(title, ignore_articles=True) == expected
+        assert normalize_title_for_sorting(title, ignore_articles=False) == title.strip()
+
     def test_get_top_movies_by_year(
         self, movie_service, mock_tmdb_client, mock_tmdb_api_response, mock_movie_details_response, mock_keywords_response
     ):
@@ -79,33 +109,118 @@ class TestMovieService:
         assert movies[0].title == "The Matrix"
         mock_tmdb_client.get_movies_by_year.assert_called()
 
-    def test_prepare_movies_for_export_votes(self, movie_service, sample_movies):
-        """Test preparing movies for export with votes sort."""
-        export_data = movie_service.prepare_movies_for_export(sample_movies, sort_method="votes")
-
-        assert len(export_data) == 3
-        assert all(entry["sort_method"] == "votes" for entry in export_data)
-        assert all(isinstance(entry["movie"], Movie) for entry in export_data)
-        # Should be sorted by votes (highest first)
-        assert export_data[0]["movie"].id == 2  # Inception
-
-    def test_prepare_movies_for_export_name(self, movie_service, sample_movies):
-        """Test preparing movies for export with name sort."""
-        export_data = movie_service.prepare_movies_for_export(sample_movies, sort_method="name")
+    def test_get_top_movies_by_year_fetches_only_needed_pages(self, movie_service, mock_tmdb_client):
+        """Test that only the pages holding the top N vote-sorted results are fetched."""
+        def page_side_effect(**kwargs):
+            page = kwargs["page"]
+            return {
+                "page": page,
+                "total_pages": 10,
+                "results": [
+                    {"id": page * 100 + i, "title": f"Movie {page}-{i}", "vote_count": 1000 - page * 10 - i}
+                    for i in range(2)
+                ],
+            }
+
+        mock_tmdb_client.get_movies_by_year.side_effect = page_side_effect
+        mock_tmdb_client.get_movie_details.return_value = None
+
+        movies = movie_service.get_top_movies_by_year(year=1999, top_n=3)
+
+        requested_pages = sorted(call.kwargs["page"] for call in mock_tmdb_client.get_movies_by_year.call_args_list)
+        assert requested_pages == [1, 2]
+        assert [movie.id for movie in movies] == [100, 101, 200]
+
+    @pytest.mark.parametrize(
+        "second_result",
+        [{"id": 11}, {"id": 10, "title": "Movie 10", "vote_count": 900}],
+        ids=["invalid", "duplicate"],
+    )
+    def test_get_top_movies_by_year_fetches_more_pages_when_results_are_dropped(
+        self, movie_service, mock_tmdb_client, second_result
+    ):
+        """Test that invalid or duplicate results on the first page do not cut the top N short."""
+        def page_side_effect(**kwargs):
+            page = kwargs["page"]
+            if page == 1:
+                results = [{"id": 10, "title": "Movie 10", "vote_count": 1000}, second_result]
+            else:
+                results = [{"id": page * 10 + i, "title": f"Movie {page}-{i}", "vote_count": 500 - page} for i in range(2)]
+            return {"page": page, "total_pages": 5, "results": results}
+
+        mock_tmdb_client.get_movies_by_year.side_effect = page_side_effect
+        mock_tmdb_client.get_movie_details.return_value = None
 
-        assert len(export_data) == 3
-        assert all(entry["sort_method"] == "name" for entry in export_data)
-        assert all(isinstance(entry["movie"], Movie) for entry in export_data)
+        movies = movie_service.get_top_movies_by_year(year=1999, top_n=2)
 
-    def test_prepare_movies_for_export_name_no_articles(self, movie_service, sample_movies):
-        """Test preparing movies for export with name_no_articles sort."""
-        export_data = movie_service.prepare_movies_for_export(
-            sample_movies, sort_method="name_no_articles"
-        )
+        requested_pages = [call.kwargs["page"] for call in mock_tmdb_client.get_movies_by_year.call_args_list]
+        assert requested_pages == [1, 2]
+        assert [movie.id for movie in movies] == [10, 20]
+
+    def test_enrich_movies_with_details_preserves_order(self, movie_service, mock_tmdb_client, sample_movies):
+        """Test that concurrent enrichment keeps input order and falls back per movie."""
+        def details_side_effect(movie_id, append=()):
+            if movie_id == 2:
+                raise RuntimeError("boom")
+            return {"id": movie_id, "title": f"Detailed {movie_id}"}
+
+        mock_tmdb_client.get_movie_details.side_effect = details_side_effect
+        mock_tmdb_client.get_movie_keywords.return_value = None
+        mock_tmdb_client.get_movie_credits.return_value = None
+
+        enriched = movie_service._enrich_movies_with_details(sample_movies)
+
+        assert [movie.id for movie in enriched] == [movie.id for movie in sample_movies]
+        assert enriched[1] is sample_movies[1]
+        assert enriched[0].title == f"Detailed {sample_movies[0].id}"
+
+    def test_enrich_movie_uses_appended_keywords_and_credits(self, movie_service, mock_tmdb_client, sample_movies):
+        """Test that one details request with appended sections is enough to enrich a movie."""
+        mock_tmdb_client.get_movie_details.return_value = {
+            "id": 1,
+            "title": "The Matrix",
+            "keywords": {"keywords": [{"id": 100, "name": "artificial intelligence"}]},
+            "credits": {"crew": [{"job": "Director", "name": "Lana Wachowski"}]},
+        }
+
+        enriched = movie_service._enrich_movie(sample_movies[0])
+
+        mock_tmdb_client.get_movie_details.assert_called_once_with(1, append=("keywords", "credits"))
+        mock_tmdb_client.get_movie_keywords.assert_not_called()
+        mock_tmdb_client.get_movie_credits.assert_not_called()
+        assert enriched.keyword_names == ["artificial intelligence"]
+        assert enriched.director == "Lana Wachowski"
+
+    def test_enrich_movie_leaves_shared_mock_payloads_untouched(self, movie_service, mock_tmdb_client, sample_movies):
+        """Test that enrichment only adds top-level keys, so shallow copies of mock payloads suffice."""
+        details_before = copy.deepcopy(_MOVIE_DETAILS_BY_ID)
+        keywords_before = copy.deepcopy(_KEYWORDS_BY_ID)
+        mock_tmdb_client.get_movie_details.side_effect = lambda movie_id, **kwargs: _get_movie_details_by_id(movie_id)
+        mock_tmdb_client.get_movie_keywords.side_effect = _get_keywords_by_id
+        mock_tmdb_client.get_movie_credits.return_value = None
+
+        enriched = movie_service._enrich_movies_with_details(sample_movies)
+
+        assert enriched[0].keyword_names == ["artificial intelligence", "virtual reality", "hacker"]
+        assert _MOVIE_DETAILS_BY_ID == details_before
+        assert _KEYWORDS_BY_ID == keywords_before
+
+    @pytest.mark.parametrize(
+        "sort_method, expected_first_id",
+        [
+            ("votes", 2),  # Inception has the most votes
+            ("name", 3),  # "A Beautiful Mind"
+            ("name_no_articles", 3),  # "Beautiful Mind"
+        ],
+    )
+    def test_prepare_movies_for_export(self, movie_service, sample_movies, sort_method, expected_first_id):
+        """Test preparing movies for export with each sort method."""
+        export_data = movie_service.prepare_movies_for_export(sample_movies, sort_method=sort_method)
 
         assert len(export_data) == 3
-        assert all(entry["sort_method"] == "name_no_articles" for entry in export_data)
+        assert all(entry["sort_method"] == sort_method for entry in export_data)
         assert all(isinstance(entry["movie"], Movie) for entry in export_data)
+        assert export_data[0]["movie"].id == expected_first_id
 
     def test_prepare_movies_for_export_invalid_method(self, movie_service, sample_movies):
         """Test preparing movies with invalid sort method."""
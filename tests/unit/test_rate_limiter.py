@@ -0,0 +1,45 @@
+"""
+Unit tests for the TMDB token bucket rate limiter.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.api.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test suite for RateLimiter."""
+
+    def test_allows_burst_up_to_capacity_without_waiting(self):
+        """Test that a full bucket serves max_requests calls immediately."""
+        limiter = RateLimiter(max_requests=5, period=10)
+
+        with patch("src.api.rate_limiter.time.sleep") as sleep:
+            for _ in range(5):
+                limiter.acquire()
+
+        sleep.assert_not_called()
+
+    def test_waits_for_refill_when_bucket_is_empty(self):
+        """Test that an empty bucket waits for one token's worth of time."""
+        clock = [100.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch("src.api.rate_limiter.time.monotonic", side_effect=lambda: clock[0]), \
+             patch("src.api.rate_limiter.time.sleep", side_effect=fake_sleep) as sleep:
+            limiter = RateLimiter(max_requests=4, period=2)
+            for _ in range(5):
+                limiter.acquire()
+
+        # 4 requests per 2 seconds -> one token every 0.5 seconds
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] == pytest.approx(0.5)
+
+    def test_rejects_non_positive_budget(self):
+        """Test that invalid budgets are rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(max_requests=0, period=10)
@@ -0,0 +1,75 @@
+"""
+Unit tests for the persistent TMDB response cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.api.TMDB import TMDBClient
+from src.utils.tmdb_cache import TMDBCache
+
+
+class TestTMDBCache:
+    """Test suite for TMDBCache and its use by TMDBClient."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache in a temporary directory."""
+        cache = TMDBCache(tmp_path / "tmdb_cache", ttl=60)
+        yield cache
+        cache.close()
+
+    def test_set_and_get_round_trip(self, cache):
+        """Test that stored responses are returned as fresh copies."""
+        cache.set("en-US:movie/1", {"id": 1, "title": "The Matrix"})
+
+        first = cache.get("en-US:movie/1")
+        first["title"] = "Mutated"
+
+        assert cache.get("en-US:movie/1") == {"id": 1, "title": "The Matrix"}
+        assert cache.get("en-US:movie/2") is None
+
+    def test_expired_entries_are_misses(self, cache):
+        """Test that entries older than the TTL are ignored."""
+        with patch("src.utils.tmdb_cache.time.time", return_value=1000.0):
+            cache.set("en-US:movie/1", {"id": 1})
+
+        with patch("src.utils.tmdb_cache.time.time", return_value=1061.0):
+            assert cache.get("en-US:movie/1") is None
+
+    def test_second_cache_on_same_directory_runs_without_cache(self, cache, tmp_path):
+        """Test that only one holder uses a cache directory and others skip it instead of racing."""
+        cache.set("en-US:movie/1", {"id": 1})
+        other = TMDBCache(tmp_path / "tmdb_cache", ttl=60)
+        try:
+            other.set("en-US:movie/2", {"id": 2})
+            assert other.get("en-US:movie/1") is None
+        finally:
+            other.close()
+
+        assert cache.get("en-US:movie/1") == {"id": 1}
+        assert cache.get("en-US:movie/2") is None
+
+    def test_close_releases_cache_directory(self, tmp_path):
+        """Test that closing a cache lets the next holder read what it stored."""
+        first = TMDBCache(tmp_path / "tmdb_cache", ttl=60)
+        first.set("en-US:movie/1", {"id": 1})
+        first.close()
+
+        second = TMDBCache(tmp_path / "tmdb_cache", ttl=60)
+        try:
+            assert second.get("en-US:movie/1") == {"id": 1}
+        finally:
+            second.close()
+
+    def test_client_serves_details_from_cache(self, cache, mock_env_vars):
+        """Test that TMDBClient only hits the network once for repeated detail requests."""
+        client = TMDBClient(use_cache=False)
+        client.cache = cache
+
+        with patch.object(client, "_make_request", return_value={"id": 1, "title": "The Matrix"}) as request:
+            assert client.get_movie_details(1)["title"] == "The Matrix"
+            assert client.get_movie_details(1)["title"] == "The Matrix"
+
+        request.assert_called_once_with("movie/1", None)
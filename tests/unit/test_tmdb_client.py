@@ -0,0 +1,40 @@
+"""
+Unit tests for TMDBClient response handling.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from src.api.TMDB import TMDBClient
+
+
+def _response(body: bytes) -> requests.Response:
+    """Build an HTTP 200 response with the given body."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+class TestTMDBClientDecoding:
+    """Test suite for JSON decoding of TMDB responses."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_decode_json_with_and_without_orjson(self, use_orjson):
+        """Test that responses decode the same whether or not orjson is installed."""
+        body = '{"id": 603, "title": "The Matrix", "genres": [{"id": 28, "name": "Action"}], "tagline": "Réalité"}'
+        expected = {"id": 603, "title": "The Matrix", "genres": [{"id": 28, "name": "Action"}], "tagline": "Réalité"}
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+            assert TMDBClient._decode_json(_response(body.encode("utf-8"))) == expected
+        else:
+            with patch("src.api.TMDB.orjson", None):
+                assert TMDBClient._decode_json(_response(body.encode("utf-8"))) == expected
+
+    def test_decode_json_invalid_body_raises_requests_error(self):
+        """Test that malformed bodies raise requests' JSON error so the request is retried."""
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            TMDBClient._decode_json(_response(b"<html>Bad Gateway</html>"))